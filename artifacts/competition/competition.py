@@ -19,7 +19,9 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"name": "CompetitionApp", "structs": {"Competition": {"name": "Competition", "elements": [["name", "string"], ["description", "string"], ["start_time", "uint64"], ["end_time", "uint64"], ["status", "uint64"], ["total_prize_pool", "uint64"], ["max_participants", "uint64"], ["entry_fee", "uint64"]]}, "Participant": {"name": "Participant", "elements": [["startup_owner", "address"], ["joined_at", "uint64"], ["score", "uint64"], ["rank", "uint64"], ["reward_claimed", "bool"]]}, "Results": {"name": "Results", "elements": [["first_place_sid", "uint64"], ["second_place_sid", "uint64"], ["third_place_sid", "uint64"], ["rewards_distributed", "bool"]]}}, "methods": [{"name": "set_owner", "args": [{"type": "address", "name": "new_owner"}], "returns": {"type": "void"}}, {"name": "create_competition", "args": [{"type": "string", "name": "name"}, {"type": "string", "name": "description"}, {"type": "uint64", "name": "start_time"}, {"type": "uint64", "name": "end_time"}, {"type": "pay", "name": "prize_pool_payment"}, {"type": "uint64", "name": "max_participants"}, {"type": "uint64", "name": "entry_fee"}], "returns": {"type": "uint64"}}, {"name": "join_competition", "args": [{"type": "uint64", "name": "competition_id"}, {"type": "uint64", "name": "startup_id"}, {"type": "pay", "name": "entry_fee_payment"}], "returns": {"type": "bool"}}, {"name": "update_status", "args": [{"type": "uint64", "name": "competition_id"}, {"type": "uint64", "name": "new_status"}], "returns": {"type": "bool"}}, {"name": "update_participant_score", "args": [{"type": "uint64", "name": "competition_id"}, {"type": "uint64", "name": "startup_id"}, {"type": "uint64", "name": "new_score"}], "returns": {"type": "bool"}}, {"name": "finalize_competition", "args": [{"type": "uint64", "name": "competition_id"}, {"type": "uint64", "name": "winner_sid"}, {"type": "uint64", "name": "second_sid"}, {"type": "uint64", "name": "third_sid"}], "returns": {"type": "bool"}}, {"name": "claim_reward", "args": [{"type": "uint64", "name": "competition_id"}, {"type": "uint64", "name": "startup_id"}], "returns": {"type": "uint64"}}, {"name": "get_competition", "args": [{"type": "uint64", "name": "competition_id"}], "returns": {"type": "(string,string,uint64,uint64,uint64,uint64,uint64,uint64)"}, "readonly": true}, {"name": "get_participant", "args": [{"type": "uint64", "name": "competition_id"}, {"type": "uint64", "name": "startup_id"}], "returns": {"type": "(address,uint64,uint64,uint64,bool)"}, "readonly": true}], "state": {"global": {"num_uints": 2, "num_byte_slices": 1}, "local": {"num_uints": 0, "num_byte_slices": 0}}, "bare_actions": {"create": "CALL"}}"""
+from smart_contracts.scripts.struct_codecs import struct_codec
+
+_APP_SPEC_JSON = r"""{"name": "CompetitionApp", "structs": {"Competition": {"name": "Competition", "elements": [["name", "string"], ["description", "string"], ["start_time", "uint64"], ["end_time", "uint64"], ["status", "uint64"], ["total_prize_pool", "uint64"], ["max_participants", "uint64"], ["entry_fee", "uint64"]]}, "Participant": {"name": "Participant", "elements": [["startup_owner", "address"], ["joined_at", "uint64"], ["score", "uint64"], ["rank", "uint64"], ["reward_claimed", "bool"]]}, "Results": {"name": "Results", "elements": [["first_place_sid", "uint64"], ["second_place_sid", "uint64"], ["third_place_sid", "uint64"], ["rewards_distributed", "bool"]]}}, "methods": [{"name": "set_owner", "args": [{"type": "address", "name": "new_owner"}], "returns": {"type": "void"}}, {"name": "create_competition", "args": [{"type": "string", "name": "name"}, {"type": "string", "name": "description"}, {"type": "uint64", "name": "start_time"}, {"type": "uint64", "name": "end_time"}, {"type": "pay", "name": "prize_pool_payment"}, {"type": "uint64", "name": "max_participants"}, {"type": "uint64", "name": "entry_fee"}], "returns": {"type": "uint64"}}, {"name": "join_competition", "args": [{"type": "uint64", "name": "competition_id"}, {"type": "uint64", "name": "startup_id"}, {"type": "pay", "name": "entry_fee_payment"}], "returns": {"type": "bool"}}, {"name": "update_status", "args": [{"type": "uint64", "name": "competition_id"}, {"type": "uint64", "name": "new_status"}], "returns": {"type": "bool"}}, {"name": "update_participant_score", "args": [{"type": "uint64", "name": "competition_id"}, {"type": "uint64", "name": "startup_id"}, {"type": "uint64", "name": "new_score"}], "returns": {"type": "bool"}}, {"name": "finalize_competition", "args": [{"type": "uint64", "name": "competition_id"}, {"type": "uint64", "name": "winner_sid"}, {"type": "uint64", "name": "second_sid"}, {"type": "uint64", "name": "third_sid"}], "returns": {"type": "bool"}}, {"name": "claim_reward", "args": [{"type": "uint64", "name": "competition_id"}, {"type": "uint64", "name": "startup_id"}], "returns": {"type": "uint64"}}, {"name": "get_competition", "args": [{"type": "uint64", "name": "competition_id"}], "returns": {"type": "(string,string,uint64,uint64,uint64,uint64,uint64,uint64)"}, "readonly": true}, {"name": "get_participant", "args": [{"type": "uint64", "name": "competition_id"}, {"type": "uint64", "name": "startup_id"}], "returns": {"type": "(address,uint64,uint64,uint64,bool)"}, "readonly": true}, {"name": "get_effective_status_batch", "args": [{"type": "uint64[]", "name": "competition_ids"}], "returns": {"type": "uint64[]"}, "readonly": true}, {"name": "distribute_rewards", "args": [{"type": "uint64", "name": "competition_id"}], "returns": {"type": "uint64"}}, {"name": "update_startup_score", "args": [{"type": "uint64", "name": "startup_id"}, {"type": "uint64", "name": "new_score"}], "returns": {"type": "uint64"}}, {"name": "get_startup_entries", "args": [{"type": "uint64", "name": "startup_id"}], "returns": {"type": "uint64[]"}, "readonly": true}, {"name": "get_competition_leaderboard", "args": [{"type": "uint64", "name": "competition_id"}, {"type": "uint64", "name": "offset"}, {"type": "uint64", "name": "n"}], "returns": {"type": "(uint64,uint64,uint64)[]"}, "readonly": true}], "state": {"global": {"num_uints": 2, "num_byte_slices": 1}, "local": {"num_uints": 0, "num_byte_slices": 0}}, "bare_actions": {"create": "CALL"}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -86,6 +88,12 @@ class Results:
     third_place_sid: int
     rewards_distributed: bool
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class LeaderboardEntry:
+    startup_id: int
+    score: int
+    rank: int
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class SetOwnerArgs:
     new_owner: str
@@ -117,6 +125,11 @@ class UpdateParticipantScoreArgs:
     startup_id: int
     new_score: int
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class UpdateStartupScoreArgs:
+    startup_id: int
+    new_score: int
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class FinalizeCompetitionArgs:
     competition_id: int
@@ -129,6 +142,10 @@ class ClaimRewardArgs:
     competition_id: int
     startup_id: int
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class DistributeRewardsArgs:
+    competition_id: int
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class GetCompetitionArgs:
     competition_id: int
@@ -138,6 +155,20 @@ class GetParticipantArgs:
     competition_id: int
     startup_id: int
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetCompetitionLeaderboardArgs:
+    competition_id: int
+    offset: int
+    n: int
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetStartupEntriesArgs:
+    startup_id: int
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetEffectiveStatusBatchArgs:
+    competition_ids: list[int]
+
 
 class CompetitionAppClient:
     """Client for interacting with CompetitionApp smart contract"""
@@ -247,6 +278,19 @@ class CompetitionAppClient:
             transaction_parameters=transaction_parameters,
         )
 
+    def update_startup_score(
+        self,
+        args: tuple[int, int] | UpdateStartupScoreArgs,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[int]:
+        method_args = _parse_abi_args(args)
+        return self.app_client.call(
+            "update_startup_score",
+            args=method_args,
+            transaction_parameters=transaction_parameters,
+        )
+
     def finalize_competition(
         self,
         args: tuple[int, int, int, int] | FinalizeCompetitionArgs,
@@ -273,6 +317,19 @@ class CompetitionAppClient:
             transaction_parameters=transaction_parameters,
         )
 
+    def distribute_rewards(
+        self,
+        args: tuple[int] | DistributeRewardsArgs,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[int]:
+        method_args = _parse_abi_args(args)
+        return self.app_client.call(
+            "distribute_rewards",
+            args=method_args,
+            transaction_parameters=transaction_parameters,
+        )
+
     def get_competition(
         self,
         args: tuple[int] | GetCompetitionArgs,
@@ -286,7 +343,9 @@ class CompetitionAppClient:
             transaction_parameters=transaction_parameters,
         )
         if isinstance(response.return_value, (list, tuple)):
-            response.return_value = Competition(*response.return_value)
+            response.return_value = struct_codec(
+                Competition, "(string,string,uint64,uint64,uint64,uint64,uint64,uint64)"
+            ).from_tuple(response.return_value)
         return response
 
     def get_participant(
@@ -302,6 +361,71 @@ class CompetitionAppClient:
             transaction_parameters=transaction_parameters,
         )
         if isinstance(response.return_value, (list, tuple)):
-            response.return_value = Participant(*response.return_value)
+            response.return_value = struct_codec(Participant, "(address,uint64,uint64,uint64,bool)").from_tuple(
+                response.return_value
+            )
+        return response
+
+    def get_competition_leaderboard(
+        self,
+        args: tuple[int, int, int] | GetCompetitionLeaderboardArgs,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[list[LeaderboardEntry]]:
+        method_args = _parse_abi_args(args)
+        response = self.app_client.call(
+            "get_competition_leaderboard",
+            args=method_args,
+            transaction_parameters=transaction_parameters,
+        )
+        if isinstance(response.return_value, (list, tuple)):
+            response.return_value = [
+                LeaderboardEntry(startup_id=sid, score=score, rank=rank)
+                for sid, score, rank in response.return_value
+            ]
         return response
 
+    def stream_competition_leaderboard(
+        self,
+        competition_id: int,
+        *,
+        page_size: int = 50,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> typing.Iterator[LeaderboardEntry]:
+        """Yields the sorted standings page by page, one simulate call per page."""
+        offset = 0
+        while True:
+            page = self.get_competition_leaderboard(
+                (competition_id, offset, page_size),
+                transaction_parameters=transaction_parameters,
+            ).return_value or []
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+    def get_startup_entries(
+        self,
+        args: tuple[int] | GetStartupEntriesArgs,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[list[int]]:
+        method_args = _parse_abi_args(args)
+        return self.app_client.call(
+            "get_startup_entries",
+            args=method_args,
+            transaction_parameters=transaction_parameters,
+        )
+
+    def get_effective_status_batch(
+        self,
+        args: tuple[list[int]] | GetEffectiveStatusBatchArgs,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[list[int]]:
+        method_args = _parse_abi_args(args)
+        return self.app_client.call(
+            "get_effective_status_batch",
+            args=method_args,
+            transaction_parameters=transaction_parameters,
+        )
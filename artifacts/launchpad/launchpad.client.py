@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"name": "LaunchpadApp", "structs": {}, "methods": [{"name": "setup", "args": [{"type": "address", "name": "owner"}, {"type": "uint64", "name": "token_id"}], "returns": {"type": "void"}}, {"name": "set_sale_parameters", "args": [{"type": "uint64", "name": "price"}, {"type": "uint64", "name": "start_time"}, {"type": "uint64", "name": "end_time"}], "returns": {"type": "bool"}}, {"name": "activate_sale", "args": [], "returns": {"type": "bool"}}, {"name": "opt_in_to_asset", "args": [], "returns": {"type": "bool"}}, {"name": "fund", "args": [{"type": "axfer", "name": "axfer"}], "returns": {"type": "bool"}}, {"name": "buy_tokens", "args": [{"type": "pay", "name": "payment"}], "returns": {"type": "uint64"}}, {"name": "claim_funds", "args": [], "returns": {"type": "bool"}}], "state": {"global": {"num_uints": 6, "num_byte_slices": 1}, "local": {"num_uints": 0, "num_byte_slices": 0}}, "bare_actions": {"create": "CALL"}}"""
+_APP_SPEC_JSON = r"""{"name": "LaunchpadApp", "structs": {"SaleState": {"name": "SaleState", "elements": [["price", "uint64"], ["sale_start_time", "uint64"], ["sale_end_time", "uint64"], ["tokens_remaining", "uint64"], ["total_raised_microalgos", "uint64"], ["is_sale_active", "bool"]]}}, "methods": [{"name": "setup", "args": [{"type": "address", "name": "owner"}, {"type": "uint64", "name": "token_id"}], "returns": {"type": "void"}}, {"name": "set_sale_parameters", "args": [{"type": "uint64", "name": "price"}, {"type": "uint64", "name": "start_time"}, {"type": "uint64", "name": "end_time"}], "returns": {"type": "bool"}}, {"name": "activate_sale", "args": [], "returns": {"type": "bool"}}, {"name": "opt_in_to_asset", "args": [], "returns": {"type": "bool"}}, {"name": "fund", "args": [{"type": "axfer", "name": "axfer"}], "returns": {"type": "bool"}}, {"name": "buy_tokens", "args": [{"type": "pay", "name": "payment"}], "returns": {"type": "uint64"}}, {"name": "claim_funds", "args": [], "returns": {"type": "bool"}}, {"name": "set_sale_mode", "args": [{"type": "uint64", "name": "mode"}], "returns": {"type": "bool"}}, {"name": "commit", "args": [{"type": "pay", "name": "payment"}], "returns": {"type": "uint64"}}, {"name": "settle_commitments", "args": [{"type": "address[]", "name": "buyers"}], "returns": {"type": "uint64"}}, {"name": "claim_settlement", "args": [], "returns": {"type": "uint64"}}, {"name": "set_price_curve", "args": [{"type": "uint64", "name": "start_price"}, {"type": "uint64", "name": "floor_price"}, {"type": "(uint64,uint64)[]", "name": "tiers"}], "returns": {"type": "bool"}}, {"name": "get_sale_state", "args": [], "returns": {"type": "(uint64,uint64,uint64,uint64,uint64,bool)"}, "readonly": true}, {"name": "set_allocation_limits", "args": [{"type": "uint64", "name": "min_tokens"}, {"type": "uint64", "name": "max_tokens"}], "returns": {"type": "bool"}}, {"name": "get_buyers", "args": [{"type": "uint64", "name": "offset"}, {"type": "uint64", "name": "n"}], "returns": {"type": "(address,uint64,uint64)[]"}, "readonly": true}], "state": {"global": {"num_uints": 14, "num_byte_slices": 2}, "local": {"num_uints": 0, "num_byte_slices": 0}}, "bare_actions": {"create": "CALL"}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -63,6 +63,23 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SaleState:
+    """Struct for SaleState"""
+    price: int
+    sale_start_time: int
+    sale_end_time: int
+    tokens_remaining: int
+    total_raised_microalgos: int
+    is_sale_active: bool
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class BuyerRecord:
+    """Per-buyer purchase record returned by get_buyers"""
+    buyer: str
+    tokens_bought: int
+    paid_microalgos: int
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class SetupArgs:
     """Dataclass for setup arguments"""
@@ -76,6 +93,24 @@ class SetSaleParametersArgs:
     start_time: int
     end_time: int
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetAllocationLimitsArgs:
+    """Dataclass for set_allocation_limits arguments"""
+    min_tokens: int
+    max_tokens: int
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetPriceCurveArgs:
+    """Dataclass for set_price_curve arguments"""
+    start_price: int
+    floor_price: int
+    tiers: list[tuple[int, int]]
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetSaleModeArgs:
+    """Dataclass for set_sale_mode arguments"""
+    mode: int
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class FundArgs:
     """Dataclass for fund arguments"""
@@ -86,6 +121,22 @@ class BuyTokensArgs:
     """Dataclass for buy_tokens arguments"""
     payment: algokit_utils.Transaction
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CommitArgs:
+    """Dataclass for commit arguments"""
+    payment: algokit_utils.Transaction
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SettleCommitmentsArgs:
+    """Dataclass for settle_commitments arguments"""
+    buyers: list[str]
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetBuyersArgs:
+    """Dataclass for get_buyers arguments"""
+    offset: int
+    n: int
+
 class LaunchpadAppClient:
     """Client for interacting with LaunchpadApp smart contract"""
 
@@ -155,6 +206,45 @@ class LaunchpadAppClient:
             transaction_parameters=transaction_parameters,
         )
 
+    def set_allocation_limits(
+        self,
+        args: tuple[int, int] | SetAllocationLimitsArgs,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[bool]:
+        method_args = _parse_abi_args(args)
+        return self.app_client.call(
+            "set_allocation_limits",
+            args=method_args,
+            transaction_parameters=transaction_parameters,
+        )
+
+    def set_price_curve(
+        self,
+        args: tuple[int, int, list[tuple[int, int]]] | SetPriceCurveArgs,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[bool]:
+        method_args = _parse_abi_args(args)
+        return self.app_client.call(
+            "set_price_curve",
+            args=method_args,
+            transaction_parameters=transaction_parameters,
+        )
+
+    def set_sale_mode(
+        self,
+        args: tuple[int] | SetSaleModeArgs,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[bool]:
+        method_args = _parse_abi_args(args)
+        return self.app_client.call(
+            "set_sale_mode",
+            args=method_args,
+            transaction_parameters=transaction_parameters,
+        )
+
     def activate_sale(
         self,
         *,
@@ -201,6 +291,42 @@ class LaunchpadAppClient:
             transaction_parameters=transaction_parameters,
         )
 
+    def commit(
+        self,
+        args: tuple[algokit_utils.Transaction] | CommitArgs,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[int]:
+        method_args = _parse_abi_args(args)
+        return self.app_client.call(
+            "commit",
+            args=method_args,
+            transaction_parameters=transaction_parameters,
+        )
+
+    def settle_commitments(
+        self,
+        args: tuple[list[str]] | SettleCommitmentsArgs,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[int]:
+        method_args = _parse_abi_args(args)
+        return self.app_client.call(
+            "settle_commitments",
+            args=method_args,
+            transaction_parameters=transaction_parameters,
+        )
+
+    def claim_settlement(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[int]:
+        return self.app_client.call(
+            "claim_settlement",
+            transaction_parameters=transaction_parameters,
+        )
+
     def claim_funds(
         self,
         *,
@@ -211,3 +337,36 @@ class LaunchpadAppClient:
             transaction_parameters=transaction_parameters,
         )
 
+    def get_sale_state(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[SaleState]:
+        response = self.app_client.call(
+            "get_sale_state",
+            transaction_parameters=transaction_parameters,
+        )
+        if isinstance(response.return_value, (list, tuple)):
+            response.return_value = SaleState(**dict(zip(
+                [field.name for field in dataclasses.fields(SaleState)], response.return_value
+            )))
+        return response
+
+    def get_buyers(
+        self,
+        args: tuple[int, int] | GetBuyersArgs,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[list[BuyerRecord]]:
+        method_args = _parse_abi_args(args)
+        response = self.app_client.call(
+            "get_buyers",
+            args=method_args,
+            transaction_parameters=transaction_parameters,
+        )
+        if isinstance(response.return_value, (list, tuple)):
+            response.return_value = [
+                BuyerRecord(buyer=buyer, tokens_bought=tokens_bought, paid_microalgos=paid_microalgos)
+                for buyer, tokens_bought, paid_microalgos in response.return_value
+            ]
+        return response
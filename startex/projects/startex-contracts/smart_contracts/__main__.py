@@ -1,32 +1,55 @@
+"""
+Build/deploy CLI: python -m smart_contracts [action] [contract_name] [options]
+
+Nothing heavy happens at import time. Contract folders are only scanned for the
+contracts an action needs, each folder's deploy_config is imported the first
+time its deploy function is used, and algokit_utils / .env are only loaded for
+actions that talk to a network. `--help` and `build <contract>` therefore start
+without importing algosdk; see _tooling/startup_bench.py.
+"""
+
+import argparse
 import dataclasses
+import functools
 import importlib
 import logging
+import os
 import subprocess
 import sys
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from shutil import rmtree
-
-from algokit_utils.config import config
-from dotenv import load_dotenv
+from shutil import copytree, rmtree
 
+from smart_contracts._tooling import beaker_build, build_cache, deploy, opt_matrix, teal_analysis, watch
 
-# Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
-# Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
-# Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
-config.configure(debug=True, trace_all=False)
-
-# Set up logging and load environment variables.
-logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s %(levelname)-10s: %(message)s"
-)
 logger = logging.getLogger(__name__)
-logger.info("Loading .env")
-load_dotenv()
 
 # Determine the root path based on this file's location.
 root_path = Path(__file__).parent
 
+ACTIONS = ("build", "deploy", "all", "watch", "build_matrix")
+
+
+def configure_logging() -> None:
+    logging.basicConfig(
+        level=logging.DEBUG, format="%(asctime)s %(levelname)-10s: %(message)s"
+    )
+
+
+def load_environment() -> None:
+    """Loads .env and enables algokit_utils debug tracing; only network actions need this."""
+    from algokit_utils.config import config
+    from dotenv import load_dotenv
+
+    # Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
+    # Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
+    # Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
+    config.configure(debug=True, trace_all=False)
+    logger.info("Loading .env")
+    load_dotenv()
+
+
 # ----------------------- Contract Configuration ----------------------- #
 
 
@@ -34,16 +57,33 @@ root_path = Path(__file__).parent
 class SmartContract:
     path: Path
     name: str
-    deploy: Callable[[], None] | None = None
+    # Contracts that must be deployed first (their app ids are read at deploy time).
+    depends_on: tuple[str, ...] = ()
+
+    @functools.cached_property
+    def deploy(self) -> Callable[[], None] | None:
+        """The folder's deploy_config.deploy, imported on first use."""
+        return import_deploy_if_exists(self.path.parent)
+
+
+# The competition app is created with the registry's app id.
+CONTRACT_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    "competition": ("startup_registry",),
+}
 
 
 def import_contract(folder: Path) -> Path:
-    """Imports the contract from a folder if it exists."""
+    """
+    The contract source of a folder: a puya contract.py, or a Beaker module
+    named after the folder (e.g. competition/competition.py).
+    """
     contract_path = folder / "contract.py"
     if contract_path.exists():
         return contract_path
-    else:
-        raise Exception(f"Contract not found in {folder}")
+    beaker_path = beaker_build.contract_module(folder)
+    if beaker_path is not None:
+        return beaker_path
+    raise Exception(f"Contract not found in {folder}")
 
 
 def import_deploy_if_exists(folder: Path) -> Callable[[], None] | None:
@@ -57,26 +97,40 @@ def import_deploy_if_exists(folder: Path) -> Callable[[], None] | None:
 
 
 def has_contract_file(directory: Path) -> bool:
-    """Checks whether the directory contains a contract.py file."""
-    return (directory / "contract.py").exists()
+    """Checks whether the directory contains a contract.py file or a Beaker contract module."""
+    return (directory / "contract.py").exists() or beaker_build.contract_module(directory) is not None
 
 
-# Use the current directory (root_path) as the base for contract folders and exclude
-# folders that start with '_' (internal helpers).
-contracts: list[SmartContract] = [
-    SmartContract(
-        path=import_contract(folder),
-        name=folder.name,
-        deploy=import_deploy_if_exists(folder),
-    )
-    for folder in root_path.iterdir()
-    if folder.is_dir() and has_contract_file(folder) and not folder.name.startswith("_")
-]
+def discover_contracts(contract_name: str | None = None) -> list[SmartContract]:
+    """
+    Contract folders under root_path, excluding folders that start with '_'
+    (internal helpers). With a contract name only that folder is looked at.
+    """
+    if contract_name is not None:
+        folders = [root_path / contract_name]
+    else:
+        folders = [
+            folder
+            for folder in sorted(root_path.iterdir())
+            if folder.is_dir() and has_contract_file(folder) and not folder.name.startswith("_")
+        ]
+    return [
+        SmartContract(
+            path=import_contract(folder),
+            name=folder.name,
+            depends_on=CONTRACT_DEPENDENCIES.get(folder.name, ()),
+        )
+        for folder in folders
+    ]
 
 # -------------------------- Build Logic -------------------------- #
 
 deployment_extension = "py"
 
+# Flags passed to `algokit compile python`; part of the build cache key.
+# --output-bytecode gives teal_analysis exact program sizes.
+COMPILE_FLAGS = ["--no-output-arc32", "--output-arc56", "--output-source-map", "--output-bytecode"]
+
 
 def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     """Constructs the output path for the generated client file."""
@@ -87,17 +141,44 @@ def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     )
 
 
-def build(output_dir: Path, contract_path: Path) -> Path:
+def contract_flags(artifact_path: Path, contract_name: str) -> list[str]:
+    """COMPILE_FLAGS plus the optimization level chosen for the contract by build_matrix, if any."""
+    level = opt_matrix.load_levels(artifact_path).get(contract_name)
+    return COMPILE_FLAGS if level is None else [*COMPILE_FLAGS, opt_matrix.level_flag(level)]
+
+
+def build(output_dir: Path, contract_path: Path, flags: list[str] = COMPILE_FLAGS) -> Path:
     """
     Builds the contract by exporting (compiling) its source and generating a client.
-    If the output directory already exists, it is cleared.
+    The build runs in a staging directory that replaces output_dir only once
+    compilation and client generation have both succeeded.
     """
-    output_dir = output_dir.resolve()
-    if output_dir.exists():
-        rmtree(output_dir)
-    output_dir.mkdir(exist_ok=True, parents=True)
-    logger.info(f"Exporting {contract_path} to {output_dir}")
+    final_dir = output_dir.resolve()
+    output_dir = build_cache.staging_dir(final_dir)
+    logger.info(f"Building app at {contract_path}")
+    logger.info(f"Exporting {contract_path} to {final_dir}")
 
+    try:
+        client_file = _compile_and_generate(output_dir, contract_path, flags)
+    except Exception:
+        rmtree(output_dir, ignore_errors=True)
+        raise
+    build_cache.replace_dir(output_dir, final_dir)
+
+    if client_file:
+        return final_dir / client_file
+    return final_dir
+
+
+def _compile_and_generate(output_dir: Path, contract_path: Path, flags: list[str]) -> str | None:
+    if contract_path.name == "contract.py":
+        _compile_puya(output_dir, contract_path, flags)
+    else:
+        beaker_build.export(output_dir, contract_path, flags)
+    return _generate_clients(output_dir)
+
+
+def _compile_puya(output_dir: Path, contract_path: Path, flags: list[str]) -> None:
     build_result = subprocess.run(
         [
             "algokit",
@@ -106,9 +187,7 @@ def build(output_dir: Path, contract_path: Path) -> Path:
             "python",
             str(contract_path.resolve()),
             f"--out-dir={output_dir}",
-            "--no-output-arc32",
-            "--output-arc56",
-            "--output-source-map",
+            *flags,
         ],
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
@@ -116,7 +195,10 @@ def build(output_dir: Path, contract_path: Path) -> Path:
     )
     if build_result.returncode:
         raise Exception(f"Could not build contract:\n{build_result.stdout}")
+    logger.debug(build_result.stdout)
 
+
+def _generate_clients(output_dir: Path) -> str | None:
     # Look for arc56.json files and generate the client based on them.
     app_spec_file_names: list[str] = [
         file.name for file in output_dir.glob("*.arc56.json")
@@ -130,7 +212,7 @@ def build(output_dir: Path, contract_path: Path) -> Path:
     else:
         for file_name in app_spec_file_names:
             client_file = file_name
-            print(file_name)
+            logger.info(f"Generating client from {file_name}")
             generate_result = subprocess.run(
                 [
                     "algokit",
@@ -153,60 +235,234 @@ def build(output_dir: Path, contract_path: Path) -> Path:
                     raise Exception(
                         f"Could not generate typed client:\n{generate_result.stdout}"
                     )
-    if client_file:
-        return output_dir / client_file
-    return output_dir
+    return client_file
+
+
+@dataclasses.dataclass
+class BuildResult:
+    name: str
+    output: Path | None = None
+    logs: list[str] = dataclasses.field(default_factory=list)
+    error: str | None = None
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self, records: list[str]) -> None:
+        super().__init__()
+        self.records = records
+        self.setFormatter(logging.Formatter("%(levelname)-10s: %(message)s"))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(self.format(record))
+
+
+def _build_worker(name: str, output_dir: Path, contract_path: Path, flags: list[str]) -> BuildResult:
+    """Runs build() in a pool worker, capturing its log lines and error instead of raising."""
+    result = BuildResult(name=name)
+    handler = _ListHandler(result.logs)
+    logger.addHandler(handler)
+    logger.propagate = False
+    try:
+        result.output = build(output_dir, contract_path, flags)
+    except Exception as e:
+        result.error = str(e)
+    finally:
+        logger.removeHandler(handler)
+        logger.propagate = True
+    return result
+
+
+def build_many(artifact_path: Path, to_build: list[SmartContract]) -> list[BuildResult]:
+    """
+    Builds contracts in parallel (one process per contract, bounded by CPU count).
+    Contracts whose build cache key is unchanged are skipped. Logs are collected
+    per contract and reported in input order once all builds finish; raises if
+    any contract failed. Finally the static TEAL analysis is refreshed.
+    """
+    manifest = build_cache.load_manifest(artifact_path)
+    search_roots = [root_path.parent, root_path]
+    flags = {contract.name: contract_flags(artifact_path, contract.name) for contract in to_build}
+    keys = {
+        contract.name: build_cache.cache_key(
+            contract.path, search_roots, [*flags[contract.name], deployment_extension]
+        )
+        for contract in to_build
+    }
+    stale = [
+        contract
+        for contract in to_build
+        if manifest.get(contract.name) != keys[contract.name]
+        or not (artifact_path / contract.name).exists()
+    ]
+
+    results_by_name: dict[str, BuildResult] = {
+        contract.name: BuildResult(
+            name=contract.name,
+            output=artifact_path / contract.name,
+            logs=["Up to date, skipping build"],
+        )
+        for contract in to_build
+        if contract not in stale
+    }
+    if stale:
+        max_workers = min(len(stale), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(
+                    _build_worker, contract.name, artifact_path / contract.name, contract.path, flags[contract.name]
+                )
+                for contract in stale
+            ]
+            for future in futures:
+                result = future.result()
+                results_by_name[result.name] = result
+                if not result.error:
+                    manifest[result.name] = keys[result.name]
+        build_cache.save_manifest(artifact_path, manifest)
+    results = [results_by_name[contract.name] for contract in to_build]
+
+    for result in results:
+        logger.info(f"---- {result.name} ----")
+        for line in result.logs:
+            logger.info(line)
+        if result.error:
+            logger.error(f"Build failed for {result.name}:\n{result.error}")
+    failed = [result.name for result in results if result.error]
+    if failed:
+        raise Exception(f"Could not build contracts: {', '.join(failed)}")
+    # Size/page/cost report in artifacts/teal_manifest.json; raises if a program cannot fit.
+    teal_analysis.update_manifest(artifact_path, [contract.name for contract in to_build])
+    return results
+
+
+def build_matrix(artifact_path: Path, to_build: list[SmartContract], simulate: bool = True) -> dict[str, dict]:
+    """
+    Compiles every contract at each optimization level in parallel, measures
+    the variants (see _tooling/opt_matrix.py), installs the cheapest one that
+    passes the behavioral check and records its level for later builds.
+    """
+    jobs = [(contract, level) for contract in to_build for level in opt_matrix.LEVELS]
+    max_workers = min(len(jobs), os.cpu_count() or 1) if jobs else 1
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(
+                _build_worker,
+                f"{contract.name} O{level}",
+                opt_matrix.variant_dir(artifact_path, contract.name, level),
+                contract.path,
+                [*COMPILE_FLAGS, opt_matrix.level_flag(level)],
+            )
+            for contract, level in jobs
+        ]
+        for future in futures:
+            result = future.result()
+            if result.error:
+                logger.warning(f"Build failed for {result.name}:\n{result.error}")
+
+    report = {}
+    levels = opt_matrix.load_levels(artifact_path)
+    manifest = build_cache.load_manifest(artifact_path)
+    search_roots = [root_path.parent, root_path]
+    for contract in to_build:
+        entry = opt_matrix.evaluate(artifact_path, contract.name, list(opt_matrix.LEVELS), simulate)
+        report[contract.name] = entry
+        if entry["selected"] is None:
+            logger.error(f"No optimization level of {contract.name} built and passed the behavioral check")
+            continue
+        staging = build_cache.staging_dir(artifact_path / contract.name)
+        copytree(opt_matrix.variant_dir(artifact_path, contract.name, entry["selected"]), staging, dirs_exist_ok=True)
+        build_cache.replace_dir(staging, artifact_path / contract.name)
+        levels[contract.name] = entry["selected"]
+        flags = [*COMPILE_FLAGS, opt_matrix.level_flag(entry["selected"]), deployment_extension]
+        manifest[contract.name] = build_cache.cache_key(contract.path, search_roots, flags)
+
+    opt_matrix.save_levels(artifact_path, levels)
+    build_cache.save_manifest(artifact_path, manifest)
+    opt_matrix.save_report(artifact_path, report)
+    rmtree(artifact_path / opt_matrix.MATRIX_DIR, ignore_errors=True)
+    teal_analysis.update_manifest(artifact_path, [contract.name for contract in to_build])
+    logger.info("\n" + opt_matrix.format_report(report))
+    return report
 
 
 # --------------------------- Main Logic --------------------------- #
 
 
-def main(action: str, contract_name: str | None = None) -> None:
+def deploy_many(artifact_path: Path, to_deploy: list[SmartContract], force: bool = False) -> None:
+    """
+    Deploys only the contracts whose compiled programs differ from the last
+    deploy to this network, running independent deploys concurrently.
+    """
+    deployed = deploy.deploy_changed(to_deploy, artifact_path, force=force)
+    logger.info(f"Deployed {len(deployed)}/{len(to_deploy)} contracts")
+
+
+def main(
+    action: str,
+    contract_name: str | None = None,
+    redeploy: bool = False,
+    force: bool = False,
+    simulate: bool = True,
+) -> None:
     """Main entry point to build and/or deploy smart contracts."""
     artifact_path = root_path / "artifacts"
-    # Filter contracts based on an optional specific contract name.
-    filtered_contracts = [
-        contract
-        for contract in contracts
-        if contract_name is None or contract.name == contract_name
-    ]
+    # Only the named contract is resolved when one is given.
+    filtered_contracts = discover_contracts(contract_name)
+    if action in ("deploy", "all") or (action == "watch" and redeploy):
+        load_environment()
 
     match action:
         case "build":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
+            build_many(artifact_path, filtered_contracts)
         case "deploy":
             for contract in filtered_contracts:
                 output_dir = artifact_path / contract.name
-                app_spec_file_name = next(
-                    (
-                        file.name
-                        for file in output_dir.iterdir()
-                        if file.is_file() and file.suffixes == [".arc56", ".json"]
-                    ),
-                    None,
-                )
-                if app_spec_file_name is None:
+                if not any(output_dir.glob("*.arc56.json")):
                     raise Exception("Could not deploy app, .arc56.json file not found")
-                if contract.deploy:
-                    logger.info(f"Deploying app {contract.name}")
-                    contract.deploy()
+            deploy_many(artifact_path, filtered_contracts, force=force)
         case "all":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
-                if contract.deploy:
-                    logger.info(f"Deploying {contract.name}")
-                    contract.deploy()
+            build_many(artifact_path, filtered_contracts)
+            deploy_many(artifact_path, filtered_contracts, force=force)
+        case "build_matrix":
+            # Picks an optimization level per contract; pass --no-simulate to
+            # compare on static cost only (no LocalNet needed).
+            build_matrix(artifact_path, filtered_contracts, simulate=simulate)
+        case "watch":
+            # Rebuilds (compile + client) only the contracts affected by a save;
+            # with --deploy the rebuilt apps are also redeployed (e.g. to LocalNet).
+            watch.watch(
+                filtered_contracts,
+                search_roots=[root_path.parent, root_path],
+                rebuild=lambda affected: build_many(artifact_path, affected),
+                redeploy=(lambda affected: deploy_many(artifact_path, affected)) if redeploy else None,
+            )
         case _:
             logger.error(f"Unknown action: {action}")
 
 
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m smart_contracts", description="Build and deploy the smart contracts."
+    )
+    parser.add_argument("action", nargs="?", default="all", choices=ACTIONS)
+    parser.add_argument("contract_name", nargs="?", help="only this contract folder")
+    parser.add_argument("--deploy", action="store_true", help="watch: also redeploy the rebuilt apps")
+    parser.add_argument(
+        "--force", action="store_true", help="redeploy every contract even when its programs are unchanged"
+    )
+    parser.add_argument(
+        "--no-simulate", action="store_true", help="build_matrix: compare on static cost only"
+    )
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    if len(sys.argv) > 2:
-        main(sys.argv[1], sys.argv[2])
-    elif len(sys.argv) > 1:
-        main(sys.argv[1])
-    else:
-        main("all")
\ No newline at end of file
+    args = parse_args(sys.argv[1:])
+    configure_logging()
+    main(
+        args.action,
+        args.contract_name,
+        redeploy=args.deploy,
+        force=args.force,
+        simulate=not args.no_simulate,
+    )
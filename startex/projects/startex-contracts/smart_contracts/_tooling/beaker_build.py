@@ -0,0 +1,60 @@
+"""
+Builds Beaker (PyTeal) contracts into the same artifact layout as puya builds.
+
+A contract folder whose <folder>/<folder>.py defines a module-level Beaker
+`app` is exported as <folder>.approval.teal, <folder>.clear.teal and
+<folder>.arc56.json (converted from Beaker's ARC-32 spec), so the build cache,
+TEAL analysis, deploy manifest and the client generator handle it like any
+other contract.
+
+PyTeal has no numbered optimization levels; build_matrix's levels map onto its
+optimizer switches (PYTEAL_OPTIMIZATIONS). Without a level flag the app's own
+build options are used.
+"""
+
+import dataclasses
+import importlib
+from pathlib import Path
+
+from smart_contracts._tooling import opt_matrix
+
+# optimization level -> beaker BuildOptions overrides
+PYTEAL_OPTIMIZATIONS = {
+    0: {"scratch_slots": False, "frame_pointers": False},
+    1: {"scratch_slots": True, "frame_pointers": False},
+    2: {"scratch_slots": True, "frame_pointers": True},
+}
+
+
+def contract_module(folder: Path) -> Path | None:
+    """The folder's Beaker module (<folder>/<folder>.py), if it has one."""
+    path = folder / f"{folder.name}.py"
+    return path if path.is_file() else None
+
+
+def module_name(contract_path: Path) -> str:
+    return ".".join((contract_path.parent.parent.name, contract_path.parent.name, contract_path.stem))
+
+
+def export(output_dir: Path, contract_path: Path, flags: list[str]) -> None:
+    """Builds the module's `app` and writes its programs and app specs into output_dir."""
+    # algokit_utils and pyteal are only needed once a Beaker build actually runs
+    import algokit_utils
+
+    app = importlib.import_module(module_name(contract_path)).app
+    level = opt_matrix.level_from_flags(flags)
+    own_options = app.build_options
+    if level is not None:
+        app.build_options = dataclasses.replace(own_options, **PYTEAL_OPTIMIZATIONS[level])
+    try:
+        spec = app.build()
+    finally:
+        app.build_options = own_options
+
+    name = contract_path.parent.name
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / f"{name}.approval.teal").write_text(spec.approval_program)
+    (output_dir / f"{name}.clear.teal").write_text(spec.clear_program)
+    # only the ARC-56 spec is written: the client generator would pick up an ARC-32 file as well
+    arc56 = algokit_utils.Arc56Contract.from_arc32(spec.to_json())
+    (output_dir / f"{name}.arc56.json").write_text(arc56.to_json(indent=2))
@@ -0,0 +1,130 @@
+"""
+Content-hash build cache for contracts and their generated clients.
+
+A contract's cache key hashes its source, the sources of every local module it
+imports (transitively), the compiler/client-generator versions and the build
+flags. Keys of successful builds are kept in artifacts/build_manifest.json;
+a contract whose key is unchanged and whose output folder still exists is
+skipped.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from shutil import rmtree
+
+MANIFEST_NAME = "build_manifest.json"
+TOOL_PACKAGES = ("puyapy", "algokit-client-generator", "algorand-python", "beaker-pyteal", "pyteal")
+
+
+def _module_candidates(module: str, search_roots: list[Path]) -> list[Path]:
+    relative = Path(*module.split("."))
+    return [
+        candidate
+        for root in search_roots
+        for candidate in (root / relative.with_suffix(".py"), root / relative / "__init__.py")
+    ]
+
+
+def local_imports(path: Path, search_roots: list[Path]) -> set[Path]:
+    """Project files imported directly by `path` (third-party imports are ignored)."""
+    try:
+        tree = ast.parse(path.read_text(), filename=str(path))
+    except SyntaxError:
+        # Mid-edit files still get hashed; their imports are picked up once they parse.
+        return set()
+    modules: list[tuple[str, list[Path]]] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules += [(alias.name, search_roots) for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = path.parent
+                for _ in range(node.level - 1):
+                    base = base.parent
+                roots = [base]
+            else:
+                roots = search_roots
+            module = node.module or ""
+            # `from pkg import name` may name a submodule as well as an attribute
+            modules += [(f"{module}.{alias.name}".strip("."), roots) for alias in node.names]
+            if module:
+                modules.append((module, roots))
+
+    found = set()
+    for module, roots in modules:
+        for candidate in _module_candidates(module, roots):
+            if candidate.is_file():
+                found.add(candidate.resolve())
+                break
+    return found
+
+
+def source_closure(contract_path: Path, search_roots: list[Path]) -> list[Path]:
+    """The contract file plus all transitively imported project files, sorted."""
+    seen: set[Path] = set()
+    pending = [contract_path.resolve()]
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        pending.extend(local_imports(path, search_roots) - seen)
+    return sorted(seen)
+
+
+def tool_versions() -> dict[str, str]:
+    # importlib.metadata is slow to import; only builds need it, not CLI startup
+    from importlib import metadata
+
+    versions = {}
+    for package in TOOL_PACKAGES:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = "missing"
+    return versions
+
+
+def cache_key(contract_path: Path, search_roots: list[Path], flags: list[str]) -> str:
+    digest = hashlib.sha256()
+    for path in source_closure(contract_path, search_roots):
+        digest.update(path.name.encode())
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    digest.update(json.dumps(tool_versions(), sort_keys=True).encode())
+    digest.update(json.dumps(flags).encode())
+    return digest.hexdigest()
+
+
+def load_manifest(artifact_path: Path) -> dict[str, str]:
+    manifest_path = artifact_path / MANIFEST_NAME
+    if not manifest_path.exists():
+        return {}
+    return json.loads(manifest_path.read_text())
+
+
+def save_manifest(artifact_path: Path, manifest: dict[str, str]) -> None:
+    artifact_path.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", dir=artifact_path, delete=False, suffix=".tmp") as tmp:
+        json.dump(manifest, tmp, indent=2, sort_keys=True)
+    os.replace(tmp.name, artifact_path / MANIFEST_NAME)
+
+
+def staging_dir(output_dir: Path) -> Path:
+    """Fresh sibling directory to build into before swapping it in."""
+    output_dir.parent.mkdir(parents=True, exist_ok=True)
+    return Path(tempfile.mkdtemp(prefix=f".{output_dir.name}.", dir=output_dir.parent))
+
+
+def replace_dir(staging: Path, output_dir: Path) -> None:
+    """Swaps a finished staging directory into place; readers never see a half-built folder."""
+    backup = None
+    if output_dir.exists():
+        backup = Path(tempfile.mkdtemp(prefix=f".{output_dir.name}.old.", dir=output_dir.parent))
+        os.replace(output_dir, backup / output_dir.name)
+    os.replace(staging, output_dir)
+    if backup is not None:
+        rmtree(backup)
@@ -0,0 +1,146 @@
+"""
+Idempotent, diff-based deploys.
+
+The sha256 of each contract's compiled approval and clear programs is recorded
+per network in artifacts/deploy_manifest.json after a successful deploy. On the
+next run only contracts whose programs changed are deployed, together with
+every contract that depends on one of them (directly or transitively), since
+a redeployed app gets a new app id its dependents have stored. Each entry
+also records the program hashes of the contract's dependencies at deploy
+time, so a dependent whose deploy failed after its dependency went out is
+still picked up by the next run. Independent
+contracts deploy concurrently; a contract that depends on another (e.g.
+competition needs the registry app id) starts only after that dependency's
+deploy has finished.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Protocol
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "deploy_manifest.json"
+
+
+class DeployableContract(Protocol):
+    name: str
+    deploy: Callable[[], None] | None
+    depends_on: tuple[str, ...]
+
+
+def network_name() -> str:
+    """Manifest section for the network the deploy_config modules target."""
+    return os.getenv("ALGOD_SERVER", "localnet") + ":" + os.getenv("ALGOD_PORT", "")
+
+
+def program_hashes(output_dir: Path) -> dict[str, str] | None:
+    hashes = {}
+    for kind in ("approval", "clear"):
+        programs = sorted(output_dir.glob(f"*.{kind}.teal"))
+        if not programs:
+            return None
+        hashes[kind] = hashlib.sha256(b"".join(p.read_bytes() for p in programs)).hexdigest()
+    return hashes
+
+
+def _load(artifact_path: Path) -> dict:
+    path = artifact_path / MANIFEST_NAME
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def _save(artifact_path: Path, manifest: dict) -> None:
+    with tempfile.NamedTemporaryFile("w", dir=artifact_path, delete=False, suffix=".tmp") as tmp:
+        json.dump(manifest, tmp, indent=2, sort_keys=True)
+    os.replace(tmp.name, artifact_path / MANIFEST_NAME)
+
+
+def deploy_changed(
+    contracts: Sequence[DeployableContract],
+    artifact_path: Path,
+    force: bool = False,
+    max_workers: int = 4,
+) -> list[str]:
+    """Deploys contracts whose compiled programs changed; returns their names in completion order."""
+    manifest = _load(artifact_path)
+    network = network_name()
+    deployed_hashes = manifest.setdefault(network, {})
+
+    hashes = {}
+    for contract in contracts:
+        hashes[contract.name] = program_hashes(artifact_path / contract.name)
+        if hashes[contract.name] is None:
+            raise Exception(f"Could not deploy {contract.name}, compiled TEAL not found")
+    for contract in contracts:
+        if contract.depends_on:
+            # Program hashes read from the artifacts whether or not the dependency is part of
+            # this deploy (e.g. `deploy competition`), so a filtered run records the same entry.
+            hashes[contract.name]["depends_on"] = {
+                dep: program_hashes(artifact_path / dep) for dep in contract.depends_on
+            }
+
+    todo = {
+        contract.name: contract
+        for contract in contracts
+        if contract.deploy and (force or deployed_hashes.get(contract.name) != hashes[contract.name])
+    }
+    # A redeploy creates a new app id; contracts that store a dependency's id
+    # (e.g. competition -> startup_registry) must be redeployed after it.
+    pending = list(todo)
+    while pending:
+        changed = pending.pop()
+        for contract in contracts:
+            if contract.deploy and contract.name not in todo and changed in contract.depends_on:
+                logger.info(f"{contract.name} depends on redeployed {changed}, deploying it too")
+                todo[contract.name] = contract
+                pending.append(contract.name)
+    for contract in contracts:
+        if contract.deploy and contract.name not in todo:
+            logger.info(f"{contract.name} unchanged on {network}, skipping deploy")
+
+    lock = threading.Lock()
+    done: list[str] = []
+    running: dict[Future, str] = {}
+    failed: dict[str, BaseException] = {}
+
+    def run(contract: DeployableContract) -> None:
+        logger.info(f"Deploying {contract.name}")
+        contract.deploy()
+        with lock:
+            deployed_hashes[contract.name] = hashes[contract.name]
+            _save(artifact_path, manifest)
+
+    def ready(name: str) -> bool:
+        # Dependencies outside this deploy (unchanged or filtered out) are already live.
+        return all(dep not in todo or dep in done for dep in todo[name].depends_on)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        waiting = dict(todo)
+        while waiting or running:
+            for name in [n for n in waiting if ready(n)]:
+                running[pool.submit(run, waiting.pop(name))] = name
+            if not running:
+                blocked = ", ".join(sorted(waiting))
+                raise Exception(f"Could not deploy {blocked}: a dependency failed or is cyclic")
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                if future.exception():
+                    failed[name] = future.exception()
+                    logger.error(f"Deploy failed for {name}: {future.exception()}")
+                else:
+                    done.append(name)
+            if failed:
+                # Let in-flight deploys finish but start nothing new.
+                waiting.clear()
+
+    if failed:
+        raise Exception(f"Could not deploy contracts: {', '.join(sorted(failed))}")
+    return done
@@ -0,0 +1,162 @@
+"""
+Optimization-level build matrix.
+
+Every contract is compiled at each optimization level (puya's levels, or the
+matching PyTeal optimizer switches for Beaker contracts, see beaker_build.py;
+in parallel, by the caller) into artifacts/.matrix/<contract>/O<level>. Each variant is then
+measured: program size and static worst-case route cost from teal_analysis,
+and, when LocalNet is reachable, simulated per-scenario opcode cost from the
+benchmark suite run against that variant. The benchmark doubles as the
+behavioral check: a variant whose scenarios do not end as expected is not
+eligible. The cheapest eligible variant wins; its level is stored in
+artifacts/optimization_levels.json so later builds keep using it, and the full
+comparison (including which level wins each route/scenario) is written to
+artifacts/optimization_report.json.
+"""
+
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from shutil import copytree
+
+from smart_contracts._tooling import teal_analysis
+
+logger = logging.getLogger(__name__)
+
+LEVELS = (0, 1, 2)
+# puya's default; preferred on ties so plain builds and matrix builds agree
+DEFAULT_LEVEL = 1
+MATRIX_DIR = ".matrix"
+LEVELS_NAME = "optimization_levels.json"
+REPORT_NAME = "optimization_report.json"
+PASSING_STATUSES = ("ok", "expected error")
+
+
+def level_flag(level: int) -> str:
+    return f"--optimization-level={level}"
+
+
+def level_from_flags(flags: list[str]) -> int | None:
+    """The optimization level a flag list selects, if any (see level_flag)."""
+    prefix = level_flag(0)[:-1]
+    return next((int(flag.removeprefix(prefix)) for flag in flags if flag.startswith(prefix)), None)
+
+
+def variant_dir(artifact_path: Path, contract_name: str, level: int) -> Path:
+    return artifact_path / MATRIX_DIR / contract_name / f"O{level}"
+
+
+def load_levels(artifact_path: Path) -> dict[str, int]:
+    path = artifact_path / LEVELS_NAME
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def save_levels(artifact_path: Path, levels: dict[str, int]) -> None:
+    artifact_path.mkdir(parents=True, exist_ok=True)
+    (artifact_path / LEVELS_NAME).write_text(json.dumps(levels, indent=2, sort_keys=True) + "\n")
+
+
+def simulate_variant(artifact_path: Path, contract_name: str, level: int) -> dict | None:
+    """Benchmark results for one variant, or None when LocalNet/the benchmark is unavailable."""
+    with tempfile.TemporaryDirectory(prefix="startex-matrix-") as tmp:
+        tree = Path(tmp)
+        for entry in artifact_path.iterdir():
+            if entry.is_dir() and not entry.name.startswith(".") and entry.name != contract_name:
+                copytree(entry, tree / entry.name)
+        copytree(variant_dir(artifact_path, contract_name, level), tree / contract_name)
+        output = tree / "results.json"
+        result = subprocess.run(
+            [sys.executable, "-m", "smart_contracts.scripts.benchmark", "--app", contract_name, "--json", str(output)],
+            env={**os.environ, "STARTEX_ARTIFACTS_DIR": str(tree)},
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+        if result.returncode or not output.exists():
+            logger.warning(f"Could not simulate {contract_name} O{level}:\n{result.stdout[-2000:]}")
+            return None
+        return json.loads(output.read_text())
+
+
+def _wins(metrics_by_level: dict[int, dict[str, int]]) -> dict[str, list[int]]:
+    """For each route/scenario, the levels with the lowest cost."""
+    names = {name for metrics in metrics_by_level.values() for name in metrics}
+    wins = {}
+    for name in sorted(names):
+        costs = {level: metrics[name] for level, metrics in metrics_by_level.items() if name in metrics}
+        best = min(costs.values())
+        wins[name] = sorted(level for level, cost in costs.items() if cost == best)
+    return wins
+
+
+def evaluate(artifact_path: Path, contract_name: str, levels: list[int], simulate: bool) -> dict:
+    """Measures the built variants of one contract and picks the cheapest one that behaves."""
+    variants = {}
+    for level in levels:
+        static = teal_analysis.analyze_contract(variant_dir(artifact_path, contract_name, level))
+        if static is None:
+            continue
+        simulated = simulate_variant(artifact_path, contract_name, level) if simulate else None
+        variants[level] = {
+            "approval_bytes": static["approval_bytes"],
+            "extra_pages": static["extra_pages"],
+            "fits": static["fits"],
+            "static_cost": {sig: route["worst_case_cost"] for sig, route in static["routes"].items()},
+            "simulated_cost": {name: r["opcode_cost"] for name, r in simulated.items()} if simulated else None,
+            "behavior_ok": (
+                all(r["status"] in PASSING_STATUSES for r in simulated.values()) if simulated is not None else None
+            ),
+        }
+
+    use_simulation = bool(variants) and all(v["simulated_cost"] is not None for v in variants.values())
+    if simulate and not use_simulation:
+        logger.warning(f"{contract_name}: simulation unavailable for some variants, selecting on static cost only")
+
+    def cost(level: int) -> tuple:
+        variant = variants[level]
+        total = sum((variant["simulated_cost"] if use_simulation else variant["static_cost"]).values())
+        return total, variant["approval_bytes"], abs(level - DEFAULT_LEVEL)
+
+    eligible = [
+        level
+        for level, variant in variants.items()
+        if variant["fits"] and (not use_simulation or variant["behavior_ok"])
+    ]
+    selected = min(eligible, key=cost) if eligible else None
+    return {
+        "selected": selected,
+        "selected_by": "simulated" if use_simulation else "static",
+        "variants": {f"O{level}": variant for level, variant in variants.items()},
+        "route_wins": _wins({level: v["static_cost"] for level, v in variants.items()}),
+        "scenario_wins": _wins({level: v["simulated_cost"] for level, v in variants.items()}) if use_simulation else {},
+        "size_wins": _wins({level: {"approval_bytes": v["approval_bytes"]} for level, v in variants.items()}),
+    }
+
+
+def save_report(artifact_path: Path, report: dict[str, dict]) -> None:
+    artifact_path.mkdir(parents=True, exist_ok=True)
+    path = artifact_path / REPORT_NAME
+    existing = json.loads(path.read_text()) if path.exists() else {}
+    existing.update(report)
+    path.write_text(json.dumps(existing, indent=2, sort_keys=True) + "\n")
+
+
+def format_report(report: dict[str, dict]) -> str:
+    lines = []
+    for contract_name, entry in report.items():
+        selected = "none" if entry["selected"] is None else f"O{entry['selected']}"
+        lines.append(f"{contract_name}: selected {selected} (by {entry['selected_by']} cost)")
+        for level, variant in entry["variants"].items():
+            simulated = variant["simulated_cost"]
+            lines.append(
+                f"    {level}: {variant['approval_bytes']:>6}B  static={sum(variant['static_cost'].values()):>7}  "
+                f"simulated={sum(simulated.values()) if simulated else '-':>7}  behavior={variant['behavior_ok']}"
+            )
+        wins = {**entry["route_wins"], **entry["scenario_wins"], **entry["size_wins"]}
+        for name, levels in wins.items():
+            lines.append(f"    {name:<60} best at {', '.join(f'O{level}' for level in levels)}")
+    return "\n".join(lines)
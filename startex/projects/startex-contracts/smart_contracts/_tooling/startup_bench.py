@@ -0,0 +1,99 @@
+"""
+Startup-time benchmark for the build/deploy CLI.
+
+Runs `python -m smart_contracts --help` and a contract-discovery import in
+fresh interpreters, reports the median wall time and the slowest imports from
+`-X importtime`, and exits 1 when the median exceeds the budget. Run it after
+touching module-level code in smart_contracts/__main__.py or _tooling/.
+
+The clients/clients_spec entries time a worker that loads all generated
+clients and reads their spec JSON (the clients themselves are only executed
+on first use), and one that also parses the specs into Arc56Contract. Set
+STARTEX_APP_SPEC_CACHE to a directory to measure with the on-disk spec JSON
+cache (the first run fills it):
+
+    python -m smart_contracts._tooling.startup_bench [--runs 5] [--budget SECONDS] [--only clients]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_BUDGET_SECONDS = 1.0
+
+_ALL_CLIENTS = "from smart_contracts.scripts.chain import CLIENT_FILES, app_spec_json, load_app_spec, load_client_module; "
+
+COMMANDS = {
+    "help": ["-m", "smart_contracts", "--help"],
+    "discover": ["-c", "from smart_contracts.__main__ import discover_contracts; discover_contracts()"],
+    # cold start of a worker that imports every generated client, before and after its first app spec use
+    "clients": ["-c", _ALL_CLIENTS + "[(load_client_module(n), app_spec_json(n)) for n in CLIENT_FILES]"],
+    "clients_spec": ["-c", _ALL_CLIENTS + "[load_app_spec(n) for n in CLIENT_FILES]"],
+}
+# Client workers import algokit_utils and algosdk, so they get more headroom than the CLI.
+DEFAULT_BUDGETS = {"help": DEFAULT_BUDGET_SECONDS, "discover": DEFAULT_BUDGET_SECONDS, "clients": 2.0, "clients_spec": 2.5}
+
+
+def time_command(args: list[str], runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=PROJECT_ROOT, capture_output=True, check=True)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def slowest_imports(args: list[str], top: int) -> list[tuple[str, int]]:
+    """(module, cumulative microseconds) of the most expensive top-level imports."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self, cumulative, name = line.removeprefix("import time:").split("|")
+        # nested imports are indented under their importer
+        if not name[1:].startswith(" "):
+            imports.append((name.strip(), int(cumulative)))
+    return sorted(imports, key=lambda item: item[1], reverse=True)[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="CLI startup-time benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=float, help="max median seconds for every command (default: per command)")
+    parser.add_argument("--only", action="append", choices=COMMANDS, help="only time these commands")
+    parser.add_argument("--top", type=int, default=8, help="slowest imports shown")
+    parser.add_argument("--json", type=Path, help="also write the timings as JSON")
+    args = parser.parse_args()
+
+    report = {}
+    for name, command in COMMANDS.items():
+        if args.only and name not in args.only:
+            continue
+        median = time_command(command, args.runs)
+        report[name] = {"median_seconds": round(median, 3), "slowest_imports_us": slowest_imports(command, args.top)}
+        print(f"{name:<10} median {median:.3f}s over {args.runs} runs")
+        for module, cumulative in report[name]["slowest_imports_us"]:
+            print(f"    {cumulative / 1000:>8.1f} ms  {module}")
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+
+    over = [
+        f"{name} ({entry['median_seconds']}s > {args.budget or DEFAULT_BUDGETS[name]}s)"
+        for name, entry in report.items()
+        if entry["median_seconds"] > (args.budget or DEFAULT_BUDGETS[name])
+    ]
+    if over:
+        print(f"Over the startup budget: {', '.join(over)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,385 @@
+"""
+Static analysis of compiled approval programs.
+
+Parses each `*.approval.teal` into basic blocks and, for every ABI method
+route, reports the bytes reachable from the route, the worst-case opcode cost
+along any path (subroutine calls included; loops are counted once and flagged),
+the box operations with their key when it is a literal (or literal prefix), and
+the inner-transaction submit sites. Program size comes from the `.bin` bytecode
+when the compiler wrote it and from a per-op encoding estimate otherwise; it
+determines the extra pages the app needs.
+
+The result is written to artifacts/teal_manifest.json so size-limit and
+extra-page problems surface at build time rather than at deploy. It is a
+build output and is not committed.
+
+    python -m smart_contracts._tooling.teal_analysis [artifacts_dir]
+"""
+
+import base64
+import json
+import logging
+import math
+import re
+import shlex
+import sys
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "teal_manifest.json"
+PAGE_SIZE = 2048
+MAX_EXTRA_PAGES = 3
+APP_CALL_BUDGET = 700
+
+# Opcodes whose cost is not 1 (AVM v10). Everything else costs 1 per execution.
+OPCODE_COSTS = {
+    "sha256": 35,
+    "keccak256": 130,
+    "sha512_256": 45,
+    "sha3_256": 130,
+    "ed25519verify": 1900,
+    "ed25519verify_bare": 1900,
+    "ecdsa_verify": 1700,
+    "ecdsa_pk_decompress": 650,
+    "ecdsa_pk_recover": 2000,
+    "vrf_verify": 5700,
+    "falcon_verify": 1700,
+    "b+": 10,
+    "b-": 10,
+    "b*": 20,
+    "b/": 20,
+    "b%": 20,
+    "b|": 6,
+    "b&": 6,
+    "b^": 6,
+    "b~": 4,
+    "bsqrt": 40,
+    "json_ref": 25,
+}
+
+BRANCHES = {"b", "bz", "bnz"}
+MULTI_BRANCHES = {"switch", "match"}
+TERMINATORS = {"return", "err", "retsub", "b"}
+BOX_OPS = {
+    "box_create",
+    "box_extract",
+    "box_replace",
+    "box_splice",
+    "box_del",
+    "box_len",
+    "box_get",
+    "box_put",
+    "box_resize",
+}
+BYTES_PUSHES = {"byte", "pushbytes"}
+METHOD_COMMENT = re.compile(r'method "([^"]+)"')
+
+
+def opcode_cost(op: str) -> int:
+    return OPCODE_COSTS.get(op, 1)
+
+
+class Instruction:
+    __slots__ = ("line", "op", "args", "comment")
+
+    def __init__(self, line: int, op: str, args: list[str], comment: str) -> None:
+        self.line = line
+        self.op = op
+        self.args = args
+        self.comment = comment
+
+
+def _split_comment(text: str) -> tuple[str, str]:
+    in_string = False
+    for index, char in enumerate(text):
+        if char == '"' and (index == 0 or text[index - 1] != "\\"):
+            in_string = not in_string
+        elif not in_string and text.startswith("//", index):
+            return text[:index], text[index + 2 :].strip()
+    return text, ""
+
+
+def parse(source: str) -> tuple[list[Instruction], dict[str, int]]:
+    """Instructions plus label -> index of the instruction that follows the label."""
+    instructions: list[Instruction] = []
+    labels: dict[str, int] = {}
+    for line_number, raw in enumerate(source.splitlines(), start=1):
+        code, comment = _split_comment(raw)
+        code = code.strip()
+        if not code or code.startswith("#"):
+            continue
+        if code.endswith(":") and " " not in code:
+            labels[code[:-1]] = len(instructions)
+            continue
+        try:
+            tokens = shlex.split(code, posix=False)
+        except ValueError:
+            tokens = code.split()
+        instructions.append(Instruction(line_number, tokens[0], tokens[1:], comment))
+    return instructions, labels
+
+
+def _varuint_len(value: int) -> int:
+    return max(1, math.ceil(value.bit_length() / 7))
+
+
+def _literal_bytes(args: list[str]) -> bytes | None:
+    if not args:
+        return None
+    value = args[0]
+    if value.startswith("0x"):
+        return bytes.fromhex(value[2:])
+    if value.startswith('"') and value.endswith('"'):
+        return value[1:-1].encode("utf-8").decode("unicode_escape").encode("latin-1", errors="replace")
+    if value in ("base64", "b64") and len(args) > 1:
+        return base64.b64decode(args[1])
+    if value.startswith(("base64(", "b64(")):
+        return base64.b64decode(value[value.index("(") + 1 : -1])
+    return None
+
+
+def _int_literal(token: str) -> int:
+    try:
+        return int(token, 0)
+    except ValueError:
+        return 0  # named constants (e.g. `int pay`) encode in one byte
+
+
+def encoded_size(instruction: Instruction) -> int:
+    """Assembled byte size of one instruction (estimate used when no .bin was written)."""
+    op, args = instruction.op, instruction.args
+    if op in ("int", "pushint"):
+        return 1 + _varuint_len(_int_literal(args[0])) if args else 2
+    if op in ("pushints", "intcblock"):
+        return 1 + _varuint_len(len(args)) + sum(_varuint_len(_int_literal(a)) for a in args)
+    if op in BYTES_PUSHES:
+        literal = _literal_bytes(args) or b""
+        return 1 + _varuint_len(len(literal)) + len(literal)
+    if op in ("pushbytess", "bytecblock"):
+        literals = [_literal_bytes([a]) or b"" for a in args]
+        return 1 + _varuint_len(len(literals)) + sum(_varuint_len(len(b)) + len(b) for b in literals)
+    if op == "addr":
+        return 2 + 32
+    if op == "method":
+        return 2 + 4
+    if op in BRANCHES or op == "callsub":
+        return 3
+    if op in MULTI_BRANCHES:
+        return 2 + 2 * len(args)
+    if op in ("intc_0", "intc_1", "intc_2", "intc_3", "bytec_0", "bytec_1", "bytec_2", "bytec_3"):
+        return 1
+    # every other immediate (field names, indexes, frame offsets) is one byte
+    return 1 + len(args)
+
+
+def _is_block_end(instruction: Instruction) -> bool:
+    return instruction.op in TERMINATORS or instruction.op in BRANCHES or instruction.op in MULTI_BRANCHES
+
+
+class Program:
+    def __init__(self, source: str) -> None:
+        self.instructions, self.labels = parse(source)
+        starts = {0, *self.labels.values()}
+        for index, instruction in enumerate(self.instructions):
+            if _is_block_end(instruction) or instruction.op == "callsub":
+                starts.add(index + 1)
+        self.block_starts = sorted(start for start in starts if start < len(self.instructions))
+        self._block_end = {
+            start: (self.block_starts[i + 1] if i + 1 < len(self.block_starts) else len(self.instructions))
+            for i, start in enumerate(self.block_starts)
+        }
+        self._cost_memo: dict[int, tuple[int, bool]] = {}
+
+    @property
+    def estimated_size(self) -> int:
+        # the version byte precedes the first op
+        return 1 + sum(encoded_size(instruction) for instruction in self.instructions)
+
+    def block(self, start: int) -> list[Instruction]:
+        return self.instructions[start : self._block_end[start]]
+
+    def successors(self, start: int) -> tuple[list[int], int | None]:
+        """(successor block starts, subroutine entry if the block ends in callsub)."""
+        end = self._block_end[start]
+        last = self.instructions[end - 1]
+        targets = [self.labels[arg] for arg in last.args if arg in self.labels]
+        if last.op == "callsub":
+            return [end] if end < len(self.instructions) else [], targets[0] if targets else None
+        if last.op in ("return", "err", "retsub"):
+            return [], None
+        if last.op == "b":
+            return targets, None
+        fallthrough = [end] if end < len(self.instructions) else []
+        if last.op in BRANCHES or last.op in MULTI_BRANCHES:
+            return fallthrough + targets, None
+        return fallthrough, None
+
+    def worst_case_cost(self, start: int, _stack: frozenset = frozenset()) -> tuple[int, bool]:
+        """(cost of the most expensive path from `start` to return/err/retsub, whether a loop was cut)."""
+        if start in _stack:
+            return 0, True
+        if start in self._cost_memo:
+            return self._cost_memo[start]
+        stack = _stack | {start}
+        cost = sum(opcode_cost(instruction.op) for instruction in self.block(start))
+        looped = False
+        successors, subroutine = self.successors(start)
+        if subroutine is not None:
+            sub_cost, sub_looped = self.worst_case_cost(subroutine, stack)
+            cost, looped = cost + sub_cost, sub_looped
+        paths = [self.worst_case_cost(successor, stack) for successor in successors]
+        if paths:
+            cost += max(path_cost for path_cost, _ in paths)
+            looped = looped or any(path_looped for _, path_looped in paths)
+        self._cost_memo[start] = (cost, looped)
+        return cost, looped
+
+    def reachable(self, start: int) -> list[int]:
+        seen: set[int] = set()
+        pending = [start]
+        while pending:
+            block = pending.pop()
+            if block in seen:
+                continue
+            seen.add(block)
+            successors, subroutine = self.successors(block)
+            pending.extend(successors)
+            if subroutine is not None:
+                pending.append(subroutine)
+        return sorted(seen)
+
+    def routes(self) -> dict[str, tuple[str, int]]:
+        """ABI method signature -> (route label, index of the dispatching branch)."""
+        routes: dict[str, tuple[str, int]] = {}
+        pending: list[str] = []
+        for index, instruction in enumerate(self.instructions):
+            if instruction.op in ("pushbytes", "pushbytess", "method") and "method" in instruction.comment:
+                pending = METHOD_COMMENT.findall(instruction.comment)
+            elif instruction.op == "method" and instruction.args:
+                pending = [instruction.args[0].strip('"')]
+            elif instruction.op in ("bnz", "match") and pending:
+                for signature, label in zip(pending, instruction.args):
+                    routes[signature] = (label, index)
+                pending = []
+        return routes
+
+
+def _box_ops(program: Program, blocks: list[int]) -> list[dict]:
+    found = []
+    for start in blocks:
+        literal: bytes | None = None
+        concatenated = False
+        for instruction in program.block(start):
+            if instruction.op in BYTES_PUSHES:
+                literal, concatenated = _literal_bytes(instruction.args), False
+            elif instruction.op == "concat" and literal is not None:
+                concatenated = True
+            elif instruction.op in BOX_OPS:
+                if literal is None:
+                    key = "<dynamic>"
+                else:
+                    key = "0x" + literal.hex() + ("*" if concatenated else "")
+                found.append({"op": instruction.op, "key": key, "line": instruction.line})
+                literal = None
+    return found
+
+
+def analyze_program(approval_teal: str, approval_bin: bytes | None, clear_size: int) -> dict:
+    program = Program(approval_teal)
+    approval_size = len(approval_bin) if approval_bin is not None else program.estimated_size
+    total = approval_size + clear_size
+    extra_pages = max(0, math.ceil(total / PAGE_SIZE) - 1)
+
+    routes = {}
+    for signature, (label, branch_index) in program.routes().items():
+        if label not in program.labels:
+            continue
+        start = program.labels[label]
+        cost, looped = program.worst_case_cost(start)
+        blocks = program.reachable(start)
+        dispatch = sum(opcode_cost(instruction.op) for instruction in program.instructions[: branch_index + 1])
+        routes[signature] = {
+            "label": label,
+            "worst_case_cost": dispatch + cost,
+            "cost_bounded": not looped,
+            "exceeds_single_call_budget": dispatch + cost > APP_CALL_BUDGET,
+            "reachable_bytes": sum(encoded_size(i) for block in blocks for i in program.block(block)),
+            "box_ops": _box_ops(program, blocks),
+            "inner_txn_sites": [
+                instruction.line
+                for block in blocks
+                for instruction in program.block(block)
+                if instruction.op == "itxn_submit"
+            ],
+        }
+
+    return {
+        "approval_bytes": approval_size,
+        "clear_bytes": clear_size,
+        "size_source": "bytecode" if approval_bin is not None else "estimate",
+        "extra_pages": extra_pages,
+        "fits": extra_pages <= MAX_EXTRA_PAGES,
+        "routes": routes,
+    }
+
+
+def analyze_contract(output_dir: Path) -> dict | None:
+    approval = next(iter(sorted(output_dir.glob("*.approval.teal"))), None)
+    if approval is None:
+        return None
+    stem = approval.name.removesuffix(".approval.teal")
+    approval_bin = output_dir / f"{stem}.approval.bin"
+    clear_bin = output_dir / f"{stem}.clear.bin"
+    clear_teal = output_dir / f"{stem}.clear.teal"
+    if clear_bin.exists():
+        clear_size = len(clear_bin.read_bytes())
+    elif clear_teal.exists():
+        clear_size = Program(clear_teal.read_text()).estimated_size
+    else:
+        clear_size = 0
+    return analyze_program(
+        approval.read_text(), approval_bin.read_bytes() if approval_bin.exists() else None, clear_size
+    )
+
+
+def update_manifest(artifact_path: Path, contract_names: list[str]) -> dict:
+    """Analyzes the named contracts, merges them into the manifest and raises if a program cannot fit."""
+    manifest_path = artifact_path / MANIFEST_NAME
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+    analyzed = 0
+    for name in contract_names:
+        report = analyze_contract(artifact_path / name)
+        if report is None:
+            continue
+        manifest[name] = report
+        analyzed += 1
+        logger.info(
+            f"{name}: approval {report['approval_bytes']}B + clear {report['clear_bytes']}B "
+            f"({report['size_source']}), {report['extra_pages']} extra pages"
+        )
+        for signature, route in report["routes"].items():
+            if route["exceeds_single_call_budget"]:
+                logger.warning(
+                    f"{name} {signature}: worst-case cost {route['worst_case_cost']} exceeds {APP_CALL_BUDGET}; "
+                    "callers must pool budget"
+                )
+    if not analyzed:
+        logger.info("No compiled contracts to analyze, leaving the TEAL manifest untouched")
+        return manifest
+    artifact_path.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+
+    too_big = [name for name in contract_names if name in manifest and not manifest[name]["fits"]]
+    if too_big:
+        raise Exception(
+            f"Programs exceed {PAGE_SIZE * (1 + MAX_EXTRA_PAGES)} bytes (max extra pages): {', '.join(too_big)}"
+        )
+    return manifest
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-10s: %(message)s")
+    artifacts = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).resolve().parents[1] / "artifacts"
+    names = sorted(path.name for path in artifacts.iterdir() if path.is_dir() and not path.name.startswith("."))
+    update_manifest(artifacts, names)
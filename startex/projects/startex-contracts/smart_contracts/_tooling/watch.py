@@ -0,0 +1,87 @@
+"""
+Watch mode: rebuilds only the contracts affected by saved files.
+
+Each contract's dependency set is its source closure (the contract file plus
+every local module it imports). Files are polled by mtime; a burst of saves is
+collected until no further change arrives for `debounce` seconds, then the
+contracts whose dependency set intersects the changed files are rebuilt (and
+optionally redeployed). Dependency sets are recomputed after each rebuild
+since imports may have changed.
+"""
+
+import logging
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Protocol
+
+from smart_contracts._tooling.build_cache import source_closure
+
+logger = logging.getLogger(__name__)
+
+
+class WatchedContract(Protocol):
+    name: str
+    path: Path
+
+
+def _mtimes(paths: set[Path]) -> dict[Path, float]:
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = path.stat().st_mtime
+        except FileNotFoundError:
+            mtimes[path] = -1.0
+    return mtimes
+
+
+def watch(
+    contracts: Sequence[WatchedContract],
+    search_roots: list[Path],
+    rebuild: Callable[[list], None],
+    redeploy: Callable[[list], None] | None = None,
+    interval: float = 0.3,
+    debounce: float = 0.5,
+) -> None:
+    """Blocks forever, rebuilding affected contracts after each burst of saves."""
+    graph = {contract.name: set(source_closure(contract.path, search_roots)) for contract in contracts}
+    watched = set().union(*graph.values()) if graph else set()
+    mtimes = _mtimes(watched)
+    pending: set[Path] = set()
+    last_change = 0.0
+    logger.info(f"Watching {len(watched)} files for {len(contracts)} contracts")
+
+    while True:
+        time.sleep(interval)
+        current = _mtimes(watched)
+        changed = {path for path, mtime in current.items() if mtimes.get(path) != mtime}
+        mtimes = current
+        if changed:
+            pending |= changed
+            last_change = time.monotonic()
+            continue
+        if not pending or time.monotonic() - last_change < debounce:
+            continue
+
+        affected = [contract for contract in contracts if graph[contract.name] & pending]
+        names = ", ".join(contract.name for contract in affected)
+        logger.info(f"Changed: {', '.join(sorted(p.name for p in pending))} -> rebuilding {names}")
+        pending.clear()
+        started = time.monotonic()
+        try:
+            rebuild(affected)
+            if redeploy is not None:
+                redeploy(affected)
+        except Exception as e:
+            logger.error(f"Rebuild failed: {e}")
+        else:
+            logger.info(f"Ready in {time.monotonic() - started:.1f}s")
+
+        for contract in affected:
+            graph[contract.name] = set(source_closure(contract.path, search_roots))
+        # Keep the pre-rebuild mtimes of files already watched, so a save made while
+        # rebuilding shows up as a change on the next poll; only new files get a baseline.
+        previously_watched = watched
+        watched = set().union(*graph.values())
+        kept = {path: mtimes[path] for path in watched & previously_watched}
+        mtimes = kept | _mtimes(watched - previously_watched)
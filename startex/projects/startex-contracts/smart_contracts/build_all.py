@@ -8,6 +8,7 @@ from .startup_registry_app import app as StartupRegistryApp
 from .metrics_app import app as MetricsApp
 from .competition_app import app as CompetitionApp
 from .tokenization_app import app as TokenizationApp
+from ._tooling import teal_analysis
 
 APPS = [
     StartupRegistryApp,
@@ -67,4 +68,8 @@ def build_all(out_dir: str = "smart_contracts/artifacts") -> None:
 
         (arc_file).write_text(json.dumps(a_spec, indent=2, ensure_ascii=False))
 
-        print(f"✅ Built {a.name} → {out_app_dir}/")
\ No newline at end of file
+        print(f"✅ Built {a.name} → {out_app_dir}/")
+
+    # Boyut / sayfa / maliyet raporu: out_dir/teal_manifest.json
+    # (program sığmıyorsa burada hata verir, deploy'da değil)
+    teal_analysis.update_manifest(base, [a.name.lower() for a in APPS])
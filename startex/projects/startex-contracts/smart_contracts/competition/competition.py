@@ -4,10 +4,8 @@ from beaker.lib.storage import BoxMapping
 from beaker.decorators import Authorize            # <-- DOĞRU YER
 from pyteal import *
 
-# Registry App'in arayüzünü tanımlıyoruz ki onu çağırabilelim.
-class IStartupRegistry(Interface):
-    def get_startup(startup_id: abi.Uint64, *, output: abi.NamedTuple): ...
-    def is_startup_owner(owner: abi.Address, startup_id: abi.Uint64, *, output: abi.Bool): ...
+# Registry App'te çağırdığımız metodun ABI imzası (inner method call için).
+IS_STARTUP_OWNER_SIGNATURE = "is_startup_owner(address,uint64)bool"
 
 # --------------------------------------------
 # Constants
@@ -15,12 +13,33 @@ class IStartupRegistry(Interface):
 STATUS_UPCOMING = Int(0)
 STATUS_ACTIVE = Int(1)
 STATUS_ENDED = Int(2)
-ERR_NOT_AUTHORIZED = Bytes("ERR_NOT_AUTHORIZED")
-ERR_COMPETITION_ACTIVE = Bytes("ERR_COMPETITION_ACTIVE")
-ERR_COMPETITION_NOT_ACTIVE = Bytes("ERR_COMPETITION_NOT_ACTIVE")
-ERR_COMPETITION_ENDED = Bytes("ERR_COMPETITION_ENDED")
-ERR_ALREADY_JOINED = Bytes("ERR_ALREADY_JOINED")
-ERR_INVALID_CALLER = Bytes("ERR_INVALID_CALLER")
+STATUS_CANCELLED = Int(3)
+ERR_NOT_AUTHORIZED = "ERR_NOT_AUTHORIZED"
+ERR_COMPETITION_ACTIVE = "ERR_COMPETITION_ACTIVE"
+ERR_COMPETITION_NOT_ACTIVE = "ERR_COMPETITION_NOT_ACTIVE"
+ERR_COMPETITION_ENDED = "ERR_COMPETITION_ENDED"
+ERR_ALREADY_JOINED = "ERR_ALREADY_JOINED"
+ERR_INVALID_CALLER = "ERR_INVALID_CALLER"
+ERR_INVALID_STATUS = "ERR_INVALID_STATUS"
+ERR_NOT_FINALIZED = "ERR_NOT_FINALIZED"
+
+# Ödül dağılımı: sıralamaya göre havuzdan yüzde pay
+NUM_WINNERS = Int(3)
+
+# Competition kutusundaki sabit alanların byte offset'leri
+# (name/description için 2+2 byte offset, ardından uint64 alanlar)
+COMP_START_TIME_OFFSET = Int(4)
+COMP_END_TIME_OFFSET = Int(12)
+COMP_STATUS_OFFSET = Int(20)
+COMP_PRIZE_POOL_OFFSET = Int(28)
+# Participant kutusu: startup_owner(32) joined_at(8) score(8) rank(8) reward_claimed(1)
+PART_OWNER_OFFSET = Int(0)
+PART_SCORE_OFFSET = Int(40)
+PART_RANK_OFFSET = Int(48)
+PART_CLAIMED_OFFSET = Int(56)
+# Results kutusu: 3 x uint64 sid, ardından rewards_distributed
+RES_DISTRIBUTED_OFFSET = Int(24)
+BOOL_TRUE_BYTE = Bytes("base16", "0x80")
 
 # --------------------------------------------
 # Veri Yapıları
@@ -60,11 +79,63 @@ app = Application("CompetitionApp", state=AppState())
 
 # Box Mappings
 competitions = BoxMapping(abi.Uint64, Competition)
-results_map = BoxMapping(abi.Uint64, Results)
+# Results ve Competition aynı uint64 anahtarını kullandığı için prefix ile ayrılır
+RESULTS_PREFIX = Bytes("r")
+results_map = BoxMapping(abi.Uint64, Results, prefix=RESULTS_PREFIX)
+# Startup başına katıldığı yarışmalar: "e" + itob(sid) -> ardışık uint64 cid listesi
+ENTRIES_PREFIX = Bytes("e")
+# Yarışma başına katılımcılar: "p" + itob(cid) -> katılım sırasına göre uint64 sid listesi
+ENTRANTS_PREFIX = Bytes("p")
 # Katılımcıları (p)articipant:(c)ompetition_id:(s)tartup_id anahtarıyla saklarız
 participants = BoxMapping(abi.Tuple2[abi.Uint64, abi.Uint64], Participant)
 
 
+# --------------------------------------------
+# Status
+# --------------------------------------------
+@Subroutine(TealType.uint64)
+def effective_status(cid: Expr) -> Expr:
+    # Durum start_time/end_time ve blok zamanından türetilir; kayıtlı status
+    # sadece ENDED (finalize) ve CANCELLED override'ları için kullanılır.
+    # Tüm tuple'ı decode etmek yerine sabit alanları kutudan doğrudan okuruz.
+    key = ScratchVar(TealType.bytes)
+    stored = ScratchVar(TealType.uint64)
+    return Seq(
+        key.store(Itob(cid)),
+        stored.store(Btoi(BoxExtract(key.load(), COMP_STATUS_OFFSET, Int(8)))),
+        If(Or(stored.load() == STATUS_CANCELLED, stored.load() == STATUS_ENDED))
+        .Then(stored.load())
+        .ElseIf(Global.latest_timestamp() < Btoi(BoxExtract(key.load(), COMP_START_TIME_OFFSET, Int(8))))
+        .Then(STATUS_UPCOMING)
+        .ElseIf(Global.latest_timestamp() < Btoi(BoxExtract(key.load(), COMP_END_TIME_OFFSET, Int(8))))
+        .Then(STATUS_ACTIVE)
+        .Else(STATUS_ENDED),
+    )
+
+
+@Subroutine(TealType.none)
+def append_u64(key: Expr, value: Expr) -> Expr:
+    # Kutu boyutu değişeceği için silinip büyütülmüş haliyle yeniden yazılır
+    existing = BoxGet(key)
+    return Seq(
+        existing,
+        If(existing.hasValue()).Then(
+            Seq(
+                Pop(BoxDelete(key)),
+                BoxPut(key, Concat(existing.value(), Itob(value))),
+            )
+        ).Else(BoxPut(key, Itob(value))),
+    )
+
+@Subroutine(TealType.uint64)
+def prize_for_rank(prize_pool: Expr, rank: Expr) -> Expr:
+    return Cond(
+        [rank == Int(1), prize_pool * Int(50) / Int(100)],
+        [rank == Int(2), prize_pool * Int(30) / Int(100)],
+        [rank == Int(3), prize_pool * Int(20) / Int(100)],
+    )
+
+
 # --------------------------------------------
 # Lifecycle & Admin
 # --------------------------------------------
@@ -75,7 +146,10 @@ def create(registry_app_id: abi.Application):
 
 @app.external
 def set_owner(new_owner: abi.Address):
-    return Assert(Txn.sender() == app.state.owner.get(), comment=ERR_NOT_AUTHORIZED), app.state.owner.set(new_owner.get())
+    return Seq(
+        Assert(Txn.sender() == app.state.owner.get(), comment=ERR_NOT_AUTHORIZED),
+        app.state.owner.set(new_owner.get()),
+    )
 
 @app.external(authorize=Authorize.only(app.state.owner))
 def create_competition(
@@ -91,23 +165,27 @@ def create_competition(
 ):
     cid = ScratchVar(TealType.uint64)
     comp = Competition()
+    status = abi.make(abi.Uint64)
+    prize_pool = abi.make(abi.Uint64)
     return Seq(
         Assert(start_time.get() < end_time.get(), comment="Invalid times"),
         # Ödül havuzu ödemesini doğrula
         Assert(prize_pool_payment.get().receiver() == Global.current_application_address()),
         
         cid.store(app.state.next_competition_id.get()),
+        status.set(STATUS_UPCOMING),
+        prize_pool.set(prize_pool_payment.get().amount()),
         comp.set(
             name,
             description,
             start_time,
             end_time,
-            abi.Uint64(STATUS_UPCOMING),
-            abi.Uint64(prize_pool_payment.get().amount()),
+            status,
+            prize_pool,
             max_participants,
             entry_fee
         ),
-        competitions[cid.load()].set(comp),
+        competitions[Itob(cid.load())].set(comp),
         app.state.next_competition_id.set(cid.load() + Int(1)),
         output.set(cid.load()),
     )
@@ -126,37 +204,51 @@ def join_competition(
     cid = competition_id.get()
     sid = startup_id.get()
     comp = Competition()
-    participant_key = abi.Tuple2[abi.Uint64, abi.Uint64]()
+    participant_key = abi.make(abi.Tuple2[abi.Uint64, abi.Uint64])
     
     is_owner = abi.Bool()
+    sender = abi.make(abi.Address)
+    joined_at = abi.make(abi.Uint64)
+    zero = abi.make(abi.Uint64)
+    claimed = abi.make(abi.Bool)
+    p = Participant()
+    entry_fee = abi.make(abi.Uint64)
 
     return Seq(
         # 1. Yarışma bilgilerini ve kurallarını kontrol et
         participant_key.set(competition_id, startup_id),
-        comp.decode(competitions[cid].get()),
-        Assert(comp.status.get() == STATUS_UPCOMING, comment="Competition already started or ended"),
-        Assert(entry_fee_payment.get().amount() == comp.entry_fee.get(), comment="Incorrect entry fee"),
+        sender.set(Txn.sender()),
+        comp.decode(competitions[competition_id].get()),
+        comp.entry_fee.store_into(entry_fee),
+        Assert(effective_status(cid) == STATUS_UPCOMING, comment="Competition already started or ended"),
+        Assert(entry_fee_payment.get().amount() == entry_fee.get(), comment="Incorrect entry fee"),
         Assert(entry_fee_payment.get().receiver() == app.state.owner.get(), comment="Fee must be paid to owner"),
         Assert(participants[participant_key].exists() == Int(0), comment=ERR_ALREADY_JOINED),
         
         # 2. Registry App'i arayarak startup sahibini doğrula (ENTEGRASYON!)
         InnerTxnBuilder.ExecuteMethodCall(
             app_id=app.state.registry_app_id.get(),
-            method_signature=IStartupRegistry.is_startup_owner.method_signature(),
-            args=[abi.Address(Txn.sender()), startup_id],
-            output_action=is_owner.decode,
+            method_signature=IS_STARTUP_OWNER_SIGNATURE,
+            args=[sender, startup_id],
         ),
+        # ABI dönüş değeri son log'dadır: 4 byte dönüş öneki + bool
+        is_owner.decode(Suffix(InnerTxn.last_log(), Int(4))),
         Assert(is_owner.get(), comment=ERR_INVALID_CALLER),
         
         # 3. Katılımcıyı kaydet
-        (p := Participant()).set(
-            abi.Address(Txn.sender()),
-            Global.latest_timestamp(),
-            abi.Uint64(0), # score
-            abi.Uint64(0), # rank
-            abi.Bool(False) # reward_claimed
+        joined_at.set(Global.latest_timestamp()),
+        zero.set(Int(0)),
+        claimed.set(False),
+        p.set(
+            sender,
+            joined_at,
+            zero, # score
+            zero, # rank
+            claimed, # reward_claimed
         ),
         participants[participant_key].set(p),
+        append_u64(Concat(ENTRIES_PREFIX, Itob(sid)), cid),
+        append_u64(Concat(ENTRANTS_PREFIX, Itob(cid)), sid),
         output.set(True)
     )
 
@@ -165,12 +257,13 @@ def join_competition(
 # --------------------------------------------
 @app.external(authorize=Authorize.only(app.state.owner))
 def update_status(competition_id: abi.Uint64, new_status: abi.Uint64, *, output: abi.Bool):
-    # Yarışma durumunu manuel başlatma/bitirme için
-    comp = Competition()
+    # Durum zamandan türetildiği için bu metot artık sadece override içindir:
+    # CANCELLED iptal eder, ENDED erken bitirir, UPCOMING/ACTIVE saate geri döner.
     return Seq(
-        comp.decode(competitions[competition_id.get()].get()),
-        comp.set_field(new_status, 4), # status alanı
-        competitions[competition_id.get()].set(comp),
+        Assert(new_status.get() <= STATUS_CANCELLED, comment=ERR_INVALID_STATUS),
+        Assert(competitions[competition_id].exists()),
+        # Tuple'ı decode/encode etmek yerine status alanı yerinde yazılır
+        BoxReplace(competition_id.encode(), COMP_STATUS_OFFSET, new_status.encode()),
         output.set(True)
     )
 
@@ -183,16 +276,50 @@ def update_participant_score(
     output: abi.Bool
 ):
     # Oracle veya admin tarafından çağrılacak skor güncelleme fonksiyonu
-    key = abi.Tuple2[abi.Uint64, abi.Uint64]()
-    p = Participant()
+    key = abi.make(abi.Tuple2[abi.Uint64, abi.Uint64])
     return Seq(
         key.set(competition_id, startup_id),
-        p.decode(participants[key].get()),
-        p.set_field(new_score, 2), # score alanı
-        participants[key].set(p),
+        Assert(participants[key].exists()),
+        BoxReplace(key.encode(), PART_SCORE_OFFSET, new_score.encode()), # score alanı
         output.set(True)
     )
 
+@app.external(authorize=Authorize.only(app.state.owner))
+def update_startup_score(startup_id: abi.Uint64, new_score: abi.Uint64, *, output: abi.Uint64):
+    # Tek skor yazımı, startup'ın devam eden tüm yarışmalarına dağıtılır.
+    # Bitmiş/iptal edilmiş yarışmalar indeksten temizlenir.
+    # Çağıran; "e" kutusunu, her yarışma kutusunu ve (cid, sid) kutularını referans vermelidir.
+    sid = startup_id.get()
+    key = ScratchVar(TealType.bytes)
+    i = ScratchVar(TealType.uint64)
+    cid = ScratchVar(TealType.uint64)
+    status = ScratchVar(TealType.uint64)
+    kept = ScratchVar(TealType.bytes)
+    updated = ScratchVar(TealType.uint64)
+
+    return Seq(
+        key.store(Concat(ENTRIES_PREFIX, Itob(sid))),
+        entries := BoxGet(key.load()),
+        kept.store(Bytes("")),
+        updated.store(Int(0)),
+        If(entries.hasValue()).Then(Seq(
+            For(i.store(Int(0)), i.load() < Len(entries.value()), i.store(i.load() + Int(8))).Do(
+                cid.store(ExtractUint64(entries.value(), i.load())),
+                status.store(effective_status(cid.load())),
+                If(Or(status.load() == STATUS_UPCOMING, status.load() == STATUS_ACTIVE)).Then(Seq(
+                    BoxReplace(Concat(Itob(cid.load()), Itob(sid)), PART_SCORE_OFFSET, Itob(new_score.get())),
+                    kept.store(Concat(kept.load(), Itob(cid.load()))),
+                    updated.store(updated.load() + Int(1)),
+                )),
+            ),
+            If(Len(kept.load()) != Len(entries.value())).Then(Seq(
+                Pop(BoxDelete(key.load())),
+                If(Len(kept.load()) > Int(0)).Then(BoxPut(key.load(), kept.load())),
+            )),
+        )),
+        output.set(updated.load()),
+    )
+
 @app.external(authorize=Authorize.only(app.state.owner))
 def finalize_competition(
     competition_id: abi.Uint64,
@@ -204,35 +331,40 @@ def finalize_competition(
 ):
     # Off-chain'de belirlenen kazananları on-chain'e kaydeder
     cid = competition_id.get()
-    comp = Competition()
-    key1, key2, key3 = (abi.Tuple2[abi.Uint64, abi.Uint64]() for _ in range(3))
-    p1, p2, p3 = (Participant() for _ in range(3))
+    key1, key2, key3 = (abi.make(abi.Tuple2[abi.Uint64, abi.Uint64]) for _ in range(3))
+    distributed = abi.make(abi.Bool)
+    res = Results()
+    status = ScratchVar(TealType.uint64)
 
     return Seq(
-        comp.decode(competitions[cid].get()),
-        Assert(comp.status.get() == STATUS_ACTIVE, comment=ERR_COMPETITION_NOT_ACTIVE),
+        Assert(competitions[competition_id].exists()),
+        # Finalize bayrağı results kutusunun varlığıdır; status ENDED olması
+        # (update_status ile erken bitirme veya bitiş zamanı) finalize'ı engellemez.
+        Assert(Not(results_map[competition_id].exists()), comment=ERR_COMPETITION_ENDED),
+        status.store(effective_status(cid)),
+        Assert(
+            Or(status.load() == STATUS_ACTIVE, status.load() == STATUS_ENDED),
+            comment=ERR_COMPETITION_NOT_ACTIVE,
+        ),
 
         # Kazananların rank'larını güncelle
         key1.set(competition_id, winner_sid),
-        p1.decode(participants[key1].get()),
-        p1.set_field(abi.Uint64(1), 3),
-        participants[key1].set(p1),
+        Assert(participants[key1].exists()),
+        BoxReplace(key1.encode(), PART_RANK_OFFSET, Itob(Int(1))),
         
         key2.set(competition_id, second_sid),
-        p2.decode(participants[key2].get()),
-        p2.set_field(abi.Uint64(2), 3),
-        participants[key2].set(p2),
+        Assert(participants[key2].exists()),
+        BoxReplace(key2.encode(), PART_RANK_OFFSET, Itob(Int(2))),
         
         key3.set(competition_id, third_sid),
-        p3.decode(participants[key3].get()),
-        p3.set_field(abi.Uint64(3), 3),
-        participants[key3].set(p3),
+        Assert(participants[key3].exists()),
+        BoxReplace(key3.encode(), PART_RANK_OFFSET, Itob(Int(3))),
 
         # Sonuçları kaydet ve yarışmayı bitir
-        (res := Results()).set(winner_sid, second_sid, third_sid, abi.Bool(False)),
-        results_map[cid].set(res),
-        comp.set_field(abi.Uint64(STATUS_ENDED), 4),
-        competitions[cid].set(comp),
+        distributed.set(False),
+        res.set(winner_sid, second_sid, third_sid, distributed),
+        results_map[competition_id].set(res),
+        BoxReplace(competition_id.encode(), COMP_STATUS_OFFSET, Itob(STATUS_ENDED)),
 
         output.set(True)
     )
@@ -242,48 +374,216 @@ def claim_reward(competition_id: abi.Uint64, startup_id: abi.Uint64, *, output:
     # Kazananlar ödüllerini talep eder
     cid = competition_id.get()
     sid = startup_id.get()
-    key = abi.Tuple2[abi.Uint64, abi.Uint64]()
+    key = abi.make(abi.Tuple2[abi.Uint64, abi.Uint64])
     p = Participant()
     comp = Competition()
-    
+    claimed = abi.make(abi.Bool)
+    rank = abi.make(abi.Uint64)
+    owner = abi.make(abi.Address)
+    prize_pool = abi.make(abi.Uint64)
+
     prize = ScratchVar(TealType.uint64)
 
     return Seq(
         key.set(competition_id, startup_id),
         p.decode(participants[key].get()),
-        comp.decode(competitions[cid].get()),
-        
-        Assert(comp.status.get() == STATUS_ENDED, comment="Competition not ended"),
-        Assert(Not(p.reward_claimed.get()), comment="Reward already claimed"),
-        Assert(p.rank.get() > Int(0) and p.rank.get() <= Int(3), comment="Not a winner"),
+        comp.decode(competitions[competition_id].get()),
+        p.reward_claimed.store_into(claimed),
+        p.rank.store_into(rank),
+        p.startup_owner.store_into(owner),
+        comp.total_prize_pool.store_into(prize_pool),
+
+        Assert(effective_status(cid) == STATUS_ENDED, comment="Competition not ended"),
+        Assert(Not(claimed.get()), comment="Reward already claimed"),
+        Assert(And(rank.get() > Int(0), rank.get() <= Int(3)), comment="Not a winner"),
 
         # Ödülü hesapla
-        prize.store(
-            Cond(
-                [p.rank.get() == Int(1), comp.total_prize_pool.get() * Int(50) / Int(100)],
-                [p.rank.get() == Int(2), comp.total_prize_pool.get() * Int(30) / Int(100)],
-                [p.rank.get() == Int(3), comp.total_prize_pool.get() * Int(20) / Int(100)],
-            )
-        ),
+        prize.store(prize_for_rank(prize_pool.get(), rank.get())),
 
         # Ödemeyi yap
         InnerTxnBuilder.Execute({
             TxnField.type_enum: TxnType.Payment,
-            TxnField.receiver: p.startup_owner.get(),
+            TxnField.receiver: owner.get(),
             TxnField.amount: prize.load(),
         }),
 
         # Durumu güncelle
-        p.set_field(abi.Bool(True), 4),
-        participants[key].set(p),
+        BoxReplace(key.encode(), PART_CLAIMED_OFFSET, BOOL_TRUE_BYTE),
         
         output.set(prize.load())
     )
 
+@app.external(authorize=Authorize.only(app.state.owner))
+def distribute_rewards(competition_id: abi.Uint64, *, output: abi.Uint64):
+    # Kazananlara tek tek claim_reward yerine owner tarafından toplu ödeme:
+    # NUM_WINNERS (3) sıranın hepsi tek çağrıda ödenir.
+    # Inner payment ücretleri 0'dır; dış işlem fee pooling ile karşılar
+    # (dış fee >= (NUM_WINNERS + 1) * min_fee).
+    cid = competition_id.get()
+    results_key = ScratchVar(TealType.bytes)
+    prize_pool = ScratchVar(TealType.uint64)
+    i = ScratchVar(TealType.uint64)
+    pkey = ScratchVar(TealType.bytes)
+    prize = ScratchVar(TealType.uint64)
+    total_paid = ScratchVar(TealType.uint64)
+
+    return Seq(
+        Assert(effective_status(cid) == STATUS_ENDED, comment="Competition not ended"),
+        results_key.store(Concat(RESULTS_PREFIX, Itob(cid))),
+        results_len := BoxLen(results_key.load()),
+        Assert(results_len.hasValue(), comment=ERR_NOT_FINALIZED),
+        Assert(
+            GetBit(BoxExtract(results_key.load(), RES_DISTRIBUTED_OFFSET, Int(1)), Int(0)) == Int(0),
+            comment="Rewards already distributed",
+        ),
+        prize_pool.store(Btoi(BoxExtract(Itob(cid), COMP_PRIZE_POOL_OFFSET, Int(8)))),
+        total_paid.store(Int(0)),
+
+        For(i.store(Int(0)), i.load() < NUM_WINNERS, i.store(i.load() + Int(1))).Do(
+            # Results içindeki i. sıradaki sid -> Participant anahtarı (cid, sid)
+            pkey.store(Concat(Itob(cid), BoxExtract(results_key.load(), i.load() * Int(8), Int(8)))),
+            # claim_reward ile zaten almış olanları atla
+            If(GetBit(BoxExtract(pkey.load(), PART_CLAIMED_OFFSET, Int(1)), Int(0)) == Int(0)).Then(Seq(
+                prize.store(prize_for_rank(prize_pool.load(), i.load() + Int(1))),
+                InnerTxnBuilder.Execute({
+                    TxnField.type_enum: TxnType.Payment,
+                    TxnField.receiver: BoxExtract(pkey.load(), PART_OWNER_OFFSET, Int(32)),
+                    TxnField.amount: prize.load(),
+                    TxnField.fee: Int(0),
+                }),
+                BoxReplace(pkey.load(), PART_CLAIMED_OFFSET, BOOL_TRUE_BYTE),
+                total_paid.store(total_paid.load() + prize.load()),
+            )),
+        ),
+
+        BoxReplace(results_key.load(), RES_DISTRIBUTED_OFFSET, BOOL_TRUE_BYTE),
+        output.set(total_paid.load()),
+    )
+
 # --------------------------------------------
 # Read-only Methods
 # --------------------------------------------
 @app.external(read_only=True)
-def get_competition(competition_id: abi.Uint64, *, output: Competition): ...
+def get_competition(competition_id: abi.Uint64, *, output: Competition):
+    # status alanı kayıtlı değer yerine zamandan türetilen durumla döner
+    cid = competition_id.get()
+    return output.decode(
+        Replace(competitions[competition_id].get(), COMP_STATUS_OFFSET, Itob(effective_status(cid)))
+    )
+
+@app.external(read_only=True)
+def get_participant(competition_id: abi.Uint64, startup_id: abi.Uint64, *, output: Participant):
+    key = abi.make(abi.Tuple2[abi.Uint64, abi.Uint64])
+    return Seq(
+        key.set(competition_id, startup_id),
+        output.decode(participants[key].get()),
+    )
+
 @app.external(read_only=True)
-def get_participant(competition_id: abi.Uint64, startup_id: abi.Uint64, *, output: Participant): ...
\ No newline at end of file
+def get_competition_leaderboard(
+    competition_id: abi.Uint64,
+    offset: abi.Uint64,
+    n: abi.Uint64,
+    *,
+    output: abi.DynamicArray[abi.Tuple3[abi.Uint64, abi.Uint64, abi.Uint64]]
+):
+    # Skora göre azalan sıralı (sid, score, rank) sayfası. Eşit skorlar aynı rank'i alır.
+    # Simulate ile (allow_unnamed_resources + extra opcode budget) çağrılmak içindir;
+    # tüm katılımcı kutuları okunup 16 byte'lık (score | sid) kayıtlar insertion sort ile sıralanır.
+    cid = competition_id.get()
+    i = ScratchVar(TealType.uint64)
+    j = ScratchVar(TealType.uint64)
+    count = ScratchVar(TealType.uint64)
+    records = ScratchVar(TealType.bytes)
+    page = ScratchVar(TealType.bytes)
+    end = ScratchVar(TealType.uint64)
+    rank = ScratchVar(TealType.uint64)
+    prev_score = ScratchVar(TealType.uint64)
+    sid = ScratchVar(TealType.uint64)
+    score = ScratchVar(TealType.uint64)
+
+    return Seq(
+        entrants := BoxGet(Concat(ENTRANTS_PREFIX, Itob(cid))),
+        records.store(Bytes("")),
+        If(entrants.hasValue()).Then(
+            For(i.store(Int(0)), i.load() < Len(entrants.value()), i.store(i.load() + Int(8))).Do(
+                sid.store(ExtractUint64(entrants.value(), i.load())),
+                score.store(Btoi(BoxExtract(Concat(Itob(cid), Itob(sid.load())), PART_SCORE_OFFSET, Int(8)))),
+                records.store(Concat(records.load(), Itob(score.load()), Itob(sid.load()))),
+            )
+        ),
+        count.store(Len(records.load()) / Int(16)),
+
+        # insertion sort (azalan skor, eşitlikte katılım sırası korunur)
+        For(i.store(Int(1)), i.load() < count.load(), i.store(i.load() + Int(1))).Do(
+            j.store(i.load()),
+            While(j.load() > Int(0)).Do(
+                If(
+                    ExtractUint64(records.load(), (j.load() - Int(1)) * Int(16))
+                    < ExtractUint64(records.load(), j.load() * Int(16))
+                ).Then(Seq(
+                    page.store(Extract(records.load(), (j.load() - Int(1)) * Int(16), Int(16))),
+                    records.store(Replace(
+                        records.load(),
+                        (j.load() - Int(1)) * Int(16),
+                        Extract(records.load(), j.load() * Int(16), Int(16)),
+                    )),
+                    records.store(Replace(records.load(), j.load() * Int(16), page.load())),
+                    j.store(j.load() - Int(1)),
+                )).Else(j.store(Int(0))),
+            ),
+        ),
+
+        end.store(offset.get() + n.get()),
+        If(end.load() > count.load()).Then(end.store(count.load())),
+        page.store(Bytes("")),
+        rank.store(Int(0)),
+        prev_score.store(Int(0)),
+        # rank'ler sayfanın başından değil, listenin başından hesaplanır
+        For(i.store(Int(0)), i.load() < end.load(), i.store(i.load() + Int(1))).Do(
+            score.store(ExtractUint64(records.load(), i.load() * Int(16))),
+            If(Or(i.load() == Int(0), score.load() != prev_score.load())).Then(rank.store(i.load() + Int(1))),
+            prev_score.store(score.load()),
+            If(i.load() >= offset.get()).Then(
+                page.store(Concat(
+                    page.load(),
+                    Extract(records.load(), i.load() * Int(16) + Int(8), Int(8)),
+                    Itob(score.load()),
+                    Itob(rank.load()),
+                ))
+            ),
+        ),
+        output.decode(Concat(Suffix(Itob(Len(page.load()) / Int(24)), Int(6)), page.load())),
+    )
+
+@app.external(read_only=True)
+def get_startup_entries(startup_id: abi.Uint64, *, output: abi.DynamicArray[abi.Uint64]):
+    # Startup'ın indeksteki yarışma id'leri (bitmiş olanlar bir sonraki skor yazımında temizlenir)
+    key = ScratchVar(TealType.bytes)
+    return Seq(
+        key.store(Concat(ENTRIES_PREFIX, Itob(startup_id.get()))),
+        entries := BoxGet(key.load()),
+        If(entries.hasValue())
+        .Then(output.decode(Concat(Suffix(Itob(Len(entries.value()) / Int(8)), Int(6)), entries.value())))
+        .Else(output.decode(Bytes("base16", "0x0000"))),
+    )
+
+@app.external(read_only=True)
+def get_effective_status_batch(
+    competition_ids: abi.DynamicArray[abi.Uint64],
+    *,
+    output: abi.DynamicArray[abi.Uint64]
+):
+    # Dashboard'lar için: tek çağrıda birden çok yarışmanın güncel durumu
+    i = ScratchVar(TealType.uint64)
+    statuses = ScratchVar(TealType.bytes)
+    cid = abi.Uint64()
+    return Seq(
+        statuses.store(Bytes("")),
+        For(i.store(Int(0)), i.load() < competition_ids.length(), i.store(i.load() + Int(1))).Do(
+            competition_ids[i.load()].store_into(cid),
+            statuses.store(Concat(statuses.load(), Itob(effective_status(cid.get())))),
+        ),
+        # uint64[] kodlaması: 2 byte uzunluk + 8 byte'lık elemanlar
+        output.decode(Concat(Suffix(Itob(competition_ids.length()), Int(6)), statuses.load())),
+    )
\ No newline at end of file
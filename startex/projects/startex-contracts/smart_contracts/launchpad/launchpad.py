@@ -2,6 +2,46 @@
 from beaker import *
 from pyteal import *
 
+SALE_MODE_FIXED = Int(0)     # buy_tokens ile anında satış
+SALE_MODE_AUCTION = Int(1)   # commit + toplu settlement, tek fiyattan pro-rata dağıtım
+
+# Alıcı taahhütleri: "c" + adres -> uint64 toplam taahhüt (microAlgo)
+COMMIT_PREFIX = Bytes("c")
+# Settlement'ta teslim edilemeyen taahhütler (opt-out, dondurulmuş veya kapanmış hesap):
+# "u" + adres -> uint64 taahhüt; alıcı payını claim_settlement ile kendisi çeker
+UNCLAIMED_PREFIX = Bytes("u")
+
+# Alıcı kayıtları: "b" + adres -> tokens_bought(8) | paid_microalgos(8)
+BUYER_PREFIX = Bytes("b")
+# Alıcı listesi sayfaları: "l" + itob(sayfa) -> 32 x 32 byte adres (katılım sırasıyla).
+# Sayfa 1KB'tır, yani tek kutu referansının I/O bütçesine sığar: yeni alıcı
+# kayıt + sayfa için 2, tekrar alan alıcı sadece kayıt için 1 referans kullanır.
+BUYER_PAGE_PREFIX = Bytes("l")
+BUYERS_PER_PAGE = Int(32)
+BUYER_PAGE_SIZE = Int(32 * 32)
+# Kutu MBR'ı (2500 + 400 * (anahtar + değer) microAlgo) alıcının ödemesinden
+# kesilir ve total_raised_microalgos'a sayılmaz: yeni alıcı kendi kaydını,
+# yeni sayfa açan alıcı ayrıca sayfayı öder.
+BUYER_RECORD_MBR = Int(2500 + 400 * (1 + 32 + 16))
+BUYER_PAGE_MBR = Int(2500 + 400 * (1 + 8 + 32 * 32))
+
+# Fiyat eğrisi (price_curve global'inde paketli):
+#   start_price(8) | floor_price(8) | [min_tokens(8) | discount_bps(8)] * tier sayısı
+# Fiyat satış penceresi boyunca start_price'tan floor_price'a doğrusal düşer (Dutch),
+# alınan miktar bir tier eşiğini geçerse o tier'ın indirimi uygulanır.
+# Aynı hesabın Python karşılığı: smart_contracts/launchpad/pricing.py
+MAX_PRICE_TIERS = Int(4)
+PRICE_TIER_SIZE = Int(16)
+BPS_DENOMINATOR = Int(10000)
+
+class SaleState(abi.NamedTuple):
+    price: abi.Field[abi.Uint64]
+    sale_start_time: abi.Field[abi.Uint64]
+    sale_end_time: abi.Field[abi.Uint64]
+    tokens_remaining: abi.Field[abi.Uint64]
+    total_raised_microalgos: abi.Field[abi.Uint64]
+    is_sale_active: abi.Field[abi.Bool]
+
 class LaunchpadState:
     startup_owner = GlobalStateValue(TealType.bytes)
     token_id = GlobalStateValue(TealType.uint64)
@@ -10,6 +50,15 @@ class LaunchpadState:
     sale_end_time = GlobalStateValue(TealType.uint64)
     total_raised_microalgos = GlobalStateValue(TealType.uint64, default=Int(0))
     is_sale_active = GlobalStateValue(TealType.uint64, default=Int(0))
+    tokens_remaining = GlobalStateValue(TealType.uint64, default=Int(0))
+    buyer_count = GlobalStateValue(TealType.uint64, default=Int(0))
+    min_allocation_tokens = GlobalStateValue(TealType.uint64, default=Int(0))
+    max_allocation_tokens = GlobalStateValue(TealType.uint64, default=Int(0))  # 0: limitsiz
+    sale_mode = GlobalStateValue(TealType.uint64, default=Int(0))
+    total_committed_microalgos = GlobalStateValue(TealType.uint64, default=Int(0))
+    unsettled_microalgos = GlobalStateValue(TealType.uint64, default=Int(0))
+    auction_supply = GlobalStateValue(TealType.uint64, default=Int(0))
+    price_curve = GlobalStateValue(TealType.bytes, default=Bytes(""))
 
 app = Application("LaunchpadApp", state=LaunchpadState())
 
@@ -17,7 +66,7 @@ app = Application("LaunchpadApp", state=LaunchpadState())
 def create():
     return Approve()
 
-@app.external(method_config={"bare": True})
+@app.external
 def setup(owner: abi.Address, token_id: abi.Uint64):
     return Seq(
         Assert(Txn.sender() == Global.creator_address(), comment="Only factory can call setup"),
@@ -36,16 +85,124 @@ def set_sale_parameters(
     return Seq(
         Assert(Txn.sender() == app.state.startup_owner.get(), comment="Only owner"),
         Assert(start_time.get() < end_time.get(), comment="Invalid times"),
+        # Fiyat 0 olursa açık artırma payı sıfıra bölünür ve taahhütler kilitlenir
+        Assert(price.get() > Int(0), comment="Price must be positive"),
         app.state.token_price_microalgos.set(price.get()),
         app.state.sale_start_time.set(start_time.get()),
         app.state.sale_end_time.set(end_time.get()),
         output.set(True)
     )
 
+@Subroutine(TealType.uint64)
+def current_unit_price() -> Expr:
+    # Eğri yoksa sabit token_price_microalgos kullanılır
+    curve = app.state.price_curve.get()
+    start_price = ExtractUint64(curve, Int(0))
+    floor_price = ExtractUint64(curve, Int(8))
+    elapsed = ScratchVar(TealType.uint64)
+    duration = app.state.sale_end_time.get() - app.state.sale_start_time.get()
+    return Seq(
+        If(Len(curve) == Int(0)).Then(Return(app.state.token_price_microalgos.get())),
+        elapsed.store(
+            If(Global.latest_timestamp() <= app.state.sale_start_time.get())
+            .Then(Int(0))
+            .ElseIf(Global.latest_timestamp() >= app.state.sale_end_time.get())
+            .Then(duration)
+            .Else(Global.latest_timestamp() - app.state.sale_start_time.get())
+        ),
+        start_price - WideRatio([start_price - floor_price, elapsed.load()], [duration]),
+    )
+
+@Subroutine(TealType.uint64)
+def tier_discount_bps(base_tokens: Expr) -> Expr:
+    # Eşikler artan sırada; geçilen en yüksek eşiğin indirimi geçerlidir
+    curve = app.state.price_curve.get()
+    offset = ScratchVar(TealType.uint64)
+    bps = ScratchVar(TealType.uint64)
+    return Seq(
+        bps.store(Int(0)),
+        For(offset.store(Int(16)), offset.load() < Len(curve), offset.store(offset.load() + PRICE_TIER_SIZE)).Do(
+            If(base_tokens >= ExtractUint64(curve, offset.load())).Then(
+                bps.store(ExtractUint64(curve, offset.load() + Int(8)))
+            )
+        ),
+        bps.load(),
+    )
+
+@Subroutine(TealType.none)
+def add_buyer(buyer: Expr) -> Expr:
+    # Yeni alıcıyı sayfalı listeye ekler; sayfa dolunca yenisi açılır
+    index = app.state.buyer_count.get()
+    page_key = ScratchVar(TealType.bytes)
+    return Seq(
+        page_key.store(Concat(BUYER_PAGE_PREFIX, Itob(index / BUYERS_PER_PAGE))),
+        If(index % BUYERS_PER_PAGE == Int(0)).Then(Pop(BoxCreate(page_key.load(), BUYER_PAGE_SIZE))),
+        BoxReplace(page_key.load(), (index % BUYERS_PER_PAGE) * Int(32), buyer),
+        app.state.buyer_count.set(index + Int(1)),
+    )
+
+@app.external
+def set_allocation_limits(min_tokens: abi.Uint64, max_tokens: abi.Uint64, *, output: abi.Bool):
+    # min: tek alımda en az token, max: alıcı başına toplam üst sınır (0 = limitsiz)
+    return Seq(
+        Assert(Txn.sender() == app.state.startup_owner.get(), comment="Only owner"),
+        Assert(app.state.is_sale_active.get() == Int(0), comment="Sale already active"),
+        Assert(Or(max_tokens.get() == Int(0), min_tokens.get() <= max_tokens.get()), comment="Invalid limits"),
+        app.state.min_allocation_tokens.set(min_tokens.get()),
+        app.state.max_allocation_tokens.set(max_tokens.get()),
+        output.set(True)
+    )
+
+@app.external
+def set_price_curve(
+    start_price: abi.Uint64,
+    floor_price: abi.Uint64,
+    tiers: abi.DynamicArray[abi.Tuple2[abi.Uint64, abi.Uint64]],  # (min_tokens, discount_bps)
+    *,
+    output: abi.Bool
+):
+    i = ScratchVar(TealType.uint64)
+    tier = abi.make(abi.Tuple2[abi.Uint64, abi.Uint64])
+    min_tokens = abi.Uint64()
+    discount_bps = abi.Uint64()
+    prev_min = ScratchVar(TealType.uint64)
+    return Seq(
+        Assert(Txn.sender() == app.state.startup_owner.get(), comment="Only owner"),
+        Assert(app.state.is_sale_active.get() == Int(0), comment="Sale already active"),
+        Assert(floor_price.get() > Int(0), comment="Invalid price"),
+        Assert(floor_price.get() <= start_price.get(), comment="Invalid price"),
+        Assert(tiers.length() <= MAX_PRICE_TIERS, comment="Too many tiers"),
+        prev_min.store(Int(0)),
+        For(i.store(Int(0)), i.load() < tiers.length(), i.store(i.load() + Int(1))).Do(
+            tiers[i.load()].store_into(tier),
+            tier[0].store_into(min_tokens),
+            tier[1].store_into(discount_bps),
+            Assert(min_tokens.get() > prev_min.load(), comment="Tiers must be ascending"),
+            Assert(discount_bps.get() < BPS_DENOMINATOR, comment="Invalid discount"),
+            prev_min.store(min_tokens.get()),
+        ),
+        # uint16 uzunluk önekini atıp statik tuple'ları olduğu gibi sakla
+        app.state.price_curve.set(
+            Concat(Itob(start_price.get()), Itob(floor_price.get()), Suffix(tiers.encode(), Int(2)))
+        ),
+        output.set(True)
+    )
+
+@app.external
+def set_sale_mode(mode: abi.Uint64, *, output: abi.Bool):
+    return Seq(
+        Assert(Txn.sender() == app.state.startup_owner.get(), comment="Only owner"),
+        Assert(app.state.is_sale_active.get() == Int(0), comment="Sale already active"),
+        Assert(mode.get() <= SALE_MODE_AUCTION, comment="Invalid sale mode"),
+        app.state.sale_mode.set(mode.get()),
+        output.set(True)
+    )
+
 @app.external
 def activate_sale(*, output: abi.Bool):
     return Seq(
         Assert(Txn.sender() == app.state.startup_owner.get(), comment="Only owner"),
+        Assert(app.state.token_price_microalgos.get() > Int(0), comment="Sale parameters not set"),
         app.state.is_sale_active.set(Int(1)),
         output.set(True)
     )
@@ -71,35 +228,237 @@ def fund(axfer: abi.AssetTransferTransaction, *, output: abi.Bool):
         Assert(Txn.sender() == app.state.startup_owner.get(), comment="Only owner"),
         Assert(axfer.get().xfer_asset() == app.state.token_id.get()),
         Assert(axfer.get().asset_receiver() == Global.current_application_address()),
+        # Stok global state'te tutulur; satışlarda AssetHolding okumaya gerek kalmaz
+        app.state.tokens_remaining.set(app.state.tokens_remaining.get() + axfer.get().asset_amount()),
         output.set(True)
     )
 
 @app.external
 def buy_tokens(payment: abi.PaymentTransaction, *, output: abi.Uint64):
-    token_price = app.state.token_price_microalgos.get()
-    tokens_to_buy = payment.get().amount() / token_price
-    
+    # Ödeme tutarı fiyatın tam katı olmak zorunda değil: alınabilen token
+    # sayısı hesaplanır, artan ALGO aynı çağrıda iade edilir. İlk alımda
+    # ödemenin bir kısmı kutu MBR'ıdır (bkz. BUYER_RECORD_MBR).
+    unit_price = ScratchVar(TealType.uint64)
+    effective_price = ScratchVar(TealType.uint64)
+    tokens_to_buy = ScratchVar(TealType.uint64)
+    cost = ScratchVar(TealType.uint64)
+    record_key = ScratchVar(TealType.bytes)
+    bought_before = ScratchVar(TealType.uint64)
+    paid_before = ScratchVar(TealType.uint64)
+    mbr = ScratchVar(TealType.uint64)
+    spend = ScratchVar(TealType.uint64)
+
     return Seq(
         Assert(app.state.is_sale_active.get() == Int(1), comment="Sale not active"),
+        Assert(app.state.sale_mode.get() == SALE_MODE_FIXED, comment="Sale is in auction mode"),
         Assert(Global.latest_timestamp() >= app.state.sale_start_time.get(), comment="Sale not started"),
         Assert(Global.latest_timestamp() < app.state.sale_end_time.get(), comment="Sale ended"),
         Assert(payment.get().receiver() == Global.current_application_address(), comment="Invalid receiver"),
-        Assert(payment.get().amount() % token_price == Int(0), comment="Invalid payment amount"),
+
+        # Alıcı başına limitler: tek kutu okuması ile kümülatif alım kontrolü
+        record_key.store(Concat(BUYER_PREFIX, payment.get().sender())),
+        record := BoxGet(record_key.load()),
+        If(record.hasValue()).Then(Seq(
+            bought_before.store(ExtractUint64(record.value(), Int(0))),
+            paid_before.store(ExtractUint64(record.value(), Int(8))),
+            mbr.store(Int(0)),
+        )).Else(Seq(
+            bought_before.store(Int(0)),
+            paid_before.store(Int(0)),
+            mbr.store(
+                BUYER_RECORD_MBR
+                + If(app.state.buyer_count.get() % BUYERS_PER_PAGE == Int(0)).Then(BUYER_PAGE_MBR).Else(Int(0))
+            ),
+            add_buyer(payment.get().sender()),
+        )),
+        Assert(payment.get().amount() > mbr.load(), comment="Payment does not cover box MBR"),
+        spend.store(payment.get().amount() - mbr.load()),
+
+        # Fiyat: Dutch eğrisi + hacim tier indirimi
+        unit_price.store(current_unit_price()),
+        effective_price.store(
+            unit_price.load()
+            * (BPS_DENOMINATOR - tier_discount_bps(spend.load() / unit_price.load()))
+            / BPS_DENOMINATOR
+        ),
+        If(effective_price.load() == Int(0)).Then(effective_price.store(Int(1))),
+        tokens_to_buy.store(spend.load() / effective_price.load()),
+        Assert(tokens_to_buy.load() > Int(0), comment="Invalid payment amount"),
+        cost.store(tokens_to_buy.load() * effective_price.load()),
+
+        Assert(tokens_to_buy.load() >= app.state.min_allocation_tokens.get(), comment="Below minimum allocation"),
+        Assert(
+            Or(
+                app.state.max_allocation_tokens.get() == Int(0),
+                bought_before.load() + tokens_to_buy.load() <= app.state.max_allocation_tokens.get(),
+            ),
+            comment="Above maximum allocation",
+        ),
+        BoxPut(
+            record_key.load(),
+            Concat(Itob(bought_before.load() + tokens_to_buy.load()), Itob(paid_before.load() + cost.load())),
+        ),
 
         # Kontratın bakiyesinde yeterli token var mı kontrolü
-        token_balance := AssetHolding.balance(Global.current_application_address(), app.state.token_id.get()),
-        Assert(token_balance.value() >= tokens_to_buy, comment="Not enough tokens in contract"),
+        Assert(app.state.tokens_remaining.get() >= tokens_to_buy.load(), comment="Not enough tokens in contract"),
+        app.state.tokens_remaining.set(app.state.tokens_remaining.get() - tokens_to_buy.load()),
 
         # Token'ları alıcıya gönder
         InnerTxnBuilder.Execute({
             TxnField.type_enum: TxnType.AssetTransfer,
             TxnField.xfer_asset: app.state.token_id.get(),
             TxnField.asset_receiver: payment.get().sender(),
-            TxnField.asset_amount: tokens_to_buy,
+            TxnField.asset_amount: tokens_to_buy.load(),
         }),
+        # Artanı iade et
+        If(spend.load() > cost.load()).Then(InnerTxnBuilder.Execute({
+            TxnField.type_enum: TxnType.Payment,
+            TxnField.receiver: payment.get().sender(),
+            TxnField.amount: spend.load() - cost.load(),
+        })),
 
-        app.state.total_raised_microalgos.set(app.state.total_raised_microalgos.get() + payment.get().amount()),
-        output.set(tokens_to_buy)
+        app.state.total_raised_microalgos.set(app.state.total_raised_microalgos.get() + cost.load()),
+        output.set(tokens_to_buy.load())
+    )
+
+@app.external
+def commit(payment: abi.PaymentTransaction, *, output: abi.Uint64):
+    # Auction modunda alıcılar pencere boyunca sadece ALGO taahhüt eder;
+    # token transferi ve iade settle_commitments ile toplu yapılır.
+    key = ScratchVar(TealType.bytes)
+    total = ScratchVar(TealType.uint64)
+    return Seq(
+        Assert(app.state.is_sale_active.get() == Int(1), comment="Sale not active"),
+        Assert(app.state.sale_mode.get() == SALE_MODE_AUCTION, comment="Sale not in auction mode"),
+        Assert(Global.latest_timestamp() >= app.state.sale_start_time.get(), comment="Sale not started"),
+        Assert(Global.latest_timestamp() < app.state.sale_end_time.get(), comment="Sale ended"),
+        Assert(payment.get().receiver() == Global.current_application_address(), comment="Invalid receiver"),
+        Assert(payment.get().amount() >= app.state.token_price_microalgos.get(), comment="Invalid payment amount"),
+
+        key.store(Concat(COMMIT_PREFIX, payment.get().sender())),
+        existing := BoxGet(key.load()),
+        total.store(
+            If(existing.hasValue()).Then(Btoi(existing.value()) + payment.get().amount()).Else(payment.get().amount())
+        ),
+        BoxPut(key.load(), Itob(total.load())),
+
+        app.state.total_committed_microalgos.set(app.state.total_committed_microalgos.get() + payment.get().amount()),
+        app.state.unsettled_microalgos.set(app.state.unsettled_microalgos.get() + payment.get().amount()),
+        output.set(total.load())
+    )
+
+@Subroutine(TealType.uint64)
+def auction_tokens(committed: Expr) -> Expr:
+    # Tüm taahhütler aynı fiyattan (token_price_microalgos) karşılanır; talep
+    # arzı aşarsa token'lar taahhüt oranında (pro-rata) bölünür.
+    token_price = app.state.token_price_microalgos.get()
+    return (
+        If(app.state.total_committed_microalgos.get() / token_price <= app.state.auction_supply.get())
+        .Then(committed / token_price)
+        .Else(WideRatio(
+            [committed, app.state.auction_supply.get()],
+            [app.state.total_committed_microalgos.get()],
+        ))
+    )
+
+@Subroutine(TealType.none)
+def send_allocation(buyer: Expr, tokens: Expr, refund: Expr) -> Expr:
+    # Inner işlem ücretleri 0'dır, dış işlem fee pooling ile öder
+    return Seq(
+        If(tokens > Int(0)).Then(InnerTxnBuilder.Execute({
+            TxnField.type_enum: TxnType.AssetTransfer,
+            TxnField.xfer_asset: app.state.token_id.get(),
+            TxnField.asset_receiver: buyer,
+            TxnField.asset_amount: tokens,
+            TxnField.fee: Int(0),
+        })),
+        If(refund > Int(0)).Then(InnerTxnBuilder.Execute({
+            TxnField.type_enum: TxnType.Payment,
+            TxnField.receiver: buyer,
+            TxnField.amount: refund,
+            TxnField.fee: Int(0),
+        })),
+    )
+
+@app.external
+def settle_commitments(buyers: abi.DynamicArray[abi.Address], *, output: abi.Uint64):
+    # Satış bittikten sonra herkes çağırabilir. Token'lar auction_tokens ile
+    # dağıtılır, artan ALGO iade edilir. Settle edilen kutu silindiği için aynı
+    # alıcı iki kez settle edilemez. Transferi başarısız olacak bir alıcı
+    # (ASA opt-out, dondurulmuş holding, min bakiyenin altında kalacak kapanmış
+    # hesap) tüm batch'i geri çevirmesin diye atlanır: payı "u" kutusuna yazılır,
+    # settled sayılır ve alıcı claim_settlement ile kendisi çeker.
+    token_price = app.state.token_price_microalgos.get()
+    i = ScratchVar(TealType.uint64)
+    buyer = abi.Address()
+    key = ScratchVar(TealType.bytes)
+    committed = ScratchVar(TealType.uint64)
+    tokens = ScratchVar(TealType.uint64)
+    refund = ScratchVar(TealType.uint64)
+    distributed = ScratchVar(TealType.uint64)
+    deliverable = ScratchVar(TealType.uint64)
+
+    return Seq(
+        Assert(app.state.sale_mode.get() == SALE_MODE_AUCTION, comment="Sale not in auction mode"),
+        Assert(Global.latest_timestamp() >= app.state.sale_end_time.get(), comment="Sale not ended"),
+
+        # İlk settlement çağrısında satılacak arzı sabitle
+        If(app.state.auction_supply.get() == Int(0)).Then(
+            app.state.auction_supply.set(app.state.tokens_remaining.get())
+        ),
+
+        distributed.store(Int(0)),
+        For(i.store(Int(0)), i.load() < buyers.length(), i.store(i.load() + Int(1))).Do(
+            buyers[i.load()].store_into(buyer),
+            key.store(Concat(COMMIT_PREFIX, buyer.get())),
+            commitment := BoxGet(key.load()),
+            If(commitment.hasValue()).Then(Seq(
+                committed.store(Btoi(commitment.value())),
+                tokens.store(auction_tokens(committed.load())),
+                refund.store(committed.load() - tokens.load() * token_price),
+
+                holding := AssetHolding.balance(buyer.get(), app.state.token_id.get()),
+                frozen := AssetHolding.frozen(buyer.get(), app.state.token_id.get()),
+                deliverable.store(And(
+                    Or(tokens.load() == Int(0), And(holding.hasValue(), Not(frozen.value()))),
+                    Or(refund.load() == Int(0), Balance(buyer.get()) > Int(0), refund.load() >= Global.min_balance()),
+                )),
+                If(deliverable.load())
+                .Then(send_allocation(buyer.get(), tokens.load(), refund.load()))
+                .Else(BoxPut(Concat(UNCLAIMED_PREFIX, buyer.get()), commitment.value())),
+
+                Pop(BoxDelete(key.load())),
+                app.state.unsettled_microalgos.set(app.state.unsettled_microalgos.get() - committed.load()),
+                app.state.total_raised_microalgos.set(
+                    app.state.total_raised_microalgos.get() + tokens.load() * token_price
+                ),
+                distributed.store(distributed.load() + tokens.load()),
+            )),
+        ),
+        app.state.tokens_remaining.set(app.state.tokens_remaining.get() - distributed.load()),
+        output.set(distributed.load())
+    )
+
+@app.external
+def claim_settlement(*, output: abi.Uint64):
+    # settle_commitments'ta atlanan alıcı (opt-in yaptıktan / hesabını
+    # fonladıktan sonra) kendi payını çeker. Dış işlem 2 inner işlemin ücretini de öder.
+    key = ScratchVar(TealType.bytes)
+    committed = ScratchVar(TealType.uint64)
+    tokens = ScratchVar(TealType.uint64)
+    return Seq(
+        key.store(Concat(UNCLAIMED_PREFIX, Txn.sender())),
+        unclaimed := BoxGet(key.load()),
+        Assert(unclaimed.hasValue(), comment="Nothing to claim"),
+        committed.store(Btoi(unclaimed.value())),
+        tokens.store(auction_tokens(committed.load())),
+        send_allocation(
+            Txn.sender(),
+            tokens.load(),
+            committed.load() - tokens.load() * app.state.token_price_microalgos.get(),
+        ),
+        Pop(BoxDelete(key.load())),
+        output.set(tokens.load())
     )
 
 @app.external
@@ -107,13 +466,64 @@ def claim_funds(*, output: abi.Bool):
     return Seq(
         Assert(Txn.sender() == app.state.startup_owner.get(), comment="Only owner"),
         Assert(Global.latest_timestamp() >= app.state.sale_end_time.get(), comment="Sale not ended"),
+        # Taahhüt edilen ALGO'nun ne kadarının gelir olduğu settlement ile belli olur
+        Assert(app.state.unsettled_microalgos.get() == Int(0), comment="Commitments not settled"),
 
+        # Sadece satış geliri çekilir; claim_settlement'ı bekleyen iadeler hesapta kalır
         InnerTxnBuilder.Execute({
             TxnField.type_enum: TxnType.Payment,
             TxnField.receiver: app.state.startup_owner.get(),
             TxnField.amount: app.state.total_raised_microalgos.get(),
-            TxnField.close_remainder_to: app.state.startup_owner.get() # İsteğe bağlı, tüm ALGO'ları çeker
         }),
         app.state.total_raised_microalgos.set(Int(0)),
         output.set(True)
+    )
+
+@app.external(read_only=True)
+def get_sale_state(*, output: SaleState):
+    # Ham global state'i çözmek yerine satış durumunu tek çağrıda döner (price: şu anki birim fiyat)
+    price = abi.Uint64()
+    start = abi.Uint64()
+    end = abi.Uint64()
+    remaining = abi.Uint64()
+    raised = abi.Uint64()
+    active = abi.Bool()
+    return Seq(
+        price.set(current_unit_price()),
+        start.set(app.state.sale_start_time.get()),
+        end.set(app.state.sale_end_time.get()),
+        remaining.set(app.state.tokens_remaining.get()),
+        raised.set(app.state.total_raised_microalgos.get()),
+        active.set(app.state.is_sale_active.get()),
+        output.set(price, start, end, remaining, raised, active),
+    )
+
+@app.external(read_only=True)
+def get_buyers(
+    offset: abi.Uint64,
+    n: abi.Uint64,
+    *,
+    output: abi.DynamicArray[abi.Tuple3[abi.Address, abi.Uint64, abi.Uint64]]
+):
+    # Satış sonrası mutabakat için sayfalı (adres, tokens_bought, paid_microalgos) listesi
+    i = ScratchVar(TealType.uint64)
+    end = ScratchVar(TealType.uint64)
+    buyer = ScratchVar(TealType.bytes)
+    page = ScratchVar(TealType.bytes)
+    return Seq(
+        end.store(offset.get() + n.get()),
+        If(end.load() > app.state.buyer_count.get()).Then(end.store(app.state.buyer_count.get())),
+        page.store(Bytes("")),
+        For(i.store(offset.get()), i.load() < end.load(), i.store(i.load() + Int(1))).Do(
+            buyer.store(BoxExtract(
+                Concat(BUYER_PAGE_PREFIX, Itob(i.load() / BUYERS_PER_PAGE)),
+                (i.load() % BUYERS_PER_PAGE) * Int(32),
+                Int(32),
+            )),
+            record := BoxGet(Concat(BUYER_PREFIX, buyer.load())),
+            page.store(Concat(page.load(), buyer.load(), record.value())),
+        ),
+        If(end.load() > offset.get())
+        .Then(output.decode(Concat(Suffix(Itob(end.load() - offset.get()), Int(6)), page.load())))
+        .Else(output.decode(Bytes("base16", "0x0000"))),
     )
\ No newline at end of file
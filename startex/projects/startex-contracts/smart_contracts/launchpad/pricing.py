@@ -0,0 +1,133 @@
+# smart_contracts/launchpad/pricing.py
+
+"""
+Off-chain mirror of LaunchpadApp's price engine (current_unit_price,
+tier_discount_bps and the buy_tokens arithmetic).
+
+Every step uses the same integer math as the contract, so quote() returns
+exactly the tokens, cost and refund buy_tokens will produce for the same
+payment and block timestamp, without a simulate round trip.
+"""
+
+import dataclasses
+import struct
+
+BPS_DENOMINATOR = 10_000
+MAX_PRICE_TIERS = 4
+
+# Buyer boxes written by buy_tokens ("b" + address record, "l" + itob(page) list page)
+BUYERS_PER_PAGE = 32
+BUYER_RECORD_SIZE = 16
+BUYER_PAGE_SIZE = BUYERS_PER_PAGE * 32
+# Box MBR buy_tokens keeps from a first purchase (see BUYER_RECORD_MBR / BUYER_PAGE_MBR)
+BUYER_RECORD_MBR = 2500 + 400 * (1 + 32 + BUYER_RECORD_SIZE)
+BUYER_PAGE_MBR = 2500 + 400 * (1 + 8 + BUYER_PAGE_SIZE)
+
+
+def box_mbr(is_new_buyer: bool, buyer_count: int) -> int:
+    """MBR buy_tokens deducts from the payment before pricing it."""
+    if not is_new_buyer:
+        return 0
+    return BUYER_RECORD_MBR + (BUYER_PAGE_MBR if buyer_count % BUYERS_PER_PAGE == 0 else 0)
+
+
+@dataclasses.dataclass(frozen=True)
+class PriceTier:
+    min_tokens: int
+    discount_bps: int
+
+
+@dataclasses.dataclass(frozen=True)
+class PriceCurve:
+    start_price: int
+    floor_price: int
+    tiers: tuple[PriceTier, ...] = ()
+
+    def encode(self) -> bytes:
+        """Packed layout stored in the price_curve global."""
+        packed = struct.pack(">QQ", self.start_price, self.floor_price)
+        for tier in self.tiers:
+            packed += struct.pack(">QQ", tier.min_tokens, tier.discount_bps)
+        return packed
+
+    @classmethod
+    def decode(cls, packed: bytes) -> "PriceCurve | None":
+        """Parses the price_curve global; None when no curve is set."""
+        if not packed:
+            return None
+        start_price, floor_price = struct.unpack_from(">QQ", packed, 0)
+        tiers = tuple(
+            PriceTier(*struct.unpack_from(">QQ", packed, offset)) for offset in range(16, len(packed), 16)
+        )
+        return cls(start_price, floor_price, tiers)
+
+
+@dataclasses.dataclass(frozen=True)
+class Quote:
+    unit_price: int
+    effective_price: int
+    tokens: int
+    cost: int
+    refund: int
+
+
+def unit_price(
+    now: int,
+    token_price: int,
+    sale_start_time: int,
+    sale_end_time: int,
+    curve: PriceCurve | None,
+) -> int:
+    if curve is None:
+        return token_price
+    duration = sale_end_time - sale_start_time
+    if now <= sale_start_time:
+        elapsed = 0
+    elif now >= sale_end_time:
+        elapsed = duration
+    else:
+        elapsed = now - sale_start_time
+    return curve.start_price - (curve.start_price - curve.floor_price) * elapsed // duration
+
+
+def tier_discount_bps(base_tokens: int, curve: PriceCurve | None) -> int:
+    bps = 0
+    if curve is not None:
+        for tier in curve.tiers:
+            if base_tokens >= tier.min_tokens:
+                bps = tier.discount_bps
+    return bps
+
+
+def quote(
+    amount: int,
+    now: int,
+    token_price: int,
+    sale_start_time: int,
+    sale_end_time: int,
+    curve: PriceCurve | None = None,
+    mbr: int = 0,
+) -> Quote:
+    """Tokens bought and ALGO refunded for a payment of `amount` microAlgos at `now`.
+
+    `mbr` is the box MBR kept from a first purchase (see box_mbr()). Raises
+    ValueError where buy_tokens would reject the call: a payment that does not
+    cover the MBR, or a sale without a price.
+    """
+    if amount <= mbr:
+        raise ValueError("Payment does not cover box MBR")
+    amount -= mbr
+    price = unit_price(now, token_price, sale_start_time, sale_end_time, curve)
+    if price <= 0:
+        raise ValueError("Sale parameters not set")
+    effective_price = price * (BPS_DENOMINATOR - tier_discount_bps(amount // price, curve)) // BPS_DENOMINATOR
+    effective_price = max(effective_price, 1)
+    tokens = amount // effective_price
+    cost = tokens * effective_price
+    return Quote(
+        unit_price=price,
+        effective_price=effective_price,
+        tokens=tokens,
+        cost=cost,
+        refund=amount - cost,
+    )
@@ -0,0 +1,436 @@
+# smart_contracts/scripts/async_clients.py
+
+"""
+Asyncio counterparts of the generated app clients.
+
+All clients share one AlgoSession: a pooled aiohttp session to algod (and
+indexer) plus a short-lived cache of suggested params. Transactions are still
+built and signed with algosdk's AtomicTransactionComposer, so encoding matches
+the sync clients; only the network round trips are async. Read-only methods
+are answered by simulate (empty signatures, zero-address sender), so no signer
+is needed for them.
+
+Because nothing blocks, a page that needs 50 reads costs roughly one round trip:
+
+    async with AlgoSession.from_environment() as session:
+        registry = AsyncStartupRegistryAppClient(session, app_id=registry_id)
+        startups = await asyncio.gather(*(registry.get_startup(sid) for sid in range(1, 51)))
+
+Methods are resolved from the generated client's app spec: `await client.<method>(*args)`
+returns an AsyncCallResult whose return_value is decoded into the generated struct
+dataclass (Startup, Competition, SaleState, ...) where the sync client does the same.
+
+For the box-backed getters there is also a direct read path that skips simulate:
+read_startup(s), read_competition(s) and read_participant(s) compute the box key,
+GET the raw box from algod (or the indexer with use_indexer=True) and decode it
+with the struct's precompiled codec (see struct_codecs.py), fetching many boxes
+concurrently.
+
+Needs the optional aiohttp dependency: `poetry install --with async`.
+"""
+
+import asyncio
+import base64
+import dataclasses
+import json
+import os
+import time
+from collections.abc import Iterable
+from types import ModuleType
+
+from algosdk import abi, encoding, transaction
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    EmptySigner,
+    TransactionSigner,
+)
+from algosdk.constants import ZERO_ADDRESS
+from algosdk.logic import get_application_address
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+from smart_contracts.scripts.chain import app_spec_json, load_client_module
+from smart_contracts.scripts.competition_layout import COMP_STATUS_OFFSET, effective_status
+from smart_contracts.scripts.struct_codecs import StructCodec, struct_codec
+
+try:
+    import aiohttp
+except ImportError as error:  # optional dependency
+    raise ImportError("async clients need aiohttp: poetry install --with async") from error
+
+LOCALNET_TOKEN = "a" * 64
+ABI_RETURN_PREFIX = bytes.fromhex("151f7c75")
+# Connections kept open to each node; bounds how many requests are in flight at once.
+DEFAULT_POOL_SIZE = 64
+SUGGESTED_PARAMS_TTL = 2.0
+MAX_WAIT_ROUNDS = 10
+
+
+def itob(value: int) -> bytes:
+    return value.to_bytes(8, "big")
+
+
+class AlgodError(Exception):
+    def __init__(self, message: str, status: int | None = None) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def _node_url(prefix: str, default_port: str) -> str:
+    server = os.getenv(f"{prefix}_SERVER", "http://localhost").rstrip("/")
+    port = os.getenv(f"{prefix}_PORT", default_port)
+    return f"{server}:{port}" if port else server
+
+
+class AlgoSession:
+    """One pooled HTTP session to algod/indexer shared by every async client."""
+
+    def __init__(
+        self,
+        algod_url: str,
+        algod_token: str,
+        indexer_url: str | None = None,
+        indexer_token: str = "",
+        pool_size: int = DEFAULT_POOL_SIZE,
+    ) -> None:
+        self.algod_url = algod_url
+        self.indexer_url = indexer_url
+        self._algod_headers = {"X-Algo-API-Token": algod_token}
+        self._indexer_headers = {"X-Indexer-API-Token": indexer_token}
+        self._pool_size = pool_size
+        self._http: aiohttp.ClientSession | None = None
+        self._params: tuple[float, transaction.SuggestedParams] | None = None
+        self._params_lock = asyncio.Lock()
+
+    @classmethod
+    def from_environment(cls, pool_size: int = DEFAULT_POOL_SIZE) -> "AlgoSession":
+        """Same ALGOD_* / INDEXER_* variables as AlgorandClient.from_environment(); LocalNet by default."""
+        return cls(
+            algod_url=_node_url("ALGOD", "4001"),
+            algod_token=os.getenv("ALGOD_TOKEN", LOCALNET_TOKEN),
+            indexer_url=_node_url("INDEXER", "8980"),
+            indexer_token=os.getenv("INDEXER_TOKEN", LOCALNET_TOKEN),
+            pool_size=pool_size,
+        )
+
+    async def __aenter__(self) -> "AlgoSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def http(self) -> aiohttp.ClientSession:
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit_per_host=self._pool_size))
+        return self._http
+
+    async def close(self) -> None:
+        if self._http is not None:
+            await self._http.close()
+
+    async def _request(self, method: str, url: str, headers: dict, **kwargs) -> dict:
+        async with self.http.request(method, url, headers=headers, **kwargs) as response:
+            body = await response.read()
+            if response.status >= 400:
+                raise AlgodError(
+                    f"{method} {url} -> {response.status}: {body.decode(errors='replace')}", response.status
+                )
+            return json.loads(body) if body else {}
+
+    async def algod(self, method: str, path: str, **kwargs) -> dict:
+        return await self._request(method, self.algod_url + path, self._algod_headers, **kwargs)
+
+    async def indexer(self, path: str, **params) -> dict:
+        if not self.indexer_url:
+            raise AlgodError("No indexer configured")
+        return await self._request("GET", self.indexer_url + path, self._indexer_headers, params=params)
+
+    # ------------------------------ algod ------------------------------ #
+
+    async def suggested_params(self) -> transaction.SuggestedParams:
+        """Suggested params, refetched at most every SUGGESTED_PARAMS_TTL seconds across all callers."""
+        async with self._params_lock:
+            if self._params is None or time.monotonic() - self._params[0] > SUGGESTED_PARAMS_TTL:
+                params = await self.algod("GET", "/v2/transactions/params")
+                self._params = (
+                    time.monotonic(),
+                    transaction.SuggestedParams(
+                        fee=params["fee"],
+                        first=params["last-round"],
+                        last=params["last-round"] + 1000,
+                        gh=params["genesis-hash"],
+                        gen=params["genesis-id"],
+                        flat_fee=False,
+                        consensus_version=params["consensus-version"],
+                        min_fee=params["min-fee"],
+                    ),
+                )
+            return transaction.SuggestedParams(**vars(self._params[1]))
+
+    async def send(self, signed: list) -> str:
+        body = b"".join(base64.b64decode(encoding.msgpack_encode(stxn)) for stxn in signed)
+        response = await self._request(
+            "POST",
+            self.algod_url + "/v2/transactions",
+            {**self._algod_headers, "Content-Type": "application/x-binary"},
+            data=body,
+        )
+        return response["txId"]
+
+    async def simulate(self, signed: list, **options) -> dict:
+        """Simulates one group; options are SimulateRequest fields (allow_empty_signatures, exec_trace_config, ...)."""
+        request = SimulateRequest(txn_groups=[SimulateRequestTransactionGroup(txns=signed)], **options)
+        body = base64.b64decode(encoding.msgpack_encode(request))
+        return await self._request(
+            "POST",
+            self.algod_url + "/v2/transactions/simulate?format=json",
+            {**self._algod_headers, "Content-Type": "application/msgpack"},
+            data=body,
+        )
+
+    async def wait_for_confirmation(self, txid: str, max_rounds: int = MAX_WAIT_ROUNDS) -> dict:
+        status = await self.algod("GET", "/v2/status")
+        last_round = status["last-round"]
+        for _ in range(max_rounds):
+            pending = await self.algod("GET", f"/v2/transactions/pending/{txid}?format=json")
+            if pending.get("confirmed-round"):
+                return pending
+            if pending.get("pool-error"):
+                raise AlgodError(f"{txid} rejected: {pending['pool-error']}")
+            status = await self.algod("GET", f"/v2/status/wait-for-block-after/{last_round}")
+            last_round = status["last-round"]
+        raise AlgodError(f"{txid} not confirmed after {max_rounds} rounds")
+
+    async def box(self, app_id: int, name: bytes, use_indexer: bool = False) -> bytes | None:
+        """Raw box value, or None if the box does not exist. The indexer may lag algod by a few rounds."""
+        path = f"/v2/applications/{app_id}/box"
+        params = {"name": f"b64:{base64.b64encode(name).decode()}"}
+        try:
+            response = await (self.indexer(path, **params) if use_indexer else self.algod("GET", path, params=params))
+        except AlgodError as error:
+            if error.status == 404:
+                return None
+            raise
+        return base64.b64decode(response["value"])
+
+    async def latest_timestamp(self) -> int:
+        """Timestamp of the latest block, i.e. Global.latest_timestamp for the next evaluation."""
+        last_round = (await self.algod("GET", "/v2/status"))["last-round"]
+        block = await self.algod("GET", f"/v2/blocks/{last_round}", params={"format": "json", "header-only": "true"})
+        return block["block"]["ts"]
+
+    async def global_state(self, app_id: int) -> dict[str, int | bytes]:
+        params = (await self.algod("GET", f"/v2/applications/{app_id}"))["params"]
+        decoded: dict[str, int | bytes] = {}
+        for entry in params.get("global-state", []):
+            key = base64.b64decode(entry["key"]).decode(errors="replace")
+            value = entry["value"]
+            decoded[key] = value["uint"] if value["type"] == 2 else base64.b64decode(value["bytes"])
+        return decoded
+
+
+# ------------------------------ App clients ------------------------------ #
+
+
+@dataclasses.dataclass(frozen=True)
+class AsyncCallResult:
+    return_value: object
+    tx_id: str
+    # None for read-only calls answered by simulate
+    confirmed_round: int | None = None
+
+
+def return_bytes(logs: list[str]) -> bytes | None:
+    """Raw ABI return value from a call's logs (the last log with the return prefix)."""
+    for log in reversed(logs):
+        raw = base64.b64decode(log)
+        if raw.startswith(ABI_RETURN_PREFIX):
+            return raw[len(ABI_RETURN_PREFIX) :]
+    return None
+
+
+class AsyncAppClient:
+    """Async client for one app, driven by the generated client's app spec."""
+
+    # Set by subclasses: artifacts folder of the generated client, and methods whose
+    # tuple return maps onto a generated dataclass (name, returns a list of them).
+    CONTRACT: str = ""
+    STRUCT_RETURNS: dict[str, tuple[str, bool]] = {}
+
+    def __init__(
+        self,
+        session: AlgoSession,
+        app_id: int,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+    ) -> None:
+        self.session = session
+        self.app_id = app_id
+        self.app_address = get_application_address(app_id)
+        self.default_sender = default_sender
+        self.default_signer = default_signer
+        # imported lazily: only decoding a struct executes the generated client
+        self.client_module: ModuleType = load_client_module(self.CONTRACT)
+        spec = json.loads(app_spec_json(self.CONTRACT))
+        self.methods = {}
+        self.read_only = set()
+        for method in spec["methods"]:
+            signature = f"{method['name']}({','.join(a['type'] for a in method['args'])}){method['returns']['type']}"
+            self.methods[method["name"]] = abi.Method.from_signature(signature)
+            if method.get("readonly"):
+                self.read_only.add(method["name"])
+        # ABI tuple type per struct dataclass, from the returns of the methods that produce it
+        self.struct_types: dict[str, str] = {}
+        for method_name, (class_name, is_list) in self.STRUCT_RETURNS.items():
+            abi_type = str(self.methods[method_name].returns.type)
+            self.struct_types[class_name] = abi_type.removesuffix("[]") if is_list else abi_type
+
+    def __getattr__(self, name: str):
+        methods = self.__dict__.get("methods", {})
+        if name not in methods:
+            raise AttributeError(name)
+
+        async def call(*args, **kwargs) -> AsyncCallResult:
+            return await self.call(name, list(args), **kwargs)
+
+        call.__name__ = name
+        return call
+
+    async def compose(
+        self,
+        atc: AtomicTransactionComposer,
+        method_name: str,
+        args: list,
+        *,
+        sender: str | None = None,
+        signer: TransactionSigner | None = None,
+        sp: transaction.SuggestedParams | None = None,
+        **call_options,
+    ) -> None:
+        """Adds one method call to `atc` (used by call() and by group composers)."""
+        read_only = method_name in self.read_only
+        sender = sender or self.default_sender or (ZERO_ADDRESS if read_only else None)
+        signer = signer or self.default_signer or (EmptySigner() if read_only else None)
+        if sender is None or signer is None:
+            raise ValueError(f"{method_name} needs a sender and signer")
+        atc.add_method_call(
+            app_id=self.app_id,
+            method=self.methods[method_name],
+            sender=sender,
+            sp=sp or await self.session.suggested_params(),
+            signer=signer,
+            method_args=args,
+            **call_options,
+        )
+
+    async def call(self, method_name: str, args: list | None = None, **options) -> AsyncCallResult:
+        """Simulates read-only methods; signs, submits and awaits confirmation for the rest."""
+        atc = AtomicTransactionComposer()
+        await self.compose(atc, method_name, list(args or []), **options)
+        signed = atc.gather_signatures()
+        tx_id = signed[-1].get_txid()
+
+        if method_name in self.read_only:
+            response = await self.session.simulate(
+                signed, allow_empty_signatures=True, allow_unnamed_resources=True
+            )
+            group = response["txn-groups"][0]
+            if group.get("failure-message"):
+                raise AlgodError(group["failure-message"])
+            logs = group["txn-results"][-1]["txn-result"].get("logs", [])
+            return AsyncCallResult(self.return_value(method_name, logs), tx_id)
+
+        await self.session.send(signed)
+        confirmed = await self.session.wait_for_confirmation(tx_id)
+        return_value = self.return_value(method_name, confirmed.get("logs", []))
+        return AsyncCallResult(return_value, tx_id, confirmed["confirmed-round"])
+
+    async def read_boxes(self, names: list[bytes], use_indexer: bool = False) -> list[bytes | None]:
+        """Fetches boxes of this app concurrently over the shared session; None for missing ones."""
+        return list(await asyncio.gather(*(self.session.box(self.app_id, name, use_indexer) for name in names)))
+
+    async def read_structs(self, class_name: str, names: list[bytes], use_indexer: bool = False) -> list:
+        """
+        Reads struct boxes directly and decodes them with the struct's codec: one algod (or
+        indexer) GET per box instead of a simulate and an AVM evaluation per getter call.
+        Missing boxes come back as None where the getter would fail.
+        """
+        codec = self.codec(class_name)
+        return [None if value is None else codec.decode(value) for value in await self.read_boxes(names, use_indexer)]
+
+    def codec(self, class_name: str) -> StructCodec:
+        return struct_codec(getattr(self.client_module, class_name), self.struct_types[class_name])
+
+    def return_value(self, method_name: str, logs: list[str]) -> object:
+        """Decodes a call's return; struct returns go through the precompiled struct codecs."""
+        method = self.methods[method_name]
+        if method.returns.type == abi.Returns.VOID:
+            return None
+        raw = return_bytes(logs)
+        if raw is None:
+            raise AlgodError(f"{method_name} returned no ABI value")
+        if method_name in self.STRUCT_RETURNS:
+            class_name, is_list = self.STRUCT_RETURNS[method_name]
+            codec = self.codec(class_name)
+            return codec.decode_array(raw) if is_list else codec.decode(raw)
+        return method.returns.type.decode(raw)
+
+
+class AsyncStartupRegistryAppClient(AsyncAppClient):
+    CONTRACT = "startup_registry"
+    STRUCT_RETURNS = {"get_startup": ("Startup", False)}
+
+    async def read_startup(self, startup_id: int, use_indexer: bool = False):
+        """get_startup without simulate: the Startup box (keyed by itob(startup_id)) decoded locally."""
+        return (await self.read_startups([startup_id], use_indexer))[0]
+
+    async def read_startups(self, startup_ids: Iterable[int], use_indexer: bool = False) -> list:
+        return await self.read_structs("Startup", [itob(sid) for sid in startup_ids], use_indexer)
+
+
+class AsyncCompetitionAppClient(AsyncAppClient):
+    CONTRACT = "competition"
+    STRUCT_RETURNS = {
+        "get_competition": ("Competition", False),
+        "get_participant": ("Participant", False),
+        "get_competition_leaderboard": ("LeaderboardEntry", True),
+    }
+
+    async def read_competition(self, competition_id: int, use_indexer: bool = False):
+        return (await self.read_competitions([competition_id], use_indexer))[0]
+
+    async def read_competitions(self, competition_ids: Iterable[int], use_indexer: bool = False) -> list:
+        """
+        get_competition without simulate. Like the getter, status is the effective status
+        derived from the latest block timestamp rather than the stored value.
+        """
+        names = [itob(cid) for cid in competition_ids]
+        values, now = await asyncio.gather(
+            self.read_boxes(names, use_indexer), self.session.latest_timestamp()
+        )
+        codec = self.codec("Competition")
+        return [
+            None
+            if value is None
+            else codec.decode(
+                value[:COMP_STATUS_OFFSET]
+                + itob(effective_status(value, now))
+                + value[COMP_STATUS_OFFSET + 8 :]
+            )
+            for value in values
+        ]
+
+    async def read_participant(self, competition_id: int, startup_id: int, use_indexer: bool = False):
+        return (await self.read_participants([(competition_id, startup_id)], use_indexer))[0]
+
+    async def read_participants(self, keys: Iterable[tuple[int, int]], use_indexer: bool = False) -> list:
+        """get_participant without simulate; boxes are keyed by the (uint64,uint64) encoding of (cid, sid)."""
+        return await self.read_structs("Participant", [itob(cid) + itob(sid) for cid, sid in keys], use_indexer)
+
+
+class AsyncLaunchpadAppClient(AsyncAppClient):
+    CONTRACT = "launchpad"
+    STRUCT_RETURNS = {
+        "get_sale_state": ("SaleState", False),
+        "get_buyers": ("BuyerRecord", True),
+    }
@@ -0,0 +1,288 @@
+# smart_contracts/scripts/benchmark.py
+
+"""
+Contract cost benchmarks with a regression gate.
+
+The apps are built from the current contract sources (not the TEAL in
+artifacts/) and created on LocalNet. Each scenario prepares the state it needs
+(committed transactions), then simulates one representative method call with
+execution traces and records opcode cost (the app budget the AVM reports as
+consumed), box bytes read/written, inner transaction count and the pooled
+minimum fee. Results are compared with the committed baseline
+(benchmark_baseline.json next to this file); any metric that grows by more than
+--threshold percent, a scenario whose outcome changed, or a scenario with no
+baseline entry fails the check.
+
+A scenario can be pinned to an expected failure (expect_error); its outcome
+is then checked like any other. Only calls that reach the path they are named
+after are benchmarked, so claim_reward is left out until competitions can
+have participants.
+
+Usage (LocalNet must be running: `algokit localnet start`):
+    python -m smart_contracts.scripts.benchmark --check             # gate, exit 1 on regression
+    python -m smart_contracts.scripts.benchmark --update-baseline   # re-record after an intended change
+"""
+
+import argparse
+import dataclasses
+import json
+import logging
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from algosdk import transaction
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer, TransactionWithSigner
+from algosdk.logic import get_application_address
+from dotenv import load_dotenv
+
+from smart_contracts.launchpad.pricing import BUYER_PAGE_MBR, BUYER_RECORD_MBR
+from smart_contracts.scripts import load_test
+from smart_contracts.scripts.chain import build_app_spec, create_app_from_source, get_algorand
+from smart_contracts.scripts.cost_profiler import MethodProfile, profile_method
+
+logger = logging.getLogger(__name__)
+
+BASELINE_PATH = Path(__file__).with_name("benchmark_baseline.json")
+METRICS = ("opcode_cost", "box_bytes_read", "box_bytes_written", "inner_txns", "fees")
+DEFAULT_THRESHOLD_PCT = 5.0
+
+# App args are capped at 2048 bytes in total: selector(4) + token_asset_id(8) + 5 strings with 2-byte length heads.
+MAX_STARTUP_STRING = (2048 - 4 - 8) // 5 - 2
+PRIZE_POOL = 1_000_000
+
+
+class Context:
+    """Apps created for this run, shared by all scenarios."""
+
+    def __init__(self) -> None:
+        self.algorand = get_algorand()
+        self.algod = self.algorand.client.algod
+        self.sender = self.algorand.account.localnet_dispenser()
+        self.app_ids: dict[str, int] = {}
+
+    def app_id(self, app_name: str) -> int:
+        if app_name not in self.app_ids:
+            if app_name == "launchpad":
+                # funded, opted in and active sale; the dispenser holds the sale ASA
+                self.app_ids[app_name], _ = load_test.deploy_launchpad(self.algorand, self.sender)
+            else:
+                self.app_ids[app_name] = create_app_from_source(self.algorand, self.sender, app_name)
+                self.call(app_name, None, transfer=load_test.APP_FUNDING)
+        return self.app_ids[app_name]
+
+    def call(self, app_name: str, method_name: str | None, args: list | None = None, transfer: int = 0):
+        """Commits a method call (or, with method_name=None, just funds the app); returns the ABI return value."""
+        app_id = self.app_id(app_name)
+        sp = self.algod.suggested_params()
+        atc = AtomicTransactionComposer()
+        if transfer:
+            payment = transaction.PaymentTxn(self.sender.address, sp, get_application_address(app_id), transfer)
+            atc.add_transaction(TransactionWithSigner(payment, self.sender.signer))
+        if method_name is not None:
+            method = build_app_spec(app_name).contract.get_method_by_name(method_name)
+            method_args = [
+                TransactionWithSigner(
+                    transaction.PaymentTxn(
+                        self.sender.address, sp, arg.get("to") or get_application_address(app_id), arg["pay"]
+                    ),
+                    self.sender.signer,
+                )
+                if isinstance(arg, dict)
+                else arg
+                for arg in args or []
+            ]
+            atc.add_method_call(
+                app_id=app_id,
+                method=method,
+                sender=self.sender.address,
+                sp=sp,
+                signer=self.sender.signer,
+                method_args=method_args,
+            )
+        result = atc.execute(self.algod, wait_rounds=4)
+        return result.abi_results[-1].return_value if method_name is not None else None
+
+
+@dataclasses.dataclass(frozen=True)
+class Scenario:
+    name: str
+    app: str
+    method: str
+    # Commits whatever state the call needs and returns its arguments.
+    prepare: Callable[[Context], list]
+    expect_error: str | None = None
+
+
+def _startup_strings(length: int) -> list[str]:
+    return [char * length for char in "ndgwt"]
+
+
+def _competition(ctx: Context, starts_in: int, ends_in: int) -> int:
+    now = int(time.time())
+    return ctx.call(
+        "competition",
+        "create_competition",
+        ["Bench", "benchmark competition", now + starts_in, now + ends_in, {"pay": PRIZE_POOL}, 100, 0],
+    )
+
+
+SCENARIOS = [
+    Scenario(
+        name="register_startup/max_strings",
+        app="startup_registry",
+        method="register_startup",
+        prepare=lambda ctx: [*_startup_strings(MAX_STARTUP_STRING), 0],
+    ),
+    Scenario(
+        name="register_startup/short_strings",
+        app="startup_registry",
+        method="register_startup",
+        prepare=lambda ctx: ["StartEx", "Startup exchange", "github.com/startex/app", "startex.io", "@startex", 0],
+    ),
+    Scenario(
+        name="get_startup/max_strings",
+        app="startup_registry",
+        method="get_startup",
+        prepare=lambda ctx: [
+            ctx.call("startup_registry", "register_startup", [*_startup_strings(MAX_STARTUP_STRING), 0])
+        ],
+    ),
+    Scenario(
+        name="create_competition",
+        app="competition",
+        method="create_competition",
+        prepare=lambda ctx: [
+            "Bench",
+            "benchmark competition",
+            int(time.time()) + 3600,
+            int(time.time()) + 7200,
+            {"pay": PRIZE_POOL},
+            100,
+            0,
+        ],
+    ),
+    Scenario(
+        name="get_competition_leaderboard/empty",
+        app="competition",
+        method="get_competition_leaderboard",
+        prepare=lambda ctx: [_competition(ctx, 3600, 7200), 0, 50],
+    ),
+    # No claim_reward scenario: join_competition needs registry.is_startup_owner,
+    # which the registry does not expose, so no participant (and no payout) can exist.
+    Scenario(
+        name="buy_tokens/fixed_price",
+        app="launchpad",
+        method="buy_tokens",
+        # the first buyer also pays for its record and the first buyer-list page
+        prepare=lambda ctx: [{"pay": 100 * load_test.TOKEN_PRICE + BUYER_RECORD_MBR + BUYER_PAGE_MBR}],
+    ),
+    Scenario(
+        name="get_sale_state",
+        app="launchpad",
+        method="get_sale_state",
+        prepare=lambda ctx: [],
+    ),
+]
+
+
+def measure(ctx: Context, scenario: Scenario) -> dict:
+    args = scenario.prepare(ctx)
+    method = build_app_spec(scenario.app).contract.get_method_by_name(scenario.method).dictify()
+    profile: MethodProfile = profile_method(
+        ctx.algorand, ctx.sender, scenario.app, ctx.app_id(scenario.app), method, args, attribute=False
+    )
+    if profile.error is None:
+        status = "ok" if scenario.expect_error is None else "unexpected success"
+    elif scenario.expect_error is not None and scenario.expect_error in profile.error:
+        status = "expected error"
+    else:
+        status = f"failed: {profile.error}"
+    return {
+        "status": status,
+        "opcode_cost": profile.budget_consumed,
+        "box_bytes_read": profile.box_bytes_read,
+        "box_bytes_written": profile.box_bytes_written,
+        "inner_txns": profile.inner_txns,
+        "fees": profile.fees,
+    }
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], threshold_pct: float) -> list[str]:
+    """Regression messages; empty when every scenario is within threshold of its baseline."""
+    problems = []
+    for name, result in results.items():
+        if result["status"] not in ("ok", "expected error"):
+            problems.append(f"{name}: {result['status']}")
+        base = baseline.get(name)
+        if base is None:
+            problems.append(f"{name}: no baseline entry (record it with --update-baseline)")
+            continue
+        if result["status"] != base["status"]:
+            problems.append(f"{name}: outcome changed from '{base['status']}' to '{result['status']}'")
+        for metric in METRICS:
+            limit = base[metric] * (1 + threshold_pct / 100)
+            if result[metric] > limit:
+                problems.append(f"{name}: {metric} {base[metric]} -> {result[metric]} (limit {limit:.0f})")
+            elif result[metric] < base[metric] * (1 - threshold_pct / 100):
+                logger.info(f"{name}: {metric} improved {base[metric]} -> {result[metric]}; consider --update-baseline")
+    return problems
+
+
+def format_table(results: dict[str, dict]) -> str:
+    header = f"{'scenario':<40}" + "".join(f"{metric:>18}" for metric in METRICS) + "  status"
+    rows = [header]
+    for name, result in results.items():
+        rows.append(f"{name:<40}" + "".join(f"{result[metric]:>18}" for metric in METRICS) + f"  {result['status']}")
+    return "\n".join(rows)
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Contract cost benchmarks with a regression gate")
+    parser.add_argument("--check", action="store_true", help="exit 1 if any metric regressed past the threshold")
+    parser.add_argument("--update-baseline", action="store_true", help=f"write results to {BASELINE_PATH.name}")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD_PCT, help="allowed growth in percent")
+    parser.add_argument("--scenario", action="append", help="only run scenarios whose name starts with this")
+    parser.add_argument("--app", action="append", help="only run scenarios for this app")
+    parser.add_argument("--json", type=Path, help="also write the results as JSON")
+    args = parser.parse_args()
+
+    scenarios = [
+        s
+        for s in SCENARIOS
+        if (not args.scenario or any(s.name.startswith(p) for p in args.scenario))
+        and (not args.app or s.app in args.app)
+    ]
+    ctx = Context()
+    results = {}
+    for scenario in scenarios:
+        logger.info(f"Running {scenario.name}")
+        results[scenario.name] = measure(ctx, scenario)
+    print(format_table(results))
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+    if args.update_baseline:
+        baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+        baseline.update(results)
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        logger.info(f"Updated {BASELINE_PATH}")
+        return
+
+    if not BASELINE_PATH.exists():
+        logger.error(f"{BASELINE_PATH.name} not found; record one with --update-baseline and commit it")
+        sys.exit(1 if args.check else 0)
+    problems = compare(results, json.loads(BASELINE_PATH.read_text()), args.threshold)
+    for problem in problems:
+        logger.error(problem)
+    if problems and args.check:
+        sys.exit(1)
+    logger.info("No cost regressions" if not problems else f"{len(problems)} cost regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+# smart_contracts/scripts/chain.py
+
+"""
+Shared helpers for off-chain jobs: algod/account setup from the environment,
+generated client and app spec loading, and bulk box reads.
+"""
+
+import ast
+import base64
+import hashlib
+import functools
+import importlib
+import importlib.util
+import json
+import os
+import sys
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import ModuleType
+
+import algokit_utils
+from algokit_utils import AlgorandClient
+from algosdk import transaction
+from algosdk.v2client.algod import AlgodClient
+
+# Concurrent box fetches per job; algod handles this comfortably on localnet/testnet.
+DEFAULT_READ_CONCURRENCY = 16
+
+# Compiled programs and generated clients live in the repository-level artifacts/ folder.
+ARTIFACTS_DIR = Path(os.getenv("STARTEX_ARTIFACTS_DIR", Path(__file__).resolve().parents[5] / "artifacts"))
+CLIENT_FILES = {
+    "competition": "competition.py",
+    "launchpad": "launchpad.client.py",
+    "startup_registry": "startup_registry.py",
+}
+# Beaker modules defining each contract's `app`, for building from the current sources.
+CONTRACT_MODULES = {
+    "competition": "smart_contracts.competition.competition",
+    "launchpad": "smart_contracts.launchpad.launchpad",
+    "startup_registry": "smart_contracts.startup_registry.startup_registry",
+}
+
+
+def get_algorand() -> AlgorandClient:
+    """AlgorandClient configured from ALGOD_* / INDEXER_* environment variables."""
+    return AlgorandClient.from_environment()
+
+
+def client_path(contract_name: str) -> Path:
+    path = ARTIFACTS_DIR / contract_name / CLIENT_FILES[contract_name]
+    if not path.exists():
+        # freshly built trees name the generated client <ContractName>_client.py
+        path = next((ARTIFACTS_DIR / contract_name).glob("*_client.py"), path)
+    return path
+
+
+@functools.cache
+def load_client_module(contract_name: str) -> ModuleType:
+    """
+    Imports a generated client from artifacts/<contract_name>/ by file path, once per process.
+    The module is only executed (and its APP_SPEC parsed) on first attribute access.
+    """
+    spec = importlib.util.spec_from_file_location(f"{contract_name}_client", client_path(contract_name))
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@functools.cache
+def app_spec_json(contract_name: str) -> str:
+    """
+    The _APP_SPEC_JSON of a generated client, read from its source without executing it.
+
+    When STARTEX_APP_SPEC_CACHE names a directory, the spec is cached there as plain JSON
+    under the sha256 of the client file, so a regenerated client misses the cache and a
+    corrupt entry is simply re-read from the client.
+    """
+    source = client_path(contract_name).read_bytes()
+    cache_dir = os.getenv("STARTEX_APP_SPEC_CACHE")
+    cache_path = Path(cache_dir) / f"{contract_name}-{hashlib.sha256(source).hexdigest()}.json" if cache_dir else None
+    if cache_path is not None:
+        try:
+            cached = cache_path.read_text()
+            json.loads(cached)
+            return cached
+        except (OSError, ValueError):
+            pass
+
+    spec_json = next(
+        node.value.value
+        for node in ast.parse(source).body
+        if isinstance(node, ast.Assign)
+        and any(isinstance(target, ast.Name) and target.id == "_APP_SPEC_JSON" for target in node.targets)
+    )
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            partial = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            partial.write_text(spec_json)
+            partial.replace(cache_path)
+        except OSError:
+            pass
+    return spec_json
+
+
+@functools.cache
+def load_app_spec(contract_name: str) -> algokit_utils.Arc56Contract:
+    """A generated client's app spec, parsed once per process without importing the client."""
+    return algokit_utils.Arc56Contract.from_json(app_spec_json(contract_name))
+
+
+@functools.cache
+def build_app_spec(contract_name: str):
+    """Builds a contract from its current Beaker sources (no algod needed); cached per process."""
+    return importlib.import_module(CONTRACT_MODULES[contract_name]).app.build()
+
+
+def _send_app_create(
+    algod: AlgodClient, creator, approval: str, clear: str, global_schema: transaction.StateSchema
+) -> int:
+    programs = [base64.b64decode(algod.compile(source)["result"]) for source in (approval, clear)]
+    create_txn = transaction.ApplicationCreateTxn(
+        sender=creator.address,
+        sp=algod.suggested_params(),
+        on_complete=transaction.OnComplete.NoOpOC,
+        approval_program=programs[0],
+        clear_program=programs[1],
+        global_schema=global_schema,
+        local_schema=transaction.StateSchema(0, 0),
+    )
+    txid = algod.send_transaction(create_txn.sign(creator.private_key))
+    return transaction.wait_for_confirmation(algod, txid, 4)["application-index"]
+
+
+def create_app(algorand: AlgorandClient, creator, contract_name: str) -> int:
+    """Creates an app from its compiled TEAL in artifacts/ with a bare NoOp call; returns the app id."""
+    global_schema = json.loads(app_spec_json(contract_name))["state"]["global"]
+    approval, clear = (
+        (ARTIFACTS_DIR / contract_name / f"{contract_name}.{name}.teal").read_text() for name in ("approval", "clear")
+    )
+    return _send_app_create(
+        algorand.client.algod,
+        creator,
+        approval,
+        clear,
+        transaction.StateSchema(global_schema["num_uints"], global_schema["num_byte_slices"]),
+    )
+
+
+def create_app_from_source(algorand: AlgorandClient, creator, contract_name: str) -> int:
+    """Like create_app, but builds the program from the current contract sources first."""
+    spec = build_app_spec(contract_name)
+    return _send_app_create(
+        algorand.client.algod, creator, spec.approval_program, spec.clear_program, spec.global_state_schema
+    )
+
+
+def latest_timestamp(algod: AlgodClient) -> int:
+    """Timestamp of the last block, i.e. what Global.latest_timestamp() sees on-chain."""
+    last_round = algod.status()["last-round"]
+    return algod.block_info(last_round, header_only=True)["block"]["ts"]
+
+
+def read_global_state(algod: AlgodClient, app_id: int) -> dict[str, int | bytes]:
+    """Decoded global state of an app: {key: uint or raw bytes}."""
+    state = algod.application_info(app_id)["params"].get("global-state", [])
+    decoded: dict[str, int | bytes] = {}
+    for entry in state:
+        key = base64.b64decode(entry["key"]).decode(errors="replace")
+        value = entry["value"]
+        decoded[key] = value["uint"] if value["type"] == 2 else base64.b64decode(value["bytes"])
+    return decoded
+
+
+def list_box_names(algod: AlgodClient, app_id: int, key_len: int | None = None) -> list[bytes]:
+    """All box names of an app, optionally only those with a given key length."""
+    response = algod.application_boxes(app_id, limit=0)
+    names = [base64.b64decode(box["name"]) for box in response["boxes"]]
+    if key_len is not None:
+        names = [name for name in names if len(name) == key_len]
+    return names
+
+
+def read_box(algod: AlgodClient, app_id: int, name: bytes) -> bytes:
+    response = algod.application_box_by_name(app_id, name)
+    return base64.b64decode(response["value"])
+
+
+def read_boxes(
+    algod: AlgodClient,
+    app_id: int,
+    names: Iterable[bytes],
+    concurrency: int = DEFAULT_READ_CONCURRENCY,
+) -> dict[bytes, bytes]:
+    """Fetches many boxes concurrently and returns {name: value}."""
+    names = list(names)
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        values = pool.map(lambda name: read_box(algod, app_id, name), names)
+        return dict(zip(names, values))
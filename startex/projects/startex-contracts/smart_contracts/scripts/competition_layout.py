@@ -0,0 +1,37 @@
+# smart_contracts/scripts/competition_layout.py
+
+"""
+Byte layout of CompetitionApp boxes and the off-chain mirror of its status
+rules, shared by the jobs and clients that read those boxes directly.
+"""
+
+import struct
+
+# Box layouts (see competition/competition.py)
+COMPETITION_KEY_LEN = 8
+COMP_START_TIME_OFFSET = 4
+COMP_END_TIME_OFFSET = 12
+COMP_STATUS_OFFSET = 20
+PARTICIPANT_KEY_LEN = 16
+PART_SCORE_OFFSET = 40
+
+STATUS_UPCOMING = 0
+STATUS_ACTIVE = 1
+STATUS_ENDED = 2
+STATUS_CANCELLED = 3
+
+
+def read_u64(data: bytes, offset: int) -> int:
+    return struct.unpack_from(">Q", data, offset)[0]
+
+
+def effective_status(competition_box: bytes, now: int) -> int:
+    """Off-chain mirror of the contract's effective_status subroutine."""
+    stored = read_u64(competition_box, COMP_STATUS_OFFSET)
+    if stored in (STATUS_ENDED, STATUS_CANCELLED):
+        return stored
+    if now < read_u64(competition_box, COMP_START_TIME_OFFSET):
+        return STATUS_UPCOMING
+    if now < read_u64(competition_box, COMP_END_TIME_OFFSET):
+        return STATUS_ACTIVE
+    return STATUS_ENDED
@@ -0,0 +1,412 @@
+# smart_contracts/scripts/cost_profiler.py
+
+"""
+Per-method opcode cost profiler.
+
+Every ABI method of each app is run through simulate with execution traces
+enabled. The opcode cost of each program counter in the approval-program trace
+is summed and mapped back to lines of the contract sources (competition.py,
+startup_registry.py, ...) through PyTeal's source map. Apps are built from the
+current sources, so the map always matches the program being run; PCs whose
+TEAL comes from beaker or pyteal internals are reported under their TEAL
+subroutine.
+
+Output is a per-method table (total cost, app budget consumed, hottest source
+lines) and a folded-stack file ("app;method;subroutine;file:line cost") that
+flamegraph.pl / speedscope / inferno load directly.
+
+Method arguments default to placeholder values of the right ABI type (pay
+arguments become a 1 Algo payment to the app, or {"pay": amount, "to": address}). Calls that fail on an assert are
+still profiled up to the failing op and marked as such; pass --inputs with
+real arguments to profile the happy path:
+
+    {"competition.claim_reward": [1, 1], "competition.join_competition": [1, 1, {"pay": 100000}]}
+
+Usage (LocalNet must be running: `algokit localnet start`):
+    python -m smart_contracts.scripts.cost_profiler --app competition --folded costs.folded
+    python -m smart_contracts.scripts.cost_profiler --app-id startup_registry=1002
+"""
+
+import argparse
+import base64
+import collections
+import dataclasses
+import functools
+import importlib
+import json
+import logging
+import re
+from pathlib import Path
+
+import algokit_utils
+from algosdk import abi, transaction
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer, TransactionWithSigner
+from algosdk.logic import get_application_address
+from algosdk.source_map import SourceMap as PCSourceMap
+from algosdk.v2client.models import SimulateRequest, SimulateTraceConfig
+from dotenv import load_dotenv
+
+from smart_contracts._tooling import teal_analysis
+from smart_contracts.scripts.chain import CLIENT_FILES, CONTRACT_MODULES, build_app_spec, create_app_from_source, get_algorand
+
+logger = logging.getLogger(__name__)
+
+CONTRACTS_DIR = Path(__file__).resolve().parents[1]
+# Profiling should not stop at the per-group budget; the real budget use is reported separately.
+EXTRA_OPCODE_BUDGET = 320_000
+# Simulated app calls carry enough fee for any number of pooled inner transactions;
+# the reported fee is the pooled minimum the call actually needs.
+MAX_INNER_TXNS = 256
+PLACEHOLDER_PAYMENT = 1_000_000
+
+
+# ----------------------------- Source maps ----------------------------- #
+
+
+@dataclasses.dataclass(frozen=True)
+class SourceLocation:
+    path: Path | None
+    line: int | None
+    subroutine: str
+    op: str
+
+    @property
+    def label(self) -> str:
+        if self.path is None or self.line is None:
+            return f"<teal {self.subroutine}>"
+        return f"{self.path.name}:{self.line}"
+
+
+def annotated_approval(contract_name: str) -> str:
+    """
+    The approval program built from the current sources, with PyTeal's source
+    annotations (a "// PYTEAL PATH  LINE  PYTEAL" column) on every TEAL line.
+    """
+    app = importlib.import_module(CONTRACT_MODULES[contract_name]).app
+    own_options = app.build_options
+    app.build_options = dataclasses.replace(
+        own_options, with_sourcemaps=True, annotate_teal=True, annotate_teal_headers=True, annotate_teal_concise=False
+    )
+    try:
+        return app.build().approval_program
+    finally:
+        app.build_options = own_options
+
+
+def _teal_locations(annotated_teal: str) -> list[tuple[Path | None, int | None, str, str]]:
+    """(source path, source line, subroutine, op) per TEAL line of an annotated program."""
+    lines = annotated_teal.splitlines()
+    header = lines[0]
+    path_column = header.index("PYTEAL PATH")
+    annotation = header.rindex("//", 0, path_column)
+    line_column = header.index("LINE", path_column)
+    source_column = header.index("PYTEAL", line_column)
+
+    locations = []
+    subroutine, path, line = "main", "", ""
+    for teal_line in lines:
+        op = teal_line[:annotation].strip()
+        if op.endswith(":"):
+            # PyTeal labels are <subroutine>_<n>[_l<k>], or main_l<k> in the router
+            subroutine = re.sub(r"_l\d+$", "", op[:-1])
+        # blank cells repeat the row above
+        path = teal_line[path_column:line_column].strip() or path
+        line = teal_line[line_column:source_column].strip() or line
+        resolved = (Path.cwd() / path).resolve() if path else None
+        # frames outside the contract folders are builder calls (beaker, pyteal, this script)
+        if resolved is None or not resolved.is_relative_to(CONTRACTS_DIR) or not line.isdigit():
+            locations.append((None, None, subroutine, op))
+        else:
+            locations.append((resolved, int(line), subroutine, op))
+    return locations
+
+
+class ProgramMap:
+    """PC -> source location for one approval program built from the current contract sources."""
+
+    def __init__(self, algod, contract_name: str) -> None:
+        teal = annotated_approval(contract_name)
+        compiled = algod.compile(teal, source_map=True)
+        # the annotations are comments: this is the same program create_app_from_source deploys
+        self.program = base64.b64decode(compiled["result"])
+        teal_locations = _teal_locations(teal)
+        self.locations = {
+            pc: SourceLocation(*teal_locations[teal_line])
+            for pc, teal_line in PCSourceMap(compiled["sourcemap"]).pc_to_line.items()
+        }
+        if not any(location.line is not None for location in self.locations.values()):
+            raise RuntimeError(
+                f"The {contract_name} source map attributes no program counter to a contract source line; "
+                "PyTeal's source mapper must be enabled before pyteal is imported"
+            )
+
+    def locate(self, pc: int) -> SourceLocation:
+        return self.locations.get(pc, SourceLocation(None, None, "main", ""))
+
+
+@functools.cache
+def program_map(algod, contract_name: str) -> ProgramMap:
+    return ProgramMap(algod, contract_name)
+
+
+@functools.cache
+def _source_lines(path: Path) -> list[str]:
+    return path.read_text().splitlines()
+
+
+def opcode_cost(op: str) -> int:
+    return teal_analysis.opcode_cost(op.split(" ", 1)[0] if op else "")
+
+
+# ------------------------------ Simulation ------------------------------ #
+
+
+@dataclasses.dataclass
+class MethodProfile:
+    app: str
+    method: str
+    cost_by_location: collections.Counter = dataclasses.field(default_factory=collections.Counter)
+    budget_consumed: int = 0
+    inner_txns: int = 0
+    fees: int = 0
+    box_bytes_read: int = 0
+    box_bytes_written: int = 0
+    error: str | None = None
+    skipped: str | None = None
+    simulate_response: dict | None = None
+
+    @property
+    def total_cost(self) -> int:
+        return sum(self.cost_by_location.values())
+
+
+def method_signature(method: dict) -> str:
+    args = ",".join(arg["type"] for arg in method["args"])
+    return f"{method['name']}({args}){method['returns']['type']}"
+
+
+def placeholder(abi_type: abi.ABIType, sender: str):
+    match abi_type:
+        case abi.UintType() | abi.UfixedType() | abi.ByteType():
+            return 1
+        case abi.BoolType():
+            return True
+        case abi.AddressType():
+            return sender
+        case abi.StringType():
+            return "x"
+        case abi.ArrayDynamicType():
+            return []
+        case abi.ArrayStaticType():
+            return [placeholder(abi_type.child_type, sender)] * abi_type.static_length
+        case abi.TupleType():
+            return [placeholder(child, sender) for child in abi_type.child_types]
+    raise ValueError(f"No placeholder for {abi_type}")
+
+
+def _count_inner(txn_result: dict) -> int:
+    inner = txn_result.get("txn-result", {}).get("inner-txns", [])
+    return len(inner) + sum(_count_inner({"txn-result": txn}) for txn in inner)
+
+
+def _box_sizes_accessed(algod, group: dict) -> int:
+    """Pre-call size of every box the group touched (the AVM reads whole boxes)."""
+    resources = [group.get("unnamed-resources-accessed", {})]
+    resources += [result.get("unnamed-resources-accessed", {}) for result in group["txn-results"]]
+    names = {(box["app"], base64.b64decode(box.get("name", ""))) for resource in resources for box in resource.get("boxes", [])}
+    total = 0
+    for app_id, name in names:
+        try:
+            total += len(base64.b64decode(algod.application_box_by_name(app_id, name)["value"]))
+        except Exception:  # noqa: BLE001 - box created by this call
+            pass
+    return total
+
+
+def _box_bytes_written(trace: list[dict]) -> int:
+    written = 0
+    for step in trace:
+        for change in step.get("state-changes", []):
+            if change.get("app-state-type") == "b" and change.get("operation") == "w":
+                written += len(base64.b64decode(change.get("new-value", {}).get("bytes", "")))
+    return written
+
+
+def profile_method(
+    algorand, sender, app_name: str, app_id: int, method: dict, args: list | None, attribute: bool = True
+) -> MethodProfile:
+    """
+    Simulates one method call and attributes the approval-program trace to source locations.
+
+    Pass attribute=False to only measure the call: attribution builds the contract
+    with source annotations, which takes a few seconds per contract.
+    """
+    algod = algorand.client.algod
+    profile = MethodProfile(app=app_name, method=method["name"])
+    abi_method = abi.Method.from_signature(method_signature(method))
+    sp = algod.suggested_params()
+
+    method_args = []
+    for index, arg in enumerate(abi_method.args):
+        given = args[index] if args is not None and index < len(args) else None
+        if arg.type == abi.ABITransactionType.PAY or (isinstance(given, dict) and "pay" in given):
+            amount = given["pay"] if isinstance(given, dict) else PLACEHOLDER_PAYMENT
+            receiver = given.get("to") if isinstance(given, dict) else None
+            payment = transaction.PaymentTxn(
+                sender.address, sp, receiver or get_application_address(app_id), amount
+            )
+            method_args.append(TransactionWithSigner(payment, sender.signer))
+        elif abi.is_abi_transaction_type(arg.type):
+            profile.skipped = f"needs a {arg.type} argument (pass it with --inputs)"
+            return profile
+        elif given is not None:
+            method_args.append(given)
+        elif abi.is_abi_reference_type(arg.type):
+            method_args.append(sender.address if arg.type == abi.ABIReferenceType.ACCOUNT else 0)
+        else:
+            method_args.append(placeholder(arg.type, sender.address))
+
+    call_sp = algod.suggested_params()
+    call_sp.flat_fee = True
+    call_sp.fee = (1 + MAX_INNER_TXNS) * call_sp.min_fee
+    atc = AtomicTransactionComposer()
+    atc.add_method_call(
+        app_id=app_id, method=abi_method, sender=sender.address, sp=call_sp, signer=sender.signer, method_args=method_args
+    )
+    request = SimulateRequest(
+        txn_groups=[],
+        allow_unnamed_resources=True,
+        extra_opcode_budget=EXTRA_OPCODE_BUDGET,
+        exec_trace_config=SimulateTraceConfig(enable=True, state_change=True),
+    )
+    result = atc.simulate(algod, request)
+    response = result.simulate_response
+    profile.simulate_response = response
+    group = response["txn-groups"][0]
+    profile.error = group.get("failure-message")
+
+    # the app call is the last transaction; payment arguments precede it
+    app_result = group["txn-results"][-1]
+    profile.budget_consumed = app_result.get("app-budget-consumed", 0)
+    profile.inner_txns = _count_inner(app_result)
+    profile.fees = (len(group["txn-results"]) + profile.inner_txns) * sp.min_fee
+    trace = app_result.get("exec-trace", {}).get("approval-program-trace", [])
+    profile.box_bytes_read = _box_sizes_accessed(algod, group)
+    profile.box_bytes_written = _box_bytes_written(trace)
+    for step in trace if attribute else ():
+        location = program_map(algod, app_name).locate(step["pc"])
+        profile.cost_by_location[location] += opcode_cost(location.op)
+    return profile
+
+
+# -------------------------------- Output -------------------------------- #
+
+
+def source_text(location: SourceLocation) -> str:
+    if location.path is None or location.line is None:
+        return location.op
+    lines = _source_lines(location.path)
+    return lines[location.line - 1].strip() if location.line <= len(lines) else ""
+
+
+def format_table(profiles: list[MethodProfile], top: int) -> str:
+    rows = []
+    for profile in profiles:
+        name = f"{profile.app}.{profile.method}"
+        if profile.skipped:
+            rows.append(f"{name:<50} skipped: {profile.skipped}")
+            continue
+        status = f"FAILED {profile.error}" if profile.error else "ok"
+        rows.append(
+            f"{name:<50} cost={profile.total_cost:>6} budget={profile.budget_consumed:>6} "
+            f"inner={profile.inner_txns:>3} fees={profile.fees:>6} "
+            f"box_r={profile.box_bytes_read:>6} box_w={profile.box_bytes_written:>6}  {status}"
+        )
+        for location, cost in profile.cost_by_location.most_common(top):
+            rows.append(f"    {cost:>6}  {location.label:<32} {location.subroutine:<28} {source_text(location)[:60]}")
+    return "\n".join(rows)
+
+
+def folded_stacks(profiles: list[MethodProfile]) -> str:
+    """Brendan Gregg's folded format: one 'frame;frame;frame cost' line per source location."""
+    lines = []
+    for profile in profiles:
+        for location, cost in sorted(profile.cost_by_location.items(), key=lambda item: item[0].label):
+            frames = [profile.app, profile.method, location.subroutine, location.label]
+            lines.append(f"{';'.join(frame.replace(';', ':').replace(' ', '_') for frame in frames)} {cost}")
+    return "\n".join(lines) + "\n"
+
+
+def run(apps: list[str], app_ids: dict[str, int], inputs: dict[str, list]) -> list[MethodProfile]:
+    # PyTeal records source frames only if this is set before pyteal is imported
+    from feature_gates import FeatureGates
+
+    FeatureGates.set_sourcemap_enabled(True)
+
+    algorand = get_algorand()
+    algod = algorand.client.algod
+    sender = algorand.account.localnet_dispenser()
+    profiles = []
+    for app_name in apps:
+        if app_name in app_ids:
+            deployed = base64.b64decode(algod.application_info(app_ids[app_name])["params"]["approval-program"])
+            if deployed != program_map(algod, app_name).program:
+                raise ValueError(f"App {app_ids[app_name]} does not run the current {app_name} sources")
+        else:
+            logger.info(f"Creating {app_name} on LocalNet")
+            app_ids[app_name] = create_app_from_source(algorand, sender, app_name)
+            algorand.send.payment(
+                algokit_utils.PaymentParams(
+                    sender=sender.address,
+                    receiver=get_application_address(app_ids[app_name]),
+                    amount=algokit_utils.AlgoAmount.from_algo(10),
+                )
+            )
+        for method in (method.dictify() for method in build_app_spec(app_name).contract.methods):
+            logger.info(f"Profiling {app_name}.{method['name']}")
+            args = inputs.get(f"{app_name}.{method['name']}")
+            profiles.append(profile_method(algorand, sender, app_name, app_ids[app_name], method, args))
+    return profiles
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Per-method opcode cost profile mapped to contract source lines")
+    parser.add_argument("--app", action="append", choices=sorted(CLIENT_FILES), help="default: every app")
+    parser.add_argument("--app-id", action="append", default=[], metavar="NAME=ID", help="profile an existing app")
+    parser.add_argument("--inputs", type=Path, help='JSON {"app.method": [args...]}')
+    parser.add_argument("--top", type=int, default=8, help="source lines shown per method")
+    parser.add_argument("--folded", type=Path, default=Path("costs.folded"), help="flamegraph folded-stack output")
+    parser.add_argument("--json", type=Path, help="also write the table as JSON")
+    args = parser.parse_args()
+
+    app_ids = {name: int(app_id) for name, app_id in (item.split("=", 1) for item in args.app_id)}
+    inputs = json.loads(args.inputs.read_text()) if args.inputs else {}
+    profiles = run(args.app or sorted(CLIENT_FILES), app_ids, inputs)
+
+    print(format_table(profiles, args.top))
+    args.folded.write_text(folded_stacks(profiles))
+    logger.info(f"Wrote {args.folded} (render with flamegraph.pl or speedscope)")
+    if args.json:
+        report = [
+            {
+                "method": f"{profile.app}.{profile.method}",
+                "cost": profile.total_cost,
+                "budget_consumed": profile.budget_consumed,
+                "inner_txns": profile.inner_txns,
+                "fees": profile.fees,
+                "box_bytes_read": profile.box_bytes_read,
+                "box_bytes_written": profile.box_bytes_written,
+                "error": profile.error,
+                "skipped": profile.skipped,
+                "lines": {location.label: cost for location, cost in profile.cost_by_location.most_common()},
+            }
+            for profile in profiles
+        ]
+        args.json.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
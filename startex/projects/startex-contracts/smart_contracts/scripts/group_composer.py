@@ -0,0 +1,272 @@
+# smart_contracts/scripts/group_composer.py
+
+"""
+Packs an arbitrary list of method calls (across any of the async app clients)
+into dense atomic groups and submits the groups concurrently.
+
+Packing rules:
+  * at most 16 transactions per group, counting transaction arguments
+    (e.g. the payment of buy_tokens) as their own transactions;
+  * at most 8 references per app call, of which at most 4 accounts;
+  * the contracts are AVM v10, so references are shared across a group:
+    a reference already available in the group (another call's reference,
+    called app or sender) is not repeated, and references that do not fit on
+    a call's own transaction spill onto other app calls of the group with
+    free slots. Box references only spill onto calls to the same app, and are
+    never deduplicated since each one adds 1KB of box I/O budget;
+  * fees are pooled: the first call of each group pays the minimum fee for
+    every transaction in the group plus the declared inner transactions, and
+    every other transaction is sent with a zero fee.
+
+Each group is atomic, but groups are independent and run concurrently, so calls
+that depend on one another must be executed in separate execute() calls. A
+group that fails for any reason (rejected, network error, undecodable
+response) only marks its own calls as failed; the other groups still run.
+
+    composer = GroupComposer(session)
+    results = await composer.execute(
+        [Call(registry, "register_startup", [...], boxes=[...]) for ...]
+    )
+    for result in results:  # same order as the calls
+        print(result.tx_id, result.return_value or result.error)
+"""
+
+import asyncio
+import copy
+import dataclasses
+import logging
+from collections.abc import Iterable
+
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    TransactionSigner,
+    TransactionWithSigner,
+)
+
+from smart_contracts.scripts.async_clients import AlgodError, AlgoSession, AsyncAppClient
+
+logger = logging.getLogger(__name__)
+
+MAX_GROUP_SIZE = 16
+MAX_REFERENCES = 8
+MAX_ACCOUNT_REFERENCES = 4
+DEFAULT_CONCURRENCY = 8
+
+
+@dataclasses.dataclass
+class Call:
+    client: AsyncAppClient
+    method: str
+    args: list = dataclasses.field(default_factory=list)
+    sender: str | None = None
+    signer: TransactionSigner | None = None
+    accounts: list[str] = dataclasses.field(default_factory=list)
+    foreign_apps: list[int] = dataclasses.field(default_factory=list)
+    foreign_assets: list[int] = dataclasses.field(default_factory=list)
+    # Names of boxes of the called app.
+    boxes: list[bytes] = dataclasses.field(default_factory=list)
+    # Inner transactions the call issues, covered by the pooled fee.
+    inner_txns: int = 0
+
+    @property
+    def txn_count(self) -> int:
+        return 1 + sum(isinstance(arg, TransactionWithSigner) for arg in self.args)
+
+
+@dataclasses.dataclass(frozen=True)
+class GroupCallResult:
+    call: Call
+    group_index: int
+    return_value: object = None
+    tx_id: str | None = None
+    confirmed_round: int | None = None
+    error: str | None = None
+
+
+@dataclasses.dataclass
+class _Slot:
+    """References that end up on one call's app-call transaction."""
+
+    call: Call
+    # Position of the call in the list passed to pack().
+    index: int
+    accounts: list[str] = dataclasses.field(default_factory=list)
+    apps: list[int] = dataclasses.field(default_factory=list)
+    assets: list[int] = dataclasses.field(default_factory=list)
+    boxes: list[bytes] = dataclasses.field(default_factory=list)
+
+    @property
+    def used(self) -> int:
+        return len(self.accounts) + len(self.apps) + len(self.assets) + len(self.boxes)
+
+    def accepts(self, kind: str) -> bool:
+        if self.used >= MAX_REFERENCES:
+            return False
+        return kind != "accounts" or len(self.accounts) < MAX_ACCOUNT_REFERENCES
+
+
+@dataclasses.dataclass
+class _Group:
+    slots: list[_Slot] = dataclasses.field(default_factory=list)
+
+    @property
+    def txn_count(self) -> int:
+        return sum(slot.call.txn_count for slot in self.slots)
+
+    def available(self) -> dict[str, set]:
+        """References every transaction of the group can already use."""
+        available = {"accounts": set(), "apps": set(), "assets": set()}
+        for slot in self.slots:
+            available["accounts"].update(slot.accounts)
+            available["apps"].update(slot.apps)
+            available["assets"].update(slot.assets)
+            available["apps"].add(slot.call.client.app_id)
+            sender = slot.call.sender or slot.call.client.default_sender
+            if sender:
+                available["accounts"].add(sender)
+        return available
+
+    def try_add(self, call: Call, index: int) -> bool:
+        """Places the call and its references, or leaves the group untouched and returns False."""
+        if self.txn_count + call.txn_count > MAX_GROUP_SIZE:
+            return False
+        trial = _Group([dataclasses.replace(slot, **_copied_refs(slot)) for slot in self.slots])
+        own = _Slot(call, index)
+        trial.slots.append(own)
+        available = trial.available()
+
+        same_app = [slot for slot in trial.slots if slot.call.client.app_id == call.client.app_id]
+        for name in call.boxes:
+            target = next((slot for slot in [own, *same_app] if slot.accepts("boxes")), None)
+            if target is None:
+                return False
+            target.boxes.append(name)
+
+        wanted = {"accounts": call.accounts, "apps": call.foreign_apps, "assets": call.foreign_assets}
+        for kind, refs in wanted.items():
+            for ref in dict.fromkeys(refs):
+                if ref in available[kind]:
+                    continue
+                target = next((slot for slot in [own, *trial.slots] if slot.accepts(kind)), None)
+                if target is None:
+                    return False
+                getattr(target, kind).append(ref)
+                available[kind].add(ref)
+
+        self.slots = trial.slots
+        return True
+
+
+def _copied_refs(slot: _Slot) -> dict[str, list]:
+    return {kind: list(getattr(slot, kind)) for kind in ("accounts", "apps", "assets", "boxes")}
+
+
+def pack(calls: Iterable[Call]) -> list[list[_Slot]]:
+    """First-fit packing of calls into groups; raises ValueError for a call that fits no group on its own."""
+    groups: list[_Group] = []
+    for index, call in enumerate(calls):
+        if any(group.try_add(call, index) for group in groups):
+            continue
+        group = _Group()
+        if not group.try_add(call, index):
+            raise ValueError(f"{call.method} on app {call.client.app_id} exceeds the limits of a single group")
+        groups.append(group)
+    return [group.slots for group in groups]
+
+
+def _unfunded(arg: TransactionWithSigner) -> TransactionWithSigner:
+    """A copy of a transaction argument with a zero fee; the caller's transaction is left as it was."""
+    txn = copy.copy(arg.txn)
+    txn.fee = 0
+    return TransactionWithSigner(txn, arg.signer)
+
+
+def _failed(group_index: int, slots: list[_Slot], error: BaseException) -> list[GroupCallResult]:
+    """Marks every call of a group as failed with the group's error."""
+    message = str(error) or type(error).__name__
+    logger.warning(f"Group {group_index} ({len(slots)} calls) failed: {message}")
+    return [GroupCallResult(slot.call, group_index, error=message) for slot in slots]
+
+
+class GroupComposer:
+    def __init__(self, session: AlgoSession, concurrency: int = DEFAULT_CONCURRENCY) -> None:
+        self.session = session
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def _compose(self, slots: list[_Slot]) -> AtomicTransactionComposer:
+        sp = await self.session.suggested_params()
+        pooled_fee = sp.min_fee * sum(slot.call.txn_count + slot.call.inner_txns for slot in slots)
+        atc = AtomicTransactionComposer()
+        for index, slot in enumerate(slots):
+            call_sp = copy.copy(sp)
+            call_sp.flat_fee = True
+            call_sp.fee = pooled_fee if index == 0 else 0
+            await slot.call.client.compose(
+                atc,
+                slot.call.method,
+                [_unfunded(arg) if isinstance(arg, TransactionWithSigner) else arg for arg in slot.call.args],
+                sender=slot.call.sender,
+                signer=slot.call.signer,
+                sp=call_sp,
+                accounts=slot.accounts or None,
+                foreign_apps=slot.apps or None,
+                foreign_assets=slot.assets or None,
+                boxes=[(0, name) for name in slot.boxes] or None,
+            )
+        return atc
+
+    async def _run_group(self, group_index: int, slots: list[_Slot], simulate: bool) -> list[GroupCallResult]:
+        async with self._semaphore:
+            try:
+                atc = await self._compose(slots)
+                signed = atc.gather_signatures()
+                # method call transactions, in slot order (argument transactions precede their call)
+                call_txns = [atc.txn_list[i].txn for i in atc.method_dict]
+                if simulate:
+                    response = await self.session.simulate(
+                        signed, allow_empty_signatures=True, allow_unnamed_resources=True
+                    )
+                    group = response["txn-groups"][0]
+                    if group.get("failure-message"):
+                        raise AlgodError(group["failure-message"])
+                    txn_results = [result["txn-result"] for result in group["txn-results"]]
+                    infos = [txn_results[i] for i in atc.method_dict]
+                    confirmed_round = None
+                else:
+                    await self.session.send(signed)
+                    confirmed = await self.session.wait_for_confirmation(call_txns[0].get_txid())
+                    confirmed_round = confirmed["confirmed-round"]
+                    infos = await asyncio.gather(
+                        *(self.session.algod("GET", f"/v2/transactions/pending/{txn.get_txid()}") for txn in call_txns)
+                    )
+                return [
+                    GroupCallResult(
+                        slot.call,
+                        group_index,
+                        return_value=slot.call.client.return_value(slot.call.method, info.get("logs", [])),
+                        tx_id=txn.get_txid(),
+                        confirmed_round=confirmed_round,
+                    )
+                    for slot, txn, info in zip(slots, call_txns, infos)
+                ]
+            except Exception as error:  # noqa: BLE001 - one group's failure must not abort the others
+                return _failed(group_index, slots, error)
+
+    async def execute(self, calls: Iterable[Call], simulate: bool = False) -> list[GroupCallResult]:
+        """Packs, submits (or simulates) all groups concurrently; results come back in call order."""
+        calls = list(calls)
+        groups = pack(calls)
+        logger.info(f"Packed {len(calls)} calls into {len(groups)} groups")
+        outcomes = await asyncio.gather(
+            *(self._run_group(index, slots, simulate) for index, slots in enumerate(groups)),
+            return_exceptions=True,
+        )
+        per_group = [
+            _failed(index, slots, outcome) if isinstance(outcome, BaseException) else outcome
+            for (index, slots), outcome in zip(enumerate(groups), outcomes)
+        ]
+        # keyed by position, so a Call passed twice gets a result per occurrence
+        by_index = {
+            slot.index: result for slots, results in zip(groups, per_group) for slot, result in zip(slots, results)
+        }
+        return [by_index[index] for index in range(len(calls))]
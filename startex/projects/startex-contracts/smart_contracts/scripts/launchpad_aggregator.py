@@ -0,0 +1,204 @@
+# smart_contracts/scripts/launchpad_aggregator.py
+
+"""
+Platform-wide view of every LaunchpadApp sale.
+
+Launchpads are discovered from the launchpad_app_id field of the registry's
+Startup boxes, and their global state is fetched concurrently into a
+round-stamped in-memory table. On refresh, the indexer is asked, per known
+app (the registry and each launchpad), whether it was called since the last
+stamped round; only launchpads that were called are re-read, and the
+registry is only re-scanned when it was called itself. The table is stamped
+with the round the indexer has caught up to, never past it, so calls the
+indexer has not ingested yet are picked up by the next refresh. Without an
+indexer every refresh falls back to a full reload.
+
+Dashboards query the table (total raised, active sales, sales ending soon)
+instead of making one algod call per launchpad.
+
+Usage:
+    python -m smart_contracts.scripts.launchpad_aggregator --registry-app-id 1000 --interval 10
+"""
+
+import argparse
+import dataclasses
+import logging
+import os
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from dotenv import load_dotenv
+
+from smart_contracts.scripts.chain import (
+    DEFAULT_READ_CONCURRENCY,
+    get_algorand,
+    list_box_names,
+    read_boxes,
+    read_global_state,
+)
+
+logger = logging.getLogger(__name__)
+
+# Startup box layout (see startup_registry/startup_registry.py):
+# owner(32) + 5 string offsets(2 each) + token_asset_id(8) + created_at(8)
+# + is_verified(1) + total_score(8) + launchpad_app_id(8)
+STARTUP_KEY_LEN = 8
+STARTUP_LAUNCHPAD_OFFSET = 67
+
+
+@dataclasses.dataclass(frozen=True)
+class LaunchpadRow:
+    startup_id: int
+    app_id: int
+    token_id: int
+    token_price: int
+    sale_start_time: int
+    sale_end_time: int
+    tokens_remaining: int
+    total_raised: int
+    is_sale_active: bool
+    round: int
+
+    def is_open(self, now: int) -> bool:
+        return self.is_sale_active and self.sale_start_time <= now < self.sale_end_time
+
+
+class LaunchpadAggregator:
+    def __init__(self, registry_app_id: int, concurrency: int = DEFAULT_READ_CONCURRENCY) -> None:
+        self.registry_app_id = registry_app_id
+        self.concurrency = concurrency
+        self.algorand = get_algorand()
+        self.algod = self.algorand.client.algod
+        self.round = 0
+        self.rows: dict[int, LaunchpadRow] = {}
+        self._launchpads: dict[int, int] = {}  # app_id -> startup_id
+        self._lock = threading.Lock()
+
+    # -------------------------- Refresh -------------------------- #
+
+    def refresh(self) -> int:
+        """Brings the table up to the current round; returns how many launchpads were re-read."""
+        current_round = self.algod.status()["last-round"]
+        called = self._called_apps_since(self.round, current_round) if self.round else None
+        stamp_round = current_round
+        if called is not None:
+            called, stamp_round = called
+
+        if called is None or self.registry_app_id in called:
+            self._launchpads = self._discover()
+        if called is None:
+            stale = set(self._launchpads)
+        else:
+            stale = {app_id for app_id in self._launchpads if app_id in called or app_id not in self.rows}
+
+        fresh = self._fetch(stale, current_round)
+        with self._lock:
+            self.rows = {
+                app_id: fresh.get(app_id) or self.rows[app_id]
+                for app_id in self._launchpads
+                if app_id in fresh or app_id in self.rows
+            }
+            self.round = stamp_round
+        logger.info(f"Round {stamp_round}: refreshed {len(fresh)}/{len(self._launchpads)} launchpads")
+        return len(fresh)
+
+    def _discover(self) -> dict[int, int]:
+        names = list_box_names(self.algod, self.registry_app_id, STARTUP_KEY_LEN)
+        startups = read_boxes(self.algod, self.registry_app_id, names, self.concurrency)
+        launchpads = {}
+        for key, value in startups.items():
+            app_id = struct.unpack_from(">Q", value, STARTUP_LAUNCHPAD_OFFSET)[0]
+            if app_id:
+                launchpads[app_id] = struct.unpack(">Q", key)[0]
+        return launchpads
+
+    def _called_apps_since(self, min_round: int, max_round: int) -> tuple[set[int], int] | None:
+        """
+        Known apps called (directly or as inner calls) in (min_round, max_round], and
+        the round that answer is complete up to; None without an indexer.
+        """
+        try:
+            indexer = self.algorand.client.indexer
+        except Exception:  # noqa: BLE001 - indexer is optional
+            return None
+
+        def was_called(app_id: int) -> tuple[int, bool, int]:
+            response = indexer.search_transactions(
+                application_id=app_id, min_round=min_round + 1, max_round=max_round, limit=1
+            )
+            return app_id, bool(response["transactions"]), response["current-round"]
+
+        app_ids = [self.registry_app_id, *self._launchpads]
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            results = list(pool.map(was_called, app_ids))
+        called = {app_id for app_id, hit, _ in results if hit}
+        # the indexer may lag algod; never stamp a round it has not ingested
+        indexed_round = min((indexer_round for _, _, indexer_round in results), default=max_round)
+        return called, max(min_round, min(max_round, indexed_round))
+
+    def _fetch(self, app_ids: set[int], current_round: int) -> dict[int, LaunchpadRow]:
+        def fetch_one(app_id: int) -> LaunchpadRow:
+            state = read_global_state(self.algod, app_id)
+            return LaunchpadRow(
+                startup_id=self._launchpads[app_id],
+                app_id=app_id,
+                token_id=state.get("token_id", 0),
+                token_price=state.get("token_price_microalgos", 0),
+                sale_start_time=state.get("sale_start_time", 0),
+                sale_end_time=state.get("sale_end_time", 0),
+                tokens_remaining=state.get("tokens_remaining", 0),
+                total_raised=state.get("total_raised_microalgos", 0),
+                is_sale_active=bool(state.get("is_sale_active", 0)),
+                round=current_round,
+            )
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            return {row.app_id: row for row in pool.map(fetch_one, sorted(app_ids))}
+
+    # --------------------------- Queries --------------------------- #
+
+    def snapshot(self) -> list[LaunchpadRow]:
+        with self._lock:
+            return sorted(self.rows.values(), key=lambda row: row.app_id)
+
+    def total_raised(self) -> int:
+        return sum(row.total_raised for row in self.snapshot())
+
+    def active_sales(self, now: int | None = None) -> list[LaunchpadRow]:
+        now = int(time.time()) if now is None else now
+        return [row for row in self.snapshot() if row.is_open(now)]
+
+    def ending_soon(self, within_seconds: int, now: int | None = None) -> list[LaunchpadRow]:
+        now = int(time.time()) if now is None else now
+        rows = [row for row in self.active_sales(now) if row.sale_end_time - now <= within_seconds]
+        return sorted(rows, key=lambda row: row.sale_end_time)
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Aggregate LaunchpadApp sales across the platform")
+    parser.add_argument("--registry-app-id", type=int, default=int(os.getenv("REGISTRY_APP_ID", "0")))
+    parser.add_argument("--interval", type=float, default=0, help="keep refreshing every N seconds")
+    parser.add_argument("--ending-within", type=int, default=3600)
+    args = parser.parse_args()
+
+    aggregator = LaunchpadAggregator(args.registry_app_id)
+    while True:
+        aggregator.refresh()
+        active = aggregator.active_sales()
+        ending = aggregator.ending_soon(args.ending_within)
+        logger.info(
+            f"round={aggregator.round} launchpads={len(aggregator.rows)} "
+            f"total_raised={aggregator.total_raised()} active={len(active)} ending_soon={len(ending)}"
+        )
+        if not args.interval:
+            break
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+# smart_contracts/scripts/load_test.py
+
+"""
+Purchase-storm load test for LaunchpadApp.
+
+Builds LaunchpadApp from the current contract sources, deploys it (and a test
+ASA) to LocalNet, funds and opts in N synthetic buyers, then fires concurrent
+buy_tokens groups. Reports confirmed TPS, p50/p95/p99 confirmation latency,
+failures grouped by reason, and the fees paid.
+
+A first purchase writes the buyer record and one buyer-list page. Its box
+references are sized from those boxes (1KB of I/O budget per reference), and
+references that do not fit on the buy_tokens call ride on extra
+get_sale_state calls in the same group.
+
+Usage (LocalNet must be running: `algokit localnet start`):
+    python -m smart_contracts.scripts.load_test --buyers 200 --concurrency 32
+"""
+
+import argparse
+import collections
+import dataclasses
+import json
+import logging
+import math
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import algokit_utils
+from algosdk import transaction
+from algosdk.abi import Method
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer, TransactionWithSigner
+from algosdk.logic import get_application_address
+from dotenv import load_dotenv
+
+from smart_contracts.launchpad.pricing import (
+    BUYER_PAGE_MBR,
+    BUYER_PAGE_SIZE,
+    BUYER_RECORD_MBR,
+    BUYER_RECORD_SIZE,
+    BUYERS_PER_PAGE,
+)
+from smart_contracts.scripts.chain import build_app_spec, create_app_from_source, get_algorand
+
+logger = logging.getLogger(__name__)
+
+MAX_GROUP_SIZE = 16
+TOKEN_SUPPLY = 10_000_000_000
+TOKEN_PRICE = 1_000
+BUYER_FUNDING = 10_000_000
+APP_FUNDING = 10_000_000
+SALE_DURATION = 3600
+# Box I/O budget each box reference adds to the group
+BOX_IO_BUDGET = 1024
+MAX_REFERENCES = 8
+
+SETUP = Method.from_signature("setup(address,uint64)void")
+SET_SALE_PARAMETERS = Method.from_signature("set_sale_parameters(uint64,uint64,uint64)bool")
+OPT_IN_TO_ASSET = Method.from_signature("opt_in_to_asset()bool")
+FUND = Method.from_signature("fund(axfer)bool")
+ACTIVATE_SALE = Method.from_signature("activate_sale()bool")
+
+
+@dataclasses.dataclass
+class Attempt:
+    buyer: str
+    started: float
+    latency: float
+    fees: int
+    error: str | None = None
+
+
+class BuyerPages:
+    """
+    Tracks which buyer-list pages a purchase may append to.
+
+    buy_tokens appends a new buyer at index buyer_count, which grows by one per
+    confirmed first purchase. Only this process buys, so a first purchase lands
+    between the first purchases confirmed and those submitted before it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._known: set[str] = set()
+        self._confirmed = 0
+        self._submitted = 0
+
+    def reserve(self, buyer: str) -> range:
+        """Candidate pages for this purchase; empty once the buyer is known to have a record."""
+        with self._lock:
+            if buyer in self._known:
+                return range(0)
+            low, high = self._confirmed, self._submitted
+            self._submitted += 1
+        return range(low // BUYERS_PER_PAGE, high // BUYERS_PER_PAGE + 1)
+
+    def confirmed(self, buyer: str) -> None:
+        with self._lock:
+            if buyer not in self._known:
+                self._known.add(buyer)
+                self._confirmed += 1
+
+
+def box_references(buyer_key: bytes, pages: range) -> list[tuple[int, bytes]]:
+    """Named boxes of the purchase, padded with empty references up to its box I/O."""
+    names = [b"b" + buyer_key] + [b"l" + page.to_bytes(8, "big") for page in pages]
+    io_bytes = BUYER_RECORD_SIZE + (BUYER_PAGE_SIZE if pages else 0)
+    count = max(len(names), math.ceil(io_bytes / BOX_IO_BUDGET))
+    return [(0, name) for name in names] + [(0, b"")] * (count - len(names))
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def failure_reason(error: Exception) -> str:
+    """Groups failures by assert comment / node error rather than full message."""
+    message = str(error)
+    match = re.search(r"(assert failed[^\n]*|logic eval error: [^.:\n]*|overspend|txn dead|below min)", message)
+    return match.group(1) if match else type(error).__name__
+
+
+def deploy_launchpad(algorand, deployer) -> tuple[int, int]:
+    """Creates the test ASA and a funded, active launchpad; returns (app_id, asset_id)."""
+    algod = algorand.client.algod
+
+    asset_id = algorand.send.asset_create(
+        algokit_utils.AssetCreateParams(sender=deployer.address, total=TOKEN_SUPPLY, decimals=0, unit_name="LOAD")
+    ).asset_id
+
+    app_id = create_app_from_source(algorand, deployer, "launchpad")
+    app_address = get_application_address(app_id)
+
+    now = int(time.time())
+    atc = AtomicTransactionComposer()
+    sp = algod.suggested_params()
+    atc.add_transaction(
+        TransactionWithSigner(transaction.PaymentTxn(deployer.address, sp, app_address, APP_FUNDING), deployer.signer)
+    )
+    call = dict(app_id=app_id, sender=deployer.address, sp=sp, signer=deployer.signer)
+    atc.add_method_call(method=SETUP, method_args=[deployer.address, asset_id], **call)
+    atc.add_method_call(method=SET_SALE_PARAMETERS, method_args=[TOKEN_PRICE, now - 10, now + SALE_DURATION], **call)
+    opt_in_sp = algod.suggested_params()
+    opt_in_sp.flat_fee = True
+    opt_in_sp.fee = 2 * opt_in_sp.min_fee
+    atc.add_method_call(method=OPT_IN_TO_ASSET, **{**call, "sp": opt_in_sp}, foreign_assets=[asset_id])
+    axfer = transaction.AssetTransferTxn(deployer.address, sp, app_address, TOKEN_SUPPLY, asset_id)
+    atc.add_method_call(method=FUND, method_args=[TransactionWithSigner(axfer, deployer.signer)], **call)
+    atc.add_method_call(method=ACTIVATE_SALE, **call)
+    atc.execute(algod, wait_rounds=4)
+    return app_id, asset_id
+
+
+def create_buyers(algorand, deployer, asset_id: int, count: int) -> list:
+    """Funds `count` random accounts and opts them into the sale ASA."""
+    algod = algorand.client.algod
+    buyers = [algorand.account.random() for _ in range(count)]
+    for i in range(0, count, MAX_GROUP_SIZE):
+        batch = buyers[i : i + MAX_GROUP_SIZE]
+        sp = algod.suggested_params()
+        atc = AtomicTransactionComposer()
+        for buyer in batch:
+            txn = transaction.PaymentTxn(deployer.address, sp, buyer.address, BUYER_FUNDING)
+            atc.add_transaction(TransactionWithSigner(txn, deployer.signer))
+        atc.execute(algod, wait_rounds=4)
+
+        atc = AtomicTransactionComposer()
+        for buyer in batch:
+            txn = transaction.AssetOptInTxn(buyer.address, sp, asset_id)
+            atc.add_transaction(TransactionWithSigner(txn, buyer.signer))
+        atc.execute(algod, wait_rounds=4)
+    return buyers
+
+
+def buy(algod, buyer, app_id: int, asset_id: int, amount: int, pages: BuyerPages) -> Attempt:
+    contract = build_app_spec("launchpad").contract
+    candidate_pages = pages.reserve(buyer.address)
+    if candidate_pages:
+        # A first purchase also pays the box MBR; when the buyer does not open a
+        # page, the page share is spent on tokens like the rest of the payment.
+        amount += BUYER_RECORD_MBR + BUYER_PAGE_MBR
+    boxes = box_references(buyer.public_key, candidate_pages)
+    # the buy_tokens call also references the sale asset
+    chunks = [boxes[: MAX_REFERENCES - 1]] + [
+        boxes[i : i + MAX_REFERENCES] for i in range(MAX_REFERENCES - 1, len(boxes), MAX_REFERENCES)
+    ]
+    if 1 + len(chunks) > MAX_GROUP_SIZE:
+        raise ValueError(f"{len(boxes)} box references do not fit in one group; lower --concurrency")
+
+    sp = algod.suggested_params()
+    payment = transaction.PaymentTxn(buyer.address, sp, get_application_address(app_id), amount)
+    call_sp = algod.suggested_params()
+    call_sp.flat_fee = True
+    # app call covers the inner asset transfer and a possible refund
+    call_sp.fee = 3 * call_sp.min_fee
+    fees = payment.fee + call_sp.fee + (len(chunks) - 1) * sp.min_fee
+
+    atc = AtomicTransactionComposer()
+    call = dict(app_id=app_id, sender=buyer.address, signer=buyer.signer)
+    atc.add_method_call(
+        method=contract.get_method_by_name("buy_tokens"),
+        method_args=[TransactionWithSigner(payment, buyer.signer)],
+        sp=call_sp,
+        foreign_assets=[asset_id],
+        boxes=chunks[0],
+        **call,
+    )
+    for chunk in chunks[1:]:
+        atc.add_method_call(method=contract.get_method_by_name("get_sale_state"), sp=sp, boxes=chunk, **call)
+
+    started = time.perf_counter()
+    try:
+        atc.execute(algod, wait_rounds=4)
+    except Exception as error:  # noqa: BLE001 - every failure is a data point here
+        return Attempt(buyer.address, started, time.perf_counter() - started, 0, failure_reason(error))
+    pages.confirmed(buyer.address)
+    return Attempt(buyer.address, started, time.perf_counter() - started, fees)
+
+
+def run(buyer_count: int, concurrency: int, purchases_per_buyer: int, amount: int) -> dict:
+    algorand = get_algorand()
+    algod = algorand.client.algod
+    deployer = algorand.account.localnet_dispenser()
+
+    logger.info("Deploying launchpad")
+    app_id, asset_id = deploy_launchpad(algorand, deployer)
+    logger.info(f"Funding {buyer_count} buyers")
+    buyers = create_buyers(algorand, deployer, asset_id, buyer_count)
+
+    pages = BuyerPages()
+
+    def attempt(buyer) -> Attempt:
+        return buy(algod, buyer, app_id, asset_id, amount, pages)
+
+    jobs = [buyer for buyer in buyers for _ in range(purchases_per_buyer)]
+    logger.info(f"Firing {len(jobs)} purchases with concurrency {concurrency}")
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        attempts = list(pool.map(attempt, jobs))
+    wall = time.perf_counter() - wall_start
+
+    confirmed = [a for a in attempts if a.error is None]
+    latencies = sorted(a.latency for a in confirmed)
+    return {
+        "app_id": app_id,
+        "attempts": len(attempts),
+        "confirmed": len(confirmed),
+        "failed": len(attempts) - len(confirmed),
+        "wall_seconds": round(wall, 3),
+        "confirmed_tps": round(len(confirmed) / wall, 2) if wall else 0.0,
+        "latency_seconds": {
+            "p50": round(percentile(latencies, 50), 3),
+            "p95": round(percentile(latencies, 95), 3),
+            "p99": round(percentile(latencies, 99), 3),
+            "max": round(latencies[-1], 3) if latencies else 0.0,
+        },
+        "failure_reasons": dict(collections.Counter(a.error for a in attempts if a.error).most_common()),
+        "fees_microalgos": sum(a.fees for a in confirmed),
+    }
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="LaunchpadApp purchase-storm load test")
+    parser.add_argument("--buyers", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--purchases-per-buyer", type=int, default=1)
+    parser.add_argument("--amount", type=int, default=100 * TOKEN_PRICE, help="microAlgos per purchase")
+    parser.add_argument("--output", type=Path, help="write the report as JSON")
+    args = parser.parse_args()
+
+    report = run(args.buyers, args.concurrency, args.purchases_per_buyer, args.amount)
+    print(json.dumps(report, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
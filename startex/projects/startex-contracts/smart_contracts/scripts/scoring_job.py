@@ -0,0 +1,188 @@
+# smart_contracts/scripts/scoring_job.py
+
+"""
+Scoring oracle: copies StartupMetricsApp total scores into CompetitionApp
+participant boxes.
+
+Each cycle reads every Metrics box and every Participant box in bulk, keeps
+only the entries whose competition is still running and whose score changed,
+and submits those through update_participant_score in atomic groups. Progress
+is written to a checkpoint file after every group, so an interrupted run
+resumes from the last confirmed group instead of starting over. Re-sending a
+group is harmless: the method just writes the same score again.
+
+Usage:
+    python -m smart_contracts.scripts.scoring_job \
+        --metrics-app-id 1001 --competition-app-id 1002
+
+The signing account is read from DEPLOYER_MNEMONIC (competition owner).
+"""
+
+import argparse
+import dataclasses
+import json
+import logging
+import os
+import struct
+from pathlib import Path
+
+from algosdk.abi import Method
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer
+from dotenv import load_dotenv
+
+from smart_contracts.scripts.chain import get_algorand, latest_timestamp, list_box_names, read_boxes
+from smart_contracts.scripts.competition_layout import (
+    COMPETITION_KEY_LEN,
+    PART_SCORE_OFFSET,
+    PARTICIPANT_KEY_LEN,
+    STATUS_ACTIVE,
+    STATUS_UPCOMING,
+    effective_status,
+    read_u64,
+)
+
+logger = logging.getLogger(__name__)
+
+MAX_GROUP_SIZE = 16
+DEFAULT_CHECKPOINT = Path(".scoring_checkpoint.json")
+
+UPDATE_SCORE = Method.from_signature("update_participant_score(uint64,uint64,uint64)bool")
+
+# Metrics box layout (see metrics.py)
+METRICS_KEY_LEN = 8
+METRICS_TOTAL_SCORE_OFFSET = 64
+
+
+@dataclasses.dataclass
+class ScoreUpdate:
+    competition_id: int
+    startup_id: int
+    score: int
+
+
+@dataclasses.dataclass
+class Checkpoint:
+    started_at: int
+    updates: list[ScoreUpdate]
+    next_index: int = 0
+
+    @property
+    def done(self) -> bool:
+        return self.next_index >= len(self.updates)
+
+    @classmethod
+    def load(cls, path: Path) -> "Checkpoint | None":
+        if not path.exists():
+            return None
+        data = json.loads(path.read_text())
+        return cls(
+            started_at=data["started_at"],
+            updates=[ScoreUpdate(*u) for u in data["updates"]],
+            next_index=data["next_index"],
+        )
+
+    def save(self, path: Path) -> None:
+        data = {
+            "started_at": self.started_at,
+            "updates": [dataclasses.astuple(u) for u in self.updates],
+            "next_index": self.next_index,
+        }
+        # Write-then-rename so a crash never leaves a half-written checkpoint.
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data))
+        tmp_path.replace(path)
+
+
+def compute_updates(algod, metrics_app_id: int, competition_app_id: int, now: int) -> list[ScoreUpdate]:
+    """Diffs metrics total scores against the scores stored in running competitions."""
+    metrics = read_boxes(
+        algod, metrics_app_id, list_box_names(algod, metrics_app_id, METRICS_KEY_LEN)
+    )
+    scores = {read_u64(key, 0): read_u64(value, METRICS_TOTAL_SCORE_OFFSET) for key, value in metrics.items()}
+
+    competition_names = list_box_names(algod, competition_app_id)
+    competitions = read_boxes(
+        algod, competition_app_id, [n for n in competition_names if len(n) == COMPETITION_KEY_LEN]
+    )
+    running = {
+        read_u64(key, 0)
+        for key, value in competitions.items()
+        if effective_status(value, now) in (STATUS_UPCOMING, STATUS_ACTIVE)
+    }
+
+    participant_names = [
+        n for n in competition_names if len(n) == PARTICIPANT_KEY_LEN and read_u64(n, 0) in running
+    ]
+    participants = read_boxes(algod, competition_app_id, participant_names)
+
+    updates = []
+    for key, value in participants.items():
+        cid, sid = read_u64(key, 0), read_u64(key, 8)
+        score = scores.get(sid)
+        if score is not None and score != read_u64(value, PART_SCORE_OFFSET):
+            updates.append(ScoreUpdate(cid, sid, score))
+    updates.sort(key=lambda u: (u.competition_id, u.startup_id))
+    return updates
+
+
+def submit_updates(algorand, account, competition_app_id: int, checkpoint: Checkpoint, checkpoint_path: Path) -> None:
+    """Sends the remaining checkpoint updates in groups of MAX_GROUP_SIZE."""
+    algod = algorand.client.algod
+    while not checkpoint.done:
+        batch = checkpoint.updates[checkpoint.next_index : checkpoint.next_index + MAX_GROUP_SIZE]
+        sp = algod.suggested_params()
+        atc = AtomicTransactionComposer()
+        for update in batch:
+            atc.add_method_call(
+                app_id=competition_app_id,
+                method=UPDATE_SCORE,
+                sender=account.address,
+                sp=sp,
+                signer=account.signer,
+                method_args=[update.competition_id, update.startup_id, update.score],
+                boxes=[(0, struct.pack(">QQ", update.competition_id, update.startup_id))],
+            )
+        atc.execute(algod, wait_rounds=4)
+
+        checkpoint.next_index += len(batch)
+        checkpoint.save(checkpoint_path)
+        logger.info(f"Submitted {checkpoint.next_index}/{len(checkpoint.updates)} score updates")
+
+
+def run(metrics_app_id: int, competition_app_id: int, checkpoint_path: Path = DEFAULT_CHECKPOINT) -> int:
+    """Runs (or resumes) one scoring cycle and returns the number of updates sent."""
+    algorand = get_algorand()
+    account = algorand.account.from_environment("DEPLOYER")
+
+    checkpoint = Checkpoint.load(checkpoint_path)
+    if checkpoint is not None and not checkpoint.done:
+        logger.info(
+            f"Resuming cycle from {checkpoint.started_at} at {checkpoint.next_index}/{len(checkpoint.updates)}"
+        )
+    else:
+        # Contract status is derived from block time, not the local clock.
+        now = latest_timestamp(algorand.client.algod)
+        updates = compute_updates(algorand.client.algod, metrics_app_id, competition_app_id, now)
+        logger.info(f"{len(updates)} participant scores changed")
+        checkpoint = Checkpoint(started_at=now, updates=updates)
+        checkpoint.save(checkpoint_path)
+
+    submit_updates(algorand, account, competition_app_id, checkpoint, checkpoint_path)
+    return len(checkpoint.updates)
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Feed metrics scores into competition participants")
+    parser.add_argument("--metrics-app-id", type=int, default=int(os.getenv("METRICS_APP_ID", "0")))
+    parser.add_argument("--competition-app-id", type=int, default=int(os.getenv("COMPETITION_APP_ID", "0")))
+    parser.add_argument("--checkpoint", type=Path, default=DEFAULT_CHECKPOINT)
+    args = parser.parse_args()
+
+    run(args.metrics_app_id, args.competition_app_id, args.checkpoint)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# smart_contracts/scripts/settle_auction.py
+
+"""
+Settlement job for LaunchpadApp batch auctions.
+
+After the sale window closes, lists every commitment box ("c" + address) and
+clears them through settle_commitments. Each app call settles a few buyers
+(bounded by the per-transaction reference limits) and up to 16 calls go out
+as one atomic group, so a whole sale settles in len(buyers) / 32 groups.
+Already-settled buyers are skipped by the contract, so the job can simply be
+re-run if it is interrupted.
+
+A buyer whose transfer would fail (opted out of the token, frozen holding,
+closed account that the refund cannot re-create) does not revert the batch:
+the contract records the commitment under "u" + address, counts it as
+settled, and the buyer pulls it later with claim_settlement. The job logs
+those buyers at the end.
+
+Usage:
+    python -m smart_contracts.scripts.settle_auction --launchpad-app-id 1003
+"""
+
+import argparse
+import logging
+import os
+
+from algosdk.abi import Method
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer
+from algosdk.encoding import decode_address, encode_address
+from dotenv import load_dotenv
+
+from smart_contracts.scripts.chain import get_algorand, list_box_names, read_global_state
+
+logger = logging.getLogger(__name__)
+
+MAX_GROUP_SIZE = 16
+# asset + 2 accounts + 2 commitment boxes + 2 unclaimed boxes (written when a
+# transfer would fail) stays within the 8 foreign references of a call
+BUYERS_PER_CALL = 2
+
+COMMIT_PREFIX = b"c"
+UNCLAIMED_PREFIX = b"u"
+COMMIT_KEY_LEN = 1 + 32
+
+SETTLE_COMMITMENTS = Method.from_signature("settle_commitments(address[])uint64")
+
+
+def pending_buyers(algod, app_id: int, prefix: bytes = COMMIT_PREFIX) -> list[str]:
+    names = list_box_names(algod, app_id, COMMIT_KEY_LEN)
+    return sorted(encode_address(name[1:]) for name in names if name.startswith(prefix))
+
+
+def settle(app_id: int) -> int:
+    """Settles all outstanding commitments and returns the number of tokens allocated."""
+    algorand = get_algorand()
+    algod = algorand.client.algod
+    account = algorand.account.from_environment("DEPLOYER")
+    token_id = read_global_state(algod, app_id)["token_id"]
+
+    buyers = pending_buyers(algod, app_id)
+    logger.info(f"{len(buyers)} commitments to settle")
+
+    calls = [buyers[i : i + BUYERS_PER_CALL] for i in range(0, len(buyers), BUYERS_PER_CALL)]
+    distributed = 0
+    for g in range(0, len(calls), MAX_GROUP_SIZE):
+        atc = AtomicTransactionComposer()
+        for batch in calls[g : g + MAX_GROUP_SIZE]:
+            sp = algod.suggested_params()
+            # Outer call pays for itself plus an axfer and a refund per buyer
+            sp.flat_fee = True
+            sp.fee = sp.min_fee * (1 + 2 * len(batch))
+            atc.add_method_call(
+                app_id=app_id,
+                method=SETTLE_COMMITMENTS,
+                sender=account.address,
+                sp=sp,
+                signer=account.signer,
+                method_args=[batch],
+                accounts=batch,
+                foreign_assets=[token_id],
+                boxes=[(0, prefix + decode_address(b)) for b in batch for prefix in (COMMIT_PREFIX, UNCLAIMED_PREFIX)],
+            )
+        result = atc.execute(algod, wait_rounds=4)
+        distributed += sum(r.return_value for r in result.abi_results)
+        logger.info(f"Settled {min((g + MAX_GROUP_SIZE) * BUYERS_PER_CALL, len(buyers))}/{len(buyers)} buyers")
+
+    unclaimed = pending_buyers(algod, app_id, UNCLAIMED_PREFIX)
+    if unclaimed:
+        logger.warning(
+            f"{len(unclaimed)} buyers could not receive their allocation and must call claim_settlement: "
+            + ", ".join(unclaimed)
+        )
+    return distributed
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Settle LaunchpadApp auction commitments")
+    parser.add_argument("--launchpad-app-id", type=int, default=int(os.getenv("LAUNCHPAD_APP_ID", "0")))
+    args = parser.parse_args()
+
+    tokens = settle(args.launchpad_app_id)
+    logger.info(f"Allocated {tokens} tokens")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+# smart_contracts/scripts/struct_codecs.py
+
+"""
+Precompiled ABI codecs for the struct dataclasses of the generated clients.
+
+The generated clients decode through algosdk's generic ABI types and build their
+dataclasses field by field. For bulk reads (raw box values, array returns) that
+dominates, so the async clients decode struct values through a StructCodec instead:
+one per (dataclass, ABI tuple type), compiled once and shared by every client.
+
+    codec = struct_codec(client_module.Startup, "(address,string,...,uint64)")
+    startups = codec.decode_many(raw_box_values)
+"""
+
+import dataclasses
+import functools
+import struct
+from collections.abc import Iterable
+
+from algosdk import encoding
+
+
+@functools.lru_cache(maxsize=65536)
+def _encode_address(public_key: bytes) -> str:
+    """Box records repeat owners, and the checksum dominates decoding otherwise."""
+    return encoding.encode_address(public_key)
+
+
+class StructCodec:
+    """
+    ABI codec for one struct, compiled once for its fixed tuple layout.
+
+    The static head is read and written with a single `struct.Struct`; strings are
+    sliced from the tail through their head offsets, and consecutive bools share a
+    byte as in the ABI. `decode` takes raw bytes (an ABI return or a box value),
+    `decode_many` bulk-decodes raw box values and `decode_array` a `(...)[]` return.
+    """
+
+    __slots__ = ("cls", "abi_type", "names", "static_size", "decode", "encode", "from_tuple")
+
+    _FORMATS = {"uint64": "Q", "address": "32s", "string": "H"}
+
+    def __init__(self, cls: type, abi_type: str) -> None:
+        self.cls = cls
+        self.abi_type = abi_type
+        self.names = tuple(field.name for field in dataclasses.fields(cls))
+        types = abi_type.strip("()").split(",")
+        if len(types) != len(self.names):
+            raise ValueError(f"{abi_type} does not match the fields of {cls.__name__}")
+
+        head_format, head_vars, values, encoded, tail = [], [], [], [], []
+        bool_bit = 8
+        for name, abi_name in zip(self.names, types):
+            if abi_name == "bool":
+                if bool_bit == 8:
+                    head_format.append("B")
+                    head_vars.append(f"h{len(head_vars)}")
+                    encoded.append([])
+                    bool_bit = 0
+                mask = 0x80 >> bool_bit
+                values.append(f"bool({head_vars[-1]} & {mask})")
+                encoded[-1].append(f"({mask} if value.{name} else 0)")
+                bool_bit += 1
+                continue
+            if abi_name not in self._FORMATS:
+                raise ValueError(f"Unsupported ABI type {abi_name} in {abi_type}")
+            bool_bit = 8
+            var = f"h{len(head_vars)}"
+            head_format.append(self._FORMATS[abi_name])
+            head_vars.append(var)
+            if abi_name == "uint64":
+                values.append(var)
+                encoded.append(f"value.{name}")
+            elif abi_name == "address":
+                values.append(f"_encode_address({var})")
+                encoded.append(f"_decode_address(value.{name})")
+            else:
+                values.append(f"data[{var} + 2:{var} + 2 + (data[{var}] << 8 | data[{var} + 1])].decode()")
+                encoded.append(f"o{len(tail)}")
+                tail.append(name)
+
+        head = struct.Struct(">" + "".join(head_format))
+        self.static_size = None if tail else head.size
+        lines = [f"t{i} = value.{name}.encode()" for i, name in enumerate(tail)]
+        offset = str(head.size)
+        for i in range(len(tail)):
+            lines.append(f"o{i} = {offset}")
+            offset = f"o{i} + 2 + len(t{i})"
+        pack_args = ", ".join(" | ".join(item) if isinstance(item, list) else item for item in encoded)
+        tail_bytes = "".join(f" + len(t{i}).to_bytes(2) + t{i}" for i in range(len(tail)))
+        source = "\n".join(
+            [
+                "def decode(data):",
+                f"    {', '.join(head_vars)}, = _unpack(data)",
+                *self._construct(values),
+                "def encode(value):",
+                *(f"    {line}" for line in lines),
+                f"    return _pack({pack_args}){tail_bytes}",
+                "def from_tuple(values):",
+                *self._construct([f"values[{i}]" for i in range(len(self.names))]),
+            ]
+        )
+        namespace = {
+            "_cls": cls,
+            "_new": object.__new__,
+            **{f"_set_{name}": getattr(cls, name).__set__ for name in self.names if self._slotted},
+            "_unpack": head.unpack_from,
+            "_pack": head.pack,
+            "_encode_address": _encode_address,
+            "_decode_address": encoding.decode_address,
+        }
+        exec(compile(source, f"<{cls.__name__} codec>", "exec"), namespace)
+        self.decode = namespace["decode"]
+        self.encode = namespace["encode"]
+        self.from_tuple = namespace["from_tuple"]
+
+    @property
+    def _slotted(self) -> bool:
+        return "__slots__" in self.cls.__dict__
+
+    def _construct(self, expressions: list[str]) -> list[str]:
+        """Body lines that build the instance, skipping the frozen __init__'s per-field setattr."""
+        lines = ["    value = _new(_cls)"]
+        if self._slotted:
+            lines += [f"    _set_{name}(value, {expression})" for name, expression in zip(self.names, expressions)]
+        else:
+            fields = ", ".join(f"{name}={expression}" for name, expression in zip(self.names, expressions))
+            lines.append(f"    value.__dict__.update({fields})")
+        return [*lines, "    return value"]
+
+    def decode_many(self, values: Iterable[bytes]) -> list:
+        return list(map(self.decode, values))
+
+    def decode_array(self, data: bytes) -> list:
+        count = int.from_bytes(data[:2])
+        if self.static_size is not None:
+            size = self.static_size
+            return [self.decode(data[start : start + size]) for start in range(2, 2 + count * size, size)]
+        body = data[2:]
+        offsets = struct.unpack_from(f">{count}H", body)
+        ends = (*offsets[1:], len(body))
+        return [self.decode(body[start:end]) for start, end in zip(offsets, ends)]
+
+
+@functools.cache
+def struct_codec(cls: type, abi_type: str) -> StructCodec:
+    """The codec for a struct dataclass and its ABI tuple type, compiled once per process."""
+    return StructCodec(cls, abi_type)
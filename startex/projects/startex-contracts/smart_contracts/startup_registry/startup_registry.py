@@ -58,6 +58,12 @@ class Startup(abi.NamedTuple):
     launchpad_app_id: abi.Field[abi.Uint64]
 
 startups = BoxMapping(abi.Uint64, Startup)
+# Startup kutusundaki sabit alanların byte offset'leri:
+# owner(32) + 5 string offset'i (2'şer) + token_asset_id(8) + created_at(8)
+# + is_verified(1) + total_score(8) + launchpad_app_id(8)
+STARTUP_VERIFIED_OFFSET = Int(58)
+STARTUP_SCORE_OFFSET = Int(59)
+STARTUP_LAUNCHPAD_OFFSET = Int(67)
 
 # ---- Lifecycle ----
 @app.create
@@ -148,6 +154,12 @@ def update_startup(
 ):
     st = Startup()
     owner = abi.Address()
+    github_repo = abi.String()
+    token_asset_id = abi.Uint64()
+    created_at = abi.Uint64()
+    is_verified = abi.Bool()
+    total_score = abi.Uint64()
+    launchpad_app_id = abi.Uint64()
     key_u64 = abi.Uint64()
 
     return Seq(
@@ -155,13 +167,29 @@ def update_startup(
         Assert(startups[key_u64.encode()].exists(), comment=ERR_NOT_FOUND),
 
         st.decode(startups[key_u64.encode()].get()),
-        st.get_field(owner, 0),
+        st.owner.store_into(owner),
         Assert(Txn.sender() == owner.get(), comment=ERR_NOT_AUTHORIZED),
 
-        st.set_field(name, 1),
-        st.set_field(description, 2),
-        st.set_field(website, 4),
-        st.set_field(twitter, 5),
+        # String alanları değiştiği için tuple değişmeyen alanlarla yeniden kurulur
+        st.github_repo.store_into(github_repo),
+        st.token_asset_id.store_into(token_asset_id),
+        st.created_at.store_into(created_at),
+        st.is_verified.store_into(is_verified),
+        st.total_score.store_into(total_score),
+        st.launchpad_app_id.store_into(launchpad_app_id),
+        st.set(
+            owner,
+            name,
+            description,
+            github_repo,
+            website,
+            twitter,
+            token_asset_id,
+            created_at,
+            is_verified,
+            total_score,
+            launchpad_app_id,
+        ),
 
         startups[key_u64.encode()].set(st),
         output.set(True),
@@ -170,31 +198,26 @@ def update_startup(
 # ---- Platform Owner İşlemleri ----
 @app.external
 def verify_startup(startup_id: abi.Uint64, verified_status: abi.Bool, *, output: abi.Bool):
-    st = Startup()
     key_u64 = abi.Uint64()
     return Seq(
         Assert(Txn.sender() == app.state.owner.get(), comment=ERR_NOT_AUTHORIZED),
         key_u64.set(startup_id.get()),
         Assert(startups[key_u64.encode()].exists(), comment=ERR_NOT_FOUND),
 
-        st.decode(startups[key_u64.encode()].get()),
-        st.set_field(verified_status, 8),
-        startups[key_u64.encode()].set(st),
+        # Sabit alan yerinde yazılır (tek bool ABI'de tek byte'tır)
+        BoxReplace(key_u64.encode(), STARTUP_VERIFIED_OFFSET, verified_status.encode()),
         output.set(True),
     )
 
 @app.external
 def update_score(startup_id: abi.Uint64, new_score: abi.Uint64, *, output: abi.Bool):
-    st = Startup()
     key_u64 = abi.Uint64()
     return Seq(
         Assert(Txn.sender() == app.state.owner.get(), comment=ERR_NOT_AUTHORIZED),
         key_u64.set(startup_id.get()),
         Assert(startups[key_u64.encode()].exists(), comment=ERR_NOT_FOUND),
 
-        st.decode(startups[key_u64.encode()].get()),
-        st.set_field(new_score, 9),
-        startups[key_u64.encode()].set(st),
+        BoxReplace(key_u64.encode(), STARTUP_SCORE_OFFSET, new_score.encode()),
         output.set(True),
     )
 
@@ -221,9 +244,9 @@ def create_launchpad(
         Assert(startups[key_u64.encode()].exists(), comment=ERR_NOT_FOUND),
 
         st.decode(startups[key_u64.encode()].get()),
-        st.get_field(owner, 0),
-        st.get_field(token_id, 6),
-        st.get_field(existing_launchpad_id, 10),
+        st.owner.store_into(owner),
+        st.token_asset_id.store_into(token_id),
+        st.launchpad_app_id.store_into(existing_launchpad_id),
 
         Assert(Txn.sender() == owner.get(), comment=ERR_NOT_AUTHORIZED),
         Assert(existing_launchpad_id.get() == Int(0), comment=ERR_LAUNCHPAD_EXISTS),
@@ -262,8 +285,7 @@ def create_launchpad(
         InnerTxnBuilder.Submit(),
 
         new_app_id_sv.store(InnerTxn.created_application_id()),
-        st.set_field(abi.Uint64(new_app_id_sv.load()), 10),
-        startups[key_u64.encode()].set(st),
+        BoxReplace(key_u64.encode(), STARTUP_LAUNCHPAD_OFFSET, Itob(new_app_id_sv.load())),
         output.set(new_app_id_sv.load()),
     )
 
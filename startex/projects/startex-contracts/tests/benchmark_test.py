@@ -0,0 +1,39 @@
+import pytest
+
+from smart_contracts.scripts.benchmark import METRICS, compare
+
+
+def result(status: str = "ok", **metrics: int) -> dict:
+    return {"status": status, **dict.fromkeys(METRICS, 100), **metrics}
+
+
+def test_results_within_the_threshold_pass() -> None:
+    baseline = {"buy_tokens": result()}
+    assert compare({"buy_tokens": result(opcode_cost=105, fees=90)}, baseline, threshold_pct=5.0) == []
+
+
+def test_a_metric_over_the_threshold_is_a_regression() -> None:
+    problems = compare({"buy_tokens": result(opcode_cost=106)}, {"buy_tokens": result()}, threshold_pct=5.0)
+    assert problems == ["buy_tokens: opcode_cost 100 -> 106 (limit 105)"]
+
+
+def test_improvements_are_not_regressions(caplog: pytest.LogCaptureFixture) -> None:
+    with caplog.at_level("INFO"):
+        assert compare({"buy_tokens": result(box_bytes_read=50)}, {"buy_tokens": result()}, threshold_pct=5.0) == []
+    assert "consider --update-baseline" in caplog.text
+
+
+def test_a_scenario_without_a_baseline_fails() -> None:
+    assert compare({"new_scenario": result()}, {}, threshold_pct=5.0) == [
+        "new_scenario: no baseline entry (record it with --update-baseline)"
+    ]
+
+
+def test_a_changed_outcome_fails() -> None:
+    problems = compare({"finalize": result("expected error")}, {"finalize": result("ok")}, threshold_pct=5.0)
+    assert problems == ["finalize: outcome changed from 'ok' to 'expected error'"]
+
+
+def test_an_unexpected_failure_fails_even_when_recorded() -> None:
+    failed = result("failed: logic eval error")
+    assert compare({"join": failed}, {"join": failed}, threshold_pct=5.0) == ["join: failed: logic eval error"]
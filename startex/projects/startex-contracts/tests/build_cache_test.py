@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._tooling import build_cache
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    package = tmp_path / "smart_contracts"
+    (package / "shared").mkdir(parents=True)
+    (package / "app").mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "shared" / "__init__.py").write_text("")
+    (package / "shared" / "constants.py").write_text("FEE = 1000\n")
+    (package / "app" / "helpers.py").write_text("from smart_contracts.shared.constants import FEE\n")
+    (package / "app" / "app.py").write_text("import algosdk\nfrom . import helpers\n")
+    (package / "unrelated.py").write_text("X = 1\n")
+    return tmp_path
+
+
+def key(project: Path, flags: list[str] | None = None) -> str:
+    return build_cache.cache_key(project / "smart_contracts" / "app" / "app.py", [project], flags or [])
+
+
+def test_source_closure_follows_local_imports_transitively(project: Path) -> None:
+    # algosdk is third-party; `from . import helpers` and the absolute import are followed
+    package = project / "smart_contracts"
+    closure = build_cache.source_closure(package / "app" / "app.py", [project])
+    assert closure == sorted(
+        path.resolve()
+        for path in (
+            package / "app" / "app.py",
+            package / "app" / "helpers.py",
+            package / "shared" / "constants.py",
+        )
+    )
+
+
+def test_cache_key_is_stable(project: Path) -> None:
+    assert key(project) == key(project)
+
+
+def test_cache_key_changes_with_an_imported_module(project: Path) -> None:
+    before = key(project)
+    (project / "smart_contracts" / "shared" / "constants.py").write_text("FEE = 2000\n")
+    assert key(project) != before
+
+
+def test_cache_key_ignores_files_the_contract_does_not_import(project: Path) -> None:
+    before = key(project)
+    (project / "smart_contracts" / "unrelated.py").write_text("X = 2\n")
+    assert key(project) == before
+
+
+def test_cache_key_changes_with_flags_and_tool_versions(project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    before = key(project)
+    assert key(project, ["-O2"]) != before
+    monkeypatch.setattr(build_cache, "tool_versions", lambda: {"puyapy": "0.0.0"})
+    assert key(project) != before
+
+
+def test_unparsable_files_are_still_hashed(project: Path) -> None:
+    before = key(project)
+    (project / "smart_contracts" / "app" / "helpers.py").write_text("def broken(:\n")
+    assert key(project) != before
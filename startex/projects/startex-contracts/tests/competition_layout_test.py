@@ -0,0 +1,29 @@
+import struct
+
+import pytest
+
+from smart_contracts.scripts.competition_layout import (
+    STATUS_ACTIVE,
+    STATUS_CANCELLED,
+    STATUS_ENDED,
+    STATUS_UPCOMING,
+    effective_status,
+)
+
+
+def competition_box(start_time: int, end_time: int, status: int) -> bytes:
+    # name/description heads, then the uint64 fields the layout reads
+    return bytes(4) + struct.pack(">QQQ", start_time, end_time, status) + bytes(24)
+
+
+@pytest.mark.parametrize(
+    "now, expected",
+    [(0, STATUS_UPCOMING), (99, STATUS_UPCOMING), (100, STATUS_ACTIVE), (199, STATUS_ACTIVE), (200, STATUS_ENDED)],
+)
+def test_effective_status_follows_the_clock(now: int, expected: int) -> None:
+    assert effective_status(competition_box(100, 200, STATUS_UPCOMING), now) == expected
+
+
+@pytest.mark.parametrize("stored", [STATUS_ENDED, STATUS_CANCELLED])
+def test_effective_status_keeps_final_statuses(stored: int) -> None:
+    assert effective_status(competition_box(100, 200, stored), 150) == stored
@@ -0,0 +1,121 @@
+import dataclasses
+import json
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._tooling import deploy
+
+
+@dataclasses.dataclass
+class Contract:
+    name: str
+    deploy: Callable[[], None] | None
+    depends_on: tuple[str, ...] = ()
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.deployed: list[str] = []
+        self.failing: set[str] = set()
+        self._lock = threading.Lock()
+
+    def contract(self, name: str, *depends_on: str) -> Contract:
+        def run() -> None:
+            if name in self.failing:
+                raise RuntimeError(f"{name} rejected")
+            with self._lock:
+                self.deployed.append(name)
+
+        return Contract(name, run, depends_on)
+
+
+@pytest.fixture(autouse=True)
+def localnet(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("ALGOD_SERVER", raising=False)
+    monkeypatch.delenv("ALGOD_PORT", raising=False)
+
+
+def write_programs(artifact_path: Path, name: str, approval: str = "pushint 1") -> None:
+    (artifact_path / name).mkdir(parents=True, exist_ok=True)
+    (artifact_path / name / f"{name}.approval.teal").write_text(f"#pragma version 10\n{approval}\n")
+    (artifact_path / name / f"{name}.clear.teal").write_text("#pragma version 10\npushint 1\n")
+
+
+@pytest.fixture
+def artifacts(tmp_path: Path) -> Path:
+    for name in ("startup_registry", "competition", "launchpad"):
+        write_programs(tmp_path, name)
+    return tmp_path
+
+
+def contracts(recorder: Recorder) -> list[Contract]:
+    return [
+        recorder.contract("competition", "startup_registry"),
+        recorder.contract("startup_registry"),
+        recorder.contract("launchpad"),
+    ]
+
+
+def test_first_deploy_runs_dependencies_first(artifacts: Path) -> None:
+    recorder = Recorder()
+    done = deploy.deploy_changed(contracts(recorder), artifacts)
+    assert sorted(done) == ["competition", "launchpad", "startup_registry"]
+    assert recorder.deployed.index("startup_registry") < recorder.deployed.index("competition")
+
+
+def test_unchanged_programs_are_skipped(artifacts: Path) -> None:
+    deploy.deploy_changed(contracts(Recorder()), artifacts)
+    recorder = Recorder()
+    assert deploy.deploy_changed(contracts(recorder), artifacts) == []
+    assert recorder.deployed == []
+
+
+def test_force_redeploys_everything(artifacts: Path) -> None:
+    deploy.deploy_changed(contracts(Recorder()), artifacts)
+    assert len(deploy.deploy_changed(contracts(Recorder()), artifacts, force=True)) == 3
+
+
+def test_a_changed_dependency_redeploys_its_dependents(artifacts: Path) -> None:
+    deploy.deploy_changed(contracts(Recorder()), artifacts)
+    write_programs(artifacts, "startup_registry", "pushint 2")
+    recorder = Recorder()
+    assert deploy.deploy_changed(contracts(recorder), artifacts) == ["startup_registry", "competition"]
+
+
+def test_a_filtered_deploy_records_the_same_hashes(artifacts: Path) -> None:
+    deploy.deploy_changed(contracts(Recorder()), artifacts)
+    manifest = json.loads((artifacts / deploy.MANIFEST_NAME).read_text())
+    recorder = Recorder()
+    # `deploy competition`: the registry is not part of the run
+    assert deploy.deploy_changed([recorder.contract("competition", "startup_registry")], artifacts) == []
+    assert deploy.deploy_changed(contracts(recorder), artifacts) == []
+    assert json.loads((artifacts / deploy.MANIFEST_NAME).read_text()) == manifest
+
+
+def test_the_manifest_records_dependency_hashes(artifacts: Path) -> None:
+    deploy.deploy_changed(contracts(Recorder()), artifacts)
+    section = json.loads((artifacts / deploy.MANIFEST_NAME).read_text())[deploy.network_name()]
+    registry = deploy.program_hashes(artifacts / "startup_registry")
+    assert section["startup_registry"] == registry
+    assert section["competition"]["depends_on"] == {"startup_registry": registry}
+
+
+def test_a_failed_dependency_blocks_its_dependents_until_the_next_run(artifacts: Path) -> None:
+    recorder = Recorder()
+    recorder.failing.add("startup_registry")
+    with pytest.raises(Exception, match="startup_registry"):
+        deploy.deploy_changed(contracts(recorder), artifacts)
+    assert recorder.deployed == ["launchpad"]
+
+    recorder = Recorder()
+    assert deploy.deploy_changed(contracts(recorder), artifacts) == ["startup_registry", "competition"]
+
+
+def test_missing_programs_fail_before_deploying(artifacts: Path) -> None:
+    recorder = Recorder()
+    with pytest.raises(Exception, match="compiled TEAL not found"):
+        deploy.deploy_changed([*contracts(recorder), recorder.contract("missing")], artifacts)
+    assert recorder.deployed == []
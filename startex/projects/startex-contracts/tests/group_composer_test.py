@@ -0,0 +1,123 @@
+import asyncio
+import copy
+import dataclasses
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from algosdk import account, transaction  # noqa: E402
+from algosdk.atomic_transaction_composer import AccountTransactionSigner, TransactionWithSigner  # noqa: E402
+
+from smart_contracts.scripts.group_composer import (  # noqa: E402
+    MAX_GROUP_SIZE,
+    Call,
+    GroupCallResult,
+    GroupComposer,
+    pack,
+)
+
+PRIVATE_KEY, SENDER = account.generate_account()
+PARAMS = transaction.SuggestedParams(
+    fee=1_000, first=1, last=1_000, gh="SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=", flat_fee=True, min_fee=1_000
+)
+
+
+@dataclasses.dataclass
+class StubClient:
+    app_id: int
+    default_sender: str = SENDER
+    composed: list = dataclasses.field(default_factory=list)
+
+    async def compose(self, atc, method: str, args: list, **kwargs) -> None:
+        self.composed.append((method, args, kwargs))
+
+
+def payment() -> TransactionWithSigner:
+    txn = transaction.PaymentTxn(SENDER, PARAMS, SENDER, 1_000, note=b"buy")
+    return TransactionWithSigner(txn, AccountTransactionSigner(PRIVATE_KEY))
+
+
+def addresses(count: int) -> list[str]:
+    return [account.generate_account()[1] for _ in range(count)]
+
+
+def test_pack_fills_groups_up_to_16_transactions() -> None:
+    client = StubClient(1)
+    calls = [Call(client, "buy", [payment()]) for _ in range(9)]
+    groups = pack(calls)
+    # each call is an app call plus its payment argument
+    assert [len(slots) for slots in groups] == [MAX_GROUP_SIZE // 2, 1]
+
+
+def test_pack_records_input_positions_of_repeated_calls() -> None:
+    call = Call(StubClient(1), "get")
+    groups = pack([call, call, Call(StubClient(2), "get")])
+    assert [slot.index for slot in groups[0]] == [0, 1, 2]
+    assert groups[0][0].call is groups[0][1].call
+
+
+def test_pack_spills_references_onto_other_calls_of_the_group() -> None:
+    client = StubClient(1)
+    accounts = addresses(5)
+    (slots,) = pack([Call(client, "noop"), Call(client, "pay_out", accounts=accounts)])
+    assert slots[1].accounts == accounts[:4]
+    assert slots[0].accounts == accounts[4:]
+
+
+def test_pack_shares_references_already_available_in_the_group() -> None:
+    registry, competition = StubClient(1), StubClient(2)
+    (slots,) = pack(
+        [
+            Call(registry, "noop"),
+            # the registry app, the sender and app 3 (once) are available without new references
+            Call(competition, "join", accounts=[SENDER], foreign_apps=[1, 3, 3]),
+        ]
+    )
+    assert slots[1].accounts == [] and slots[1].apps == [3]
+
+
+def test_pack_spills_boxes_only_onto_calls_to_the_same_app() -> None:
+    registry, competition = StubClient(1), StubClient(2)
+    boxes = [bytes([i]) for i in range(10)]
+    groups = pack([Call(competition, "noop"), Call(registry, "noop"), Call(registry, "read", boxes=boxes)])
+    (slots,) = groups
+    assert slots[2].boxes == boxes[:8]
+    assert slots[1].boxes == boxes[8:]
+    assert slots[0].boxes == []
+
+
+def test_pack_rejects_a_call_that_fits_no_group() -> None:
+    with pytest.raises(ValueError, match="exceeds the limits"):
+        pack([Call(StubClient(1), "read", boxes=[bytes([i]) for i in range(9)])])
+
+
+class StubSession:
+    async def suggested_params(self) -> transaction.SuggestedParams:
+        return copy.copy(PARAMS)
+
+
+def test_compose_pools_fees_without_touching_the_callers_transactions() -> None:
+    client = StubClient(1)
+    argument = payment()
+    slots = pack([Call(client, "noop", inner_txns=2), Call(client, "buy", [argument])])[0]
+    asyncio.run(GroupComposer(StubSession())._compose(slots))
+
+    (_, _, first), (_, buy_args, second) = client.composed
+    # noop + 2 inner + buy + its payment
+    assert first["sp"].fee == 5 * PARAMS.min_fee
+    assert second["sp"].fee == 0
+    assert buy_args[0].txn.fee == 0
+    assert argument.txn.fee == PARAMS.fee
+
+
+def test_execute_returns_one_result_per_input_position(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def run_group(self, group_index: int, slots: list, simulate: bool) -> list[GroupCallResult]:
+        return [GroupCallResult(slot.call, group_index, return_value=slot.index) for slot in slots]
+
+    monkeypatch.setattr(GroupComposer, "_run_group", run_group)
+    call = Call(StubClient(1), "get")
+    calls = [call, Call(StubClient(2), "buy", [payment()] * 15), call]
+    results = asyncio.run(GroupComposer(StubSession()).execute(calls))
+    assert [result.return_value for result in results] == [0, 1, 2]
+    assert [result.group_index for result in results] == [0, 1, 0]
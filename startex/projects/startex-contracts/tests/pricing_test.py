@@ -0,0 +1,69 @@
+import pytest
+
+from smart_contracts.launchpad.pricing import (
+    BUYER_PAGE_MBR,
+    BUYER_RECORD_MBR,
+    PriceCurve,
+    PriceTier,
+    box_mbr,
+    quote,
+    tier_discount_bps,
+    unit_price,
+)
+
+CURVE = PriceCurve(start_price=100, floor_price=50, tiers=(PriceTier(1_000, 500), PriceTier(5_000, 1_000)))
+
+
+def test_quote_fixed_price_refunds_the_remainder() -> None:
+    result = quote(1_000_005, now=0, token_price=10, sale_start_time=0, sale_end_time=100)
+    assert (result.unit_price, result.effective_price) == (10, 10)
+    assert (result.tokens, result.cost, result.refund) == (100_000, 1_000_000, 5)
+
+
+def test_quote_deducts_the_box_mbr_first() -> None:
+    mbr = box_mbr(is_new_buyer=True, buyer_count=0)
+    result = quote(1_000_000 + mbr, now=0, token_price=10, sale_start_time=0, sale_end_time=100, mbr=mbr)
+    assert (result.tokens, result.refund) == (100_000, 0)
+
+
+def test_quote_applies_the_tier_reached_at_the_undiscounted_price() -> None:
+    # 200_000 / 100 = 2_000 base tokens -> 5% tier -> 95 per token
+    result = quote(200_000, now=0, token_price=0, sale_start_time=0, sale_end_time=100, curve=CURVE)
+    assert result.effective_price == 95
+    assert (result.tokens, result.cost, result.refund) == (2_105, 199_975, 25)
+
+
+@pytest.mark.parametrize("amount, mbr", [(BUYER_RECORD_MBR, BUYER_RECORD_MBR), (0, 0), (100, 200)])
+def test_quote_rejects_a_payment_that_does_not_cover_the_mbr(amount: int, mbr: int) -> None:
+    with pytest.raises(ValueError, match="MBR"):
+        quote(amount, now=0, token_price=10, sale_start_time=0, sale_end_time=100, mbr=mbr)
+
+
+def test_quote_rejects_a_zero_price() -> None:
+    with pytest.raises(ValueError, match="Sale parameters not set"):
+        quote(1_000, now=0, token_price=0, sale_start_time=0, sale_end_time=100)
+
+
+@pytest.mark.parametrize("now, expected", [(-5, 100), (0, 100), (50, 75), (99, 51), (100, 50), (500, 50)])
+def test_unit_price_decays_linearly_to_the_floor(now: int, expected: int) -> None:
+    assert unit_price(now, token_price=1, sale_start_time=0, sale_end_time=100, curve=CURVE) == expected
+
+
+@pytest.mark.parametrize("base_tokens, expected", [(0, 0), (999, 0), (1_000, 500), (4_999, 500), (5_000, 1_000)])
+def test_tier_discount_bps_takes_the_highest_tier_reached(base_tokens: int, expected: int) -> None:
+    assert tier_discount_bps(base_tokens, CURVE) == expected
+
+
+def test_tier_discount_bps_without_a_curve() -> None:
+    assert tier_discount_bps(10**9, None) == 0
+
+
+def test_box_mbr_charges_a_page_every_buyers_per_page() -> None:
+    assert box_mbr(is_new_buyer=False, buyer_count=0) == 0
+    assert box_mbr(is_new_buyer=True, buyer_count=0) == BUYER_RECORD_MBR + BUYER_PAGE_MBR
+    assert box_mbr(is_new_buyer=True, buyer_count=1) == BUYER_RECORD_MBR
+
+
+def test_price_curve_round_trips_through_the_global_layout() -> None:
+    assert PriceCurve.decode(CURVE.encode()) == CURVE
+    assert PriceCurve.decode(b"") is None
@@ -0,0 +1,82 @@
+import dataclasses
+
+import pytest
+from algosdk import abi, account
+
+from smart_contracts.scripts.struct_codecs import StructCodec, struct_codec
+
+RECORD_TYPE = "(address,string,uint64,bool,bool,string)"
+SCORE_TYPE = "(uint64,uint64,bool)"
+OWNER = account.generate_account()[1]
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Record:
+    owner: str
+    name: str
+    score: int
+    verified: bool
+    claimed: bool
+    website: str
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class Score:
+    competition_id: int
+    score: int
+    claimed: bool
+
+
+RECORD = Record(owner=OWNER, name="startex", score=42, verified=True, claimed=False, website="https://ex.com")
+
+
+def test_encode_matches_the_abi_encoding() -> None:
+    expected = abi.ABIType.from_string(RECORD_TYPE).encode(list(dataclasses.astuple(RECORD)))
+    assert StructCodec(Record, RECORD_TYPE).encode(RECORD) == expected
+
+
+def test_decode_reads_the_abi_encoding() -> None:
+    encoded = abi.ABIType.from_string(RECORD_TYPE).encode(list(dataclasses.astuple(RECORD)))
+    assert StructCodec(Record, RECORD_TYPE).decode(encoded) == RECORD
+
+
+def test_slotted_struct_round_trips() -> None:
+    codec = StructCodec(Score, SCORE_TYPE)
+    value = Score(competition_id=7, score=2**64 - 1, claimed=True)
+    assert codec.static_size == 17
+    assert codec.decode(codec.encode(value)) == value
+
+
+def test_from_tuple_builds_kw_only_structs() -> None:
+    assert struct_codec(Record, RECORD_TYPE).from_tuple(dataclasses.astuple(RECORD)) == RECORD
+    assert struct_codec(Score, SCORE_TYPE).from_tuple((1, 2, False)) == Score(competition_id=1, score=2, claimed=False)
+
+
+@pytest.mark.parametrize(
+    "cls, abi_type, values",
+    [
+        (Record, RECORD_TYPE, [RECORD, dataclasses.replace(RECORD, name="", website="x" * 300, verified=False)]),
+        (Score, SCORE_TYPE, [Score(competition_id=i, score=i * 10, claimed=i % 2 == 0) for i in range(3)]),
+        (Score, SCORE_TYPE, []),
+    ],
+)
+def test_decode_array_reads_dynamic_array_returns(cls: type, abi_type: str, values: list) -> None:
+    encoded = abi.ABIType.from_string(f"{abi_type}[]").encode([list(dataclasses.astuple(v)) for v in values])
+    assert struct_codec(cls, abi_type).decode_array(encoded) == values
+
+
+def test_decode_many() -> None:
+    codec = struct_codec(Score, SCORE_TYPE)
+    values = [Score(competition_id=1, score=5, claimed=False), Score(competition_id=2, score=0, claimed=True)]
+    assert codec.decode_many(codec.encode(value) for value in values) == values
+
+
+def test_struct_codec_is_cached() -> None:
+    assert struct_codec(Score, SCORE_TYPE) is struct_codec(Score, SCORE_TYPE)
+
+
+def test_rejects_a_type_that_does_not_match_the_fields() -> None:
+    with pytest.raises(ValueError, match="does not match"):
+        StructCodec(Score, "(uint64,uint64)")
+    with pytest.raises(ValueError, match="Unsupported ABI type"):
+        StructCodec(Score, "(uint64,uint32,bool)")
@@ -0,0 +1,126 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._tooling import teal_analysis
+
+APPROVAL = """#pragma version 10
+txn NumAppArgs
+bz bare
+txna ApplicationArgs 0
+pushbytes 0x01020304 // method "store(byte[])void"
+==
+bnz route_store
+txna ApplicationArgs 0
+pushbytes 0x05060708 // method "sum(uint64)uint64"
+==
+bnz route_sum
+err
+bare:
+pushint 1
+return
+route_store:
+txna ApplicationArgs 1
+sha256
+pop
+pushbytes "b" // box prefix
+txna ApplicationArgs 1
+concat
+txna ApplicationArgs 1
+box_put
+itxn_begin
+itxn_submit
+pushint 1
+return
+route_sum:
+pushint 0
+loop:
+dup
+bz done
+pushint 1
+-
+b loop
+done:
+return
+"""
+
+
+@pytest.fixture
+def program() -> teal_analysis.Program:
+    return teal_analysis.Program(APPROVAL)
+
+
+def test_parse_skips_pragmas_and_records_labels() -> None:
+    instructions, labels = teal_analysis.parse(APPROVAL)
+    assert instructions[0].op == "txn" and instructions[0].line == 2
+    assert instructions[labels["route_store"]].op == "txna"
+    assert instructions[3].comment == 'method "store(byte[])void"'
+
+
+def test_comments_inside_strings_are_kept() -> None:
+    (instruction,), _ = teal_analysis.parse('pushbytes "a // b" // note')
+    assert instruction.args == ['"a // b"'] and instruction.comment == "note"
+
+
+@pytest.mark.parametrize(
+    "line, size",
+    [
+        ("pushint 1", 2),
+        ("pushint 300", 3),
+        ("pushbytes 0x01020304", 6),
+        ('pushbytes "ab"', 4),
+        ("intcblock 0 1 1000", 6),
+        ("bnz somewhere", 3),
+        ("intc_0", 1),
+        ("txna ApplicationArgs 0", 3),
+    ],
+)
+def test_encoded_size(line: str, size: int) -> None:
+    (instruction,), _ = teal_analysis.parse(line)
+    assert teal_analysis.encoded_size(instruction) == size
+
+
+def test_routes_map_method_comments_to_their_branch(program: teal_analysis.Program) -> None:
+    assert program.routes() == {"store(byte[])void": ("route_store", 5), "sum(uint64)uint64": ("route_sum", 9)}
+
+
+def test_opcode_costs() -> None:
+    assert teal_analysis.opcode_cost("sha256") == 35
+    assert teal_analysis.opcode_cost("pushint") == 1
+
+
+def test_analyze_program_reports_cost_boxes_and_inner_txns() -> None:
+    report = teal_analysis.analyze_program(APPROVAL, None, clear_size=3)
+    store = report["routes"]["store(byte[])void"]
+    # 6 dispatch ops, then 12 ops of which sha256 costs 35
+    assert store["worst_case_cost"] == 6 + 11 + 35
+    assert store["cost_bounded"]
+    assert not store["exceeds_single_call_budget"]
+    assert store["box_ops"] == [{"op": "box_put", "key": "0x62*", "line": 24}]
+    assert store["inner_txn_sites"] == [26]
+    assert report["size_source"] == "estimate"
+
+
+def test_loops_are_counted_once_and_flagged() -> None:
+    report = teal_analysis.analyze_program(APPROVAL, None, clear_size=3)
+    assert not report["routes"]["sum(uint64)uint64"]["cost_bounded"]
+
+
+@pytest.mark.parametrize("size, extra_pages, fits", [(2_000, 0, True), (2_048, 1, True), (8_000, 3, True), (9_000, 4, False)])
+def test_extra_pages_follow_the_bytecode_size(size: int, extra_pages: int, fits: bool) -> None:
+    report = teal_analysis.analyze_program(APPROVAL, bytes(size), clear_size=48)
+    assert (report["size_source"], report["extra_pages"], report["fits"]) == ("bytecode", extra_pages, fits)
+
+
+def test_update_manifest_writes_reports_and_rejects_oversized_programs(tmp_path: Path) -> None:
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "app.approval.teal").write_text(APPROVAL)
+    (tmp_path / "app" / "app.clear.teal").write_text("#pragma version 10\npushint 1\n")
+    manifest = teal_analysis.update_manifest(tmp_path, ["app", "not_built"])
+    assert list(manifest) == ["app"]
+    assert json.loads((tmp_path / teal_analysis.MANIFEST_NAME).read_text()) == manifest
+
+    (tmp_path / "app" / "app.approval.bin").write_bytes(bytes(9_000))
+    with pytest.raises(Exception, match="exceed"):
+        teal_analysis.update_manifest(tmp_path, ["app"])